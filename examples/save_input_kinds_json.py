@@ -52,8 +52,8 @@ def save_input_kinds_to_json():
             data = {
                 "metadata": {
                     "timestamp": datetime.now().isoformat(),
-                    "obs_version": obs.get_version().get('obsVersion', 'Unknown'),
-                    "websocket_version": obs.get_version().get('obsWebSocketVersion', 'Unknown'),
+                    "obs_version": obs.get_version_cached().get('obsVersion', 'Unknown'),
+                    "websocket_version": obs.get_version_cached().get('obsWebSocketVersion', 'Unknown'),
                     "total_kinds": len(input_kinds_versioned),
                     "current_inputs_count": len(current_inputs)
                 },
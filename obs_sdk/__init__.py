@@ -18,7 +18,7 @@ OBS SDK - 模块化的 OBS 控制库
 """
 
 # 导入核心组件
-from .core import OBSClient, OBSConfig, OBSManager
+from .core import OBSClient, OBSConfig, OBSManager, OBSClientPool
 from .core.exceptions import *
 
 # 导入各个功能模块
@@ -30,6 +30,9 @@ from .managers import (
     VirtualCameraManager,
     SceneItemManager,
     SourceManager,
+    SourceSpec,
+    AsyncStreamingManager,
+    BroadcastStreamingManager,
 )
 
 __version__ = "1.0.0"
@@ -40,6 +43,7 @@ __all__ = [
     "OBSClient",
     "OBSConfig", 
     "OBSManager",
+    "OBSClientPool",
     
     # 功能管理器
     "RecordingManager",
@@ -49,6 +53,9 @@ __all__ = [
     "VirtualCameraManager",
     "SceneItemManager",
     "SourceManager",
+    "SourceSpec",
+    "AsyncStreamingManager",
+    "BroadcastStreamingManager",
     
     # 异常类
     "OBSError",
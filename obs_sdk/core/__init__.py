@@ -8,11 +8,13 @@ from .client import OBSClient
 from .config import OBSConfig
 from .exceptions import *
 from .manager import OBSManager
+from .pool import OBSClientPool
 
 __all__ = [
     'OBSClient',
     'OBSConfig',
     'OBSManager',
+    'OBSClientPool',
     'OBSError',
     'OBSConnectionError',
     'OBSAuthenticationError',
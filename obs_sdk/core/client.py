@@ -4,12 +4,18 @@ OBS WebSocket 客户端
 负责与 OBS 的底层通信，提供连接管理和基础请求功能。
 """
 
+import asyncio
+import dataclasses
+import functools
+import json
 import logging
-from typing import Optional, Any, Callable, Dict, List
-from threading import Lock
+import time
+from typing import Optional, Any, Callable, Dict, List, Tuple
+from threading import Event, Lock
 
 try:
-    from obswebsocket import obsws, requests, events
+    from obswebsocket import obsws, requests
+    from obswebsocket.exceptions import MessageTimeout
 except ImportError:
     raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
 
@@ -20,6 +26,24 @@ from .exceptions import OBSConnectionError, OBSAuthenticationError, OBSRequestEr
 logger = logging.getLogger(__name__)
 
 
+def _extract(response, key: Optional[str] = None, default: Any = None) -> Any:
+    """
+    从 OBS 响应中读取数据
+    
+    Args:
+        response: OBS 响应对象
+        key: 要读取的字段，None 表示返回整个响应数据
+        default: 响应无数据或字段不存在时的默认值
+        
+    Returns:
+        字段值或整个响应数据
+    """
+    data = getattr(response, 'datain', None)
+    if data is None:
+        return default
+    return data if key is None else data.get(key, default)
+
+
 class OBSClient:
     """
     OBS WebSocket 客户端
@@ -27,6 +51,61 @@ class OBSClient:
     负责管理与 OBS 的连接和基础通信功能。
     """
     
+    # 共享客户端注册表，{完整配置 -> client}
+    _shared: Dict[tuple, 'OBSClient'] = {}
+    _shared_lock = Lock()
+    
+    @classmethod
+    def get_shared(cls, config: Optional[OBSConfig] = None) -> 'OBSClient':
+        """
+        获取指定 OBS 实例的共享客户端
+        
+        配置完全相同（包括密码、超时和重试次数）时复用同一个客户端，
+        多个管理器可以共用同一条连接。每次获取都会增加引用计数，
+        用完后调用 release() 归还，最后一个持有者归还时才断开连接。
+        
+        Args:
+            config: 配置对象，如果为 None 则使用默认配置
+            
+        Returns:
+            OBSClient: 共享的客户端实例
+        """
+        config = config or OBSConfig()
+        key = dataclasses.astuple(config)
+        with cls._shared_lock:
+            client = cls._shared.get(key)
+            if client is None:
+                client = cls(config)
+                client._shared_key = key
+                cls._shared[key] = client
+            client._shared_refs += 1
+            return client
+    
+    @property
+    def is_shared(self) -> bool:
+        """是否为 get_shared() 返回的共享客户端"""
+        return self._shared_key is not None
+    
+    def release(self):
+        """
+        归还 get_shared() 获取的共享客户端
+        
+        引用计数减一，归零时断开连接并从注册表中移除。
+        非共享客户端直接断开连接。
+        """
+        if self._shared_key is None:
+            self.disconnect()
+            return
+        
+        with self._shared_lock:
+            self._shared_refs -= 1
+            if self._shared_refs > 0:
+                return
+            if self._shared.get(self._shared_key) is self:
+                del self._shared[self._shared_key]
+            self._shared_key = None
+        self.disconnect()
+    
     def __init__(self, config: Optional[OBSConfig] = None):
         """
         初始化客户端
@@ -36,9 +115,23 @@ class OBSClient:
         """
         self.config = config or OBSConfig()
         self._ws: Optional[obsws] = None
+        
+        # 共享客户端的注册表键和引用计数（非共享客户端为 None 和 0）
+        self._shared_key: Optional[tuple] = None
+        self._shared_refs = 0
         self._connected = False
         self._connection_lock = Lock()
         
+        # 请求 ID 的分配和发送必须串行（obs-websocket-py 分配 ID 时没有加锁）
+        self._send_lock = Lock()
+        
+        # 连接代数，每次建立（或重建）连接时加一，供依赖事件维护状态的管理器判断是否需要重新同步
+        self._generation = 0
+        
+        # 版本信息缓存及其对应的连接代数
+        self._version_cache: Optional[Dict[str, Any]] = None
+        self._version_generation: Optional[int] = None
+        
         # 事件回调
         self._event_callbacks: Dict[str, List[Callable]] = {}
         self._global_callbacks: List[Callable] = []
@@ -66,7 +159,10 @@ class OBSClient:
                     legacy=False
                 )
                 self._ws.connect()
+                # 事件统一经由分发器转发，连接前注册的回调也能收到事件
+                self._ws.register(self._event_dispatcher)
                 self._connected = True
+                self._generation += 1
                 self.logger.info(f"已连接到 OBS ({self.config.host}:{self.config.port})")
                 return True
                 
@@ -81,7 +177,11 @@ class OBSClient:
                     raise OBSConnectionError(error_msg)
     
     def disconnect(self):
-        """断开与 OBS 的连接"""
+        """
+        断开与 OBS 的连接
+        
+        会关闭所有持有者共用的连接；共享客户端应使用 release() 归还。
+        """
         with self._connection_lock:
             if not self._connected or not self._ws:
                 return
@@ -97,13 +197,129 @@ class OBSClient:
                 self._ws = None
     
     def is_connected(self) -> bool:
-        """检查是否已连接到 OBS"""
+        """
+        检查是否已连接到 OBS
+        
+        只读取本地记录的连接状态，不发送请求也不探测 socket，可以频繁调用。
+        连接意外断开时仍返回 True，由下一次请求前的 ensure_connected() 负责重连。
+        
+        Returns:
+            bool: 是否已调用 connect() 且尚未断开
+        """
         return self._connected and self._ws is not None
     
+    @property
+    def generation(self) -> int:
+        """连接代数，断线重连后会变化（期间可能丢失事件）"""
+        return self._generation
+    
+    def _link_alive(self) -> bool:
+        """检查底层 websocket 是否仍然可用"""
+        ws = getattr(self._ws, 'ws', None)
+        return bool(ws is not None and ws.connected)
+    
+    def ensure_connected(self):
+        """
+        确保连接可用
+        
+        连接意外断开时复用原有的 obsws 实例重连（已注册的事件回调保持不变），
+        失败时按指数退避重试。
+        
+        Raises:
+            OBSConnectionError: 未调用 connect() 或重连失败
+        """
+        if not self.is_connected():
+            raise OBSConnectionError("未连接到 OBS，请先调用 connect()")
+        
+        if self._link_alive():
+            return
+        
+        with self._connection_lock:
+            if self._link_alive():
+                return
+            
+            last_exception = None
+            for attempt in range(self.config.max_retries + 1):
+                try:
+                    self._ws.reconnect()
+                    self._generation += 1
+                    self.logger.info(f"已重新连接到 OBS ({self.config.host}:{self.config.port})")
+                    return
+                except Exception as e:
+                    last_exception = e
+                    self.logger.warning(f"重新连接失败 (尝试 {attempt + 1}/{self.config.max_retries + 1}): {e}")
+                    if attempt < self.config.max_retries:
+                        time.sleep(0.5 * (2 ** attempt))  # 指数退避
+            
+            self._connected = False
+            raise OBSConnectionError(f"重新连接 OBS 失败: {last_exception}")
+    
+    def _send(self, ws: obsws, request) -> Tuple[str, Event]:
+        """
+        发送一个请求帧（op 6）
+        
+        obs-websocket-py 的 obsws.call() 用未加锁的 self.id += 1 分配请求 ID，
+        多个线程同时调用可能拿到相同的 ID，导致一方超时或收到另一方的响应。
+        这里在锁内分配 ID、登记等待事件并发送，响应仍由其接收线程按 requestId 分发。
+        
+        Args:
+            ws: obsws 实例
+            request: OBS 请求对象
+            
+        Returns:
+            Tuple[str, Event]: 请求 ID 和收到响应时置位的事件
+        """
+        answered = Event()
+        with self._send_lock:
+            message_id = str(ws.id)
+            ws.id += 1
+            ws.events[message_id] = answered
+            payload = {
+                "op": 6,
+                "d": {
+                    "requestId": message_id,
+                    "requestType": request.name,
+                    "requestData": request.data()
+                }
+            }
+            try:
+                ws.ws.send(json.dumps(payload))
+            except Exception:
+                ws.events.pop(message_id, None)
+                raise
+        return message_id, answered
+    
+    def _receive(self, ws: obsws, request, message_id: str, answered: Event) -> Any:
+        """
+        等待 _send() 发出的请求的响应，并填入请求对象
+        
+        Args:
+            ws: obsws 实例
+            request: OBS 请求对象
+            message_id: 请求 ID
+            answered: 收到响应时置位的事件
+            
+        Returns:
+            填入响应数据的请求对象（与 obsws.call() 的返回值相同）
+            
+        Raises:
+            MessageTimeout: 超时未收到响应
+        """
+        answered.wait(ws.timeout)
+        ws.events.pop(message_id, None)
+        answer = ws.answers.pop(message_id, None)
+        if answer is None:
+            raise MessageTimeout(f"No answer for message {message_id}")
+        request.input(answer.get('responseData', {}), answer['requestStatus']['result'])
+        return request
+    
     def call(self, request, max_retries: int = 3) -> Any:
         """
         执行 OBS 请求
         
+        可以在多个线程中同时调用：请求 ID 的分配和发送在锁内完成，
+        等待响应时不持有锁。
+        
         Args:
             request: OBS 请求对象
             max_retries: 最大重试次数
@@ -115,22 +331,23 @@ class OBSClient:
             OBSConnectionError: 未连接到 OBS
             OBSRequestError: 请求失败
         """
-        if not self.is_connected():
-            raise OBSConnectionError("未连接到 OBS，请先调用 connect()")
+        self.ensure_connected()
         
         last_exception = None
         
         for attempt in range(max_retries + 1):
             try:
-                response = self._ws.call(request)
-                return response
+                if attempt:
+                    self.ensure_connected()
+                ws = self._ws
+                message_id, answered = self._send(ws, request)
+                return self._receive(ws, request, message_id, answered)
                 
             except Exception as e:
                 last_exception = e
                 self.logger.warning(f"请求失败 (尝试 {attempt + 1}/{max_retries + 1}): {e}")
                 
                 if attempt < max_retries:
-                    import time
                     time.sleep(0.5 * (2 ** attempt))  # 指数退避
                 else:
                     break
@@ -140,6 +357,78 @@ class OBSClient:
         self.logger.error(error_msg)
         raise OBSRequestError(error_msg)
     
+    def call_batch(self, request_list: List[Any], halt_on_failure: bool = False) -> List[Any]:
+        """
+        批量执行 OBS 请求
+        
+        obs-websocket-py 不支持 RequestBatch，这里先把所有请求帧依次发出，
+        再按请求 ID 收集响应，整批只需等待一次往返而不是每个请求一次。
+        OBS 可能并行处理同一批中的请求，只应把互不依赖的请求放在一起。
+        
+        Args:
+            request_list: OBS 请求对象列表
+            halt_on_failure: 某个请求失败（响应 status 为 False）后是否停止执行后续请求；
+                为 True 时请求逐个发送，失败后不再发送后续请求
+            
+        Returns:
+            List: 与已执行请求一一对应的响应对象
+            
+        Raises:
+            OBSConnectionError: 未连接到 OBS
+            OBSRequestError: 请求失败
+        """
+        self.ensure_connected()
+        
+        if halt_on_failure:
+            responses = []
+            for request in request_list:
+                response = self.call(request)
+                responses.append(response)
+                if getattr(response, 'status', True) is False:
+                    break
+            return responses
+        
+        # 批量请求不重试：部分请求可能已经执行，重发会重复创建或删除
+        ws = self._ws
+        pending = []
+        try:
+            for request in request_list:
+                message_id, answered = self._send(ws, request)
+                pending.append((request, message_id, answered))
+            return [self._receive(ws, request, message_id, answered)
+                    for request, message_id, answered in pending]
+        except Exception as e:
+            error_msg = f"批量请求失败: {str(e)}"
+            self.logger.error(error_msg)
+            raise OBSRequestError(error_msg)
+        finally:
+            for _, message_id, _ in pending:
+                ws.events.pop(message_id, None)
+                ws.answers.pop(message_id, None)
+    
+    async def call_async(self, request, max_retries: int = 3) -> Any:
+        """
+        异步执行 OBS 请求
+        
+        在线程池中执行 call()，使多个互不依赖的请求可以通过
+        asyncio.gather 并发等待。
+        
+        Args:
+            request: OBS 请求对象
+            max_retries: 最大重试次数
+            
+        Returns:
+            OBS 响应对象
+            
+        Raises:
+            OBSConnectionError: 未连接到 OBS
+            OBSRequestError: 请求失败
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.call, request, max_retries)
+        )
+    
     def register_event_callback(self, callback: Callable, event_type: Optional[str] = None):
         """
         注册事件回调
@@ -154,18 +443,6 @@ class OBSClient:
             if event_type not in self._event_callbacks:
                 self._event_callbacks[event_type] = []
             self._event_callbacks[event_type].append(callback)
-        
-        # 注册到底层 WebSocket 客户端
-        if self._ws:
-            try:
-                if event_type:
-                    event_class = getattr(events, event_type, None)
-                    if event_class:
-                        self._ws.register(self._event_dispatcher, event_class)
-                else:
-                    self._ws.register(self._event_dispatcher)
-            except Exception as e:
-                self.logger.warning(f"注册事件回调失败: {e}")
     
     def unregister_event_callback(self, callback: Callable, event_type: Optional[str] = None):
         """
@@ -212,16 +489,31 @@ class OBSClient:
     def get_version(self) -> Dict[str, Any]:
         """获取 OBS 版本信息"""
         response = self.call(requests.GetVersion())
-        if hasattr(response, 'datain'):
-            return response.datain
-        return {}
+        return _extract(response, default={})
+    
+    def get_version_cached(self) -> Dict[str, Any]:
+        """
+        获取 OBS 版本信息（带缓存）
+        
+        同一连接期间版本不会变化，只在首次调用或断线重连后请求 OBS
+        （重连期间 OBS 可能已重启或升级）。
+        
+        Returns:
+            Dict[str, Any]: 版本信息
+        """
+        if self._version_cache is None or self._version_generation != self._generation:
+            version = self.get_version()
+            if not version:
+                # 获取失败时不缓存，下次调用重试
+                return version
+            self._version_generation = self._generation
+            self._version_cache = version
+        return dict(self._version_cache)
     
     def get_stats(self) -> Dict[str, Any]:
         """获取 OBS 统计信息"""
         response = self.call(requests.GetStats())
-        if hasattr(response, 'datain'):
-            return response.datain
-        return {}
+        return _extract(response, default={})
     
     def __enter__(self):
         """上下文管理器入口"""
@@ -29,16 +29,20 @@ class OBSManager:
     是使用 OBS SDK 的推荐方式。
     """
     
-    def __init__(self, config: Optional[OBSConfig] = None, auto_connect: bool = True):
+    def __init__(self, config: Optional[OBSConfig] = None, auto_connect: bool = True,
+                 client: Optional[OBSClient] = None):
         """
         初始化 OBS 管理器
         
         Args:
             config: 配置对象，如果为 None 则使用默认配置
             auto_connect: 是否自动连接到 OBS
+            client: 复用已有的客户端（如 OBSClient.get_shared()），为 None 时新建。
+                传入的客户端由调用方负责断开或归还，disconnect() 不会关闭它的连接
         """
-        self.config = config or OBSConfig()
-        self.client = OBSClient(self.config)
+        self.config = config or (client.config if client else OBSConfig())
+        self.client = client or OBSClient(self.config)
+        self._owns_client = client is None
         
         # 初始化各个功能管理器
         self.recording = RecordingManager(self.client)
@@ -64,7 +68,14 @@ class OBSManager:
         return self.client.connect()
     
     def disconnect(self):
-        """断开与 OBS 的连接"""
+        """
+        断开与 OBS 的连接
+        
+        客户端由调用方传入时不做任何操作，以免关闭其他持有者仍在使用的连接。
+        """
+        if not self._owns_client:
+            self.logger.debug("客户端由调用方管理，不断开连接")
+            return
         self.client.disconnect()
     
     def is_connected(self) -> bool:
@@ -75,6 +86,10 @@ class OBSManager:
         """获取 OBS 版本信息"""
         return self.client.get_version()
     
+    def get_version_cached(self) -> Dict[str, Any]:
+        """获取 OBS 版本信息（带缓存，断线重连后重新请求）"""
+        return self.client.get_version_cached()
+    
     def get_stats(self) -> Dict[str, Any]:
         """获取 OBS 统计信息"""
         return self.client.get_stats()
@@ -92,7 +107,7 @@ class OBSManager:
         try:
             return {
                 "connected": True,
-                "version": self.get_version(),
+                "version": self.get_version_cached(),
                 "recording": self.recording.get_info(),
                 "streaming": self.streaming.get_info(),
                 "scenes": self.scenes.get_info(),
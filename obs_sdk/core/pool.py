@@ -0,0 +1,92 @@
+"""
+OBS 客户端池
+
+管理多个 OBS 实例的连接，便于将同一操作并发下发到所有实例。
+
+使用示例:
+    pool = OBSClientPool([OBSConfig(host="192.168.1.10"), OBSConfig(host="192.168.1.11")])
+    pool.connect()
+    results = asyncio.run(pool.streaming.start())
+"""
+
+import dataclasses
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Iterator
+
+from .client import OBSClient
+from .config import OBSConfig
+from ..managers.async_streaming import BroadcastStreamingManager
+
+
+class OBSClientPool:
+    """
+    OBS 客户端池
+    
+    每个实例使用 OBSClient.get_shared() 获取的共享客户端，配置相同的实例只保持一条连接。
+    """
+    
+    logger = logging.getLogger(f"{__name__}.OBSClientPool")
+    
+    def __init__(self, endpoints: List[OBSConfig]):
+        """
+        初始化客户端池
+        
+        Args:
+            endpoints: 各 OBS 实例的配置
+            
+        Raises:
+            ValueError: endpoints 中有重复的配置
+        """
+        keys = [dataclasses.astuple(endpoint) for endpoint in endpoints]
+        if len(set(keys)) != len(keys):
+            # 相同配置会得到同一个共享客户端，广播操作会在同一实例上执行多次（toggle 互相抵消）
+            raise ValueError("endpoints 中有重复的 OBS 实例配置")
+        
+        self.clients = [OBSClient.get_shared(endpoint) for endpoint in endpoints]
+        self.streaming = BroadcastStreamingManager(self.clients)
+    
+    def _connect_one(self, client: OBSClient) -> bool:
+        """连接单个实例，失败时记录日志并返回 False"""
+        try:
+            return client.connect()
+        except Exception:
+            # 具体错误已由客户端记录
+            self.logger.warning("OBS 实例不可用: %s:%s", client.config.host, client.config.port)
+            return False
+    
+    def connect(self) -> List[bool]:
+        """
+        并发连接所有实例
+        
+        Returns:
+            List[bool]: 各实例是否连接成功
+        """
+        if not self.clients:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
+            return list(executor.map(self._connect_one, self.clients))
+    
+    def disconnect(self):
+        """归还所有共享客户端（其他持有者仍在使用的连接保持不变）"""
+        self.streaming.close()
+        for client in self.clients:
+            client.release()
+        self.clients = []
+        self.streaming = BroadcastStreamingManager(self.clients)
+    
+    def __len__(self) -> int:
+        return len(self.clients)
+    
+    def __iter__(self) -> Iterator[OBSClient]:
+        return iter(self.clients)
+    
+    def __enter__(self):
+        """上下文管理器入口"""
+        self.connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """上下文管理器出口"""
+        self.disconnect()
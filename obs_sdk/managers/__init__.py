@@ -10,7 +10,8 @@ from .recording import RecordingManager
 from .streaming import StreamingManager
 from .virtual_camera import VirtualCameraManager
 from .scene_items import SceneItemManager
-from .sources import SourceManager
+from .sources import SourceManager, SourceSpec
+from .async_streaming import AsyncStreamingManager, BroadcastStreamingManager
 
 __all__ = [
     'InputManager',
@@ -20,4 +21,7 @@ __all__ = [
     'VirtualCameraManager',
     'SceneItemManager',
     'SourceManager',
+    'SourceSpec',
+    'AsyncStreamingManager',
+    'BroadcastStreamingManager',
 ]
@@ -0,0 +1,299 @@
+"""
+异步推流管理器
+
+提供基于 asyncio 的推流管理接口，便于与其他请求并发执行，
+以及同时控制多个 OBS 实例的多实例推流管理器。
+
+使用示例:
+    streaming = AsyncStreamingManager(client)
+    stream_status, vcam_status = await asyncio.gather(
+        streaming.get_status(),
+        client.call_async(requests.GetVirtualCamStatus()),
+    )
+"""
+
+import asyncio
+import functools
+import logging
+from typing import Dict, Any, List, Optional
+
+try:
+    from obswebsocket import requests
+except ImportError:
+    raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
+
+from ..core.client import OBSClient, _extract
+from .streaming import StreamingManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncStreamingManager:
+    """
+    异步推流管理器
+    
+    与 StreamingManager 接口一致，所有方法均为协程。
+    已有 StreamingManager（如 OBSManager.streaming）时应传入复用，
+    否则会另建一个并在客户端上多注册一个事件回调，不再使用时需调用 close()。
+    """
+    
+    logger = logging.getLogger(f"{__name__}.AsyncStreamingManager")
+    
+    def __init__(self, client: OBSClient, manager: Optional[StreamingManager] = None):
+        """
+        初始化异步推流管理器
+        
+        Args:
+            client: OBS 客户端实例
+            manager: 已有的同步推流管理器，为 None 时自动创建
+        """
+        self.client = client
+        self._owns_manager = manager is None
+        self.manager = manager or StreamingManager(client)
+    
+    def close(self):
+        """释放自动创建的同步推流管理器（传入的管理器由调用方管理，不做处理）"""
+        if self._owns_manager:
+            self.manager.close()
+    
+    async def _run(self, func, *args):
+        """在线程池中执行同步管理器的方法"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+    
+    async def get_status(self) -> Dict[str, Any]:
+        """
+        获取推流状态
+        
+        Returns:
+            Dict: 推流状态信息
+        """
+        response = await self.client.call_async(requests.GetStreamStatus())
+        return _extract(response, default={})
+    
+    async def is_streaming(self) -> bool:
+        """
+        检查是否正在推流
+        
+        Returns:
+            bool: True 表示正在推流
+        """
+        status = await self.get_status()
+        return status.get('outputActive', False)
+    
+    async def is_reconnecting(self) -> bool:
+        """
+        检查是否正在重连
+        
+        Returns:
+            bool: True 表示正在重连
+        """
+        status = await self.get_status()
+        return status.get('outputReconnecting', False)
+    
+    async def get_duration(self) -> int:
+        """
+        获取推流时长（毫秒）
+        
+        Returns:
+            int: 推流时长
+        """
+        status = await self.get_status()
+        return status.get('outputDuration', 0)
+    
+    async def get_timecode(self) -> str:
+        """
+        获取推流时间码
+        
+        Returns:
+            str: 时间码字符串
+        """
+        status = await self.get_status()
+        return status.get('outputTimecode', '00:00:00')
+    
+    async def get_bytes_sent(self) -> int:
+        """
+        获取已发送字节数
+        
+        Returns:
+            int: 已发送字节数
+        """
+        status = await self.get_status()
+        return status.get('outputBytes', 0)
+    
+    async def get_dropped_frames(self) -> int:
+        """
+        获取丢帧数
+        
+        Returns:
+            int: 丢帧数
+        """
+        status = await self.get_status()
+        return status.get('outputSkippedFrames', 0)
+    
+    async def get_total_frames(self) -> int:
+        """
+        获取总帧数
+        
+        Returns:
+            int: 总帧数
+        """
+        status = await self.get_status()
+        return status.get('outputTotalFrames', 0)
+    
+    async def get_congestion(self) -> float:
+        """
+        获取网络拥塞度
+        
+        Returns:
+            float: 拥塞度 (0.0-1.0)
+        """
+        status = await self.get_status()
+        return status.get('outputCongestion', 0.0)
+    
+    async def start(self) -> bool:
+        """
+        开始推流
+        
+        Returns:
+            bool: 操作是否成功
+        
+        Raises:
+            OBSOutputRunningError: 推流已在进行中
+        """
+        return await self._run(self.manager.start)
+    
+    async def stop(self) -> bool:
+        """
+        停止推流
+        
+        Returns:
+            bool: 操作是否成功
+        
+        Raises:
+            OBSOutputNotRunningError: 推流未在进行中
+        """
+        return await self._run(self.manager.stop)
+    
+    async def toggle(self) -> bool:
+        """
+        切换推流状态
+        
+        Returns:
+            bool: 切换后的推流状态（True=推流中，False=已停止）
+        """
+        return await self._run(self.manager.toggle)
+    
+    async def get_info(self) -> Dict[str, Any]:
+        """
+        获取推流信息摘要
+        
+        Returns:
+            Dict: 推流信息
+        """
+        return await self._run(self.manager.get_info)
+
+
+class BroadcastStreamingManager:
+    """
+    多实例推流管理器
+    
+    将同一推流操作并发下发到多个 OBS 实例，耗时取决于最慢的实例而非总和。
+    各方法返回与客户端一一对应的结果列表，单个实例的异常作为结果返回，不影响其他实例。
+    """
+    
+    logger = logging.getLogger(f"{__name__}.BroadcastStreamingManager")
+    
+    def __init__(self, clients: List[OBSClient], managers: Optional[List[StreamingManager]] = None):
+        """
+        初始化多实例推流管理器
+        
+        Args:
+            clients: OBS 客户端列表
+            managers: 与 clients 一一对应的已有同步推流管理器，为 None 时为每个客户端各创建一个
+            
+        Raises:
+            ValueError: clients 中有重复的客户端，或 managers 与 clients 数量不一致
+        """
+        self.clients = list(clients)
+        if len({id(client) for client in self.clients}) != len(self.clients):
+            # 同一客户端出现多次时，开始/停止会重复下发，切换会互相抵消
+            raise ValueError("clients 中有重复的客户端")
+        if managers is None:
+            managers = [None] * len(self.clients)
+        elif len(managers) != len(self.clients):
+            raise ValueError("managers 与 clients 数量不一致")
+        self._managers = [AsyncStreamingManager(client, manager)
+                          for client, manager in zip(self.clients, managers)]
+    
+    def close(self):
+        """释放自动创建的同步推流管理器"""
+        for manager in self._managers:
+            manager.close()
+    
+    async def _broadcast(self, method: str) -> List[Any]:
+        """在所有实例上并发执行指定方法"""
+        results = await asyncio.gather(
+            *(getattr(manager, method)() for manager in self._managers),
+            return_exceptions=True
+        )
+        for client, result in zip(self.clients, results):
+            if isinstance(result, Exception):
+                self.logger.error("%s:%s 执行 %s 失败: %s",
+                                  client.config.host, client.config.port, method, result)
+        return results
+    
+    async def get_status(self) -> List[Any]:
+        """
+        获取所有实例的推流状态
+        
+        Returns:
+            List: 各实例的推流状态信息
+        """
+        return await self._broadcast('get_status')
+    
+    async def is_streaming(self) -> List[Any]:
+        """
+        检查各实例是否正在推流
+        
+        Returns:
+            List: 各实例的推流状态
+        """
+        return await self._broadcast('is_streaming')
+    
+    async def start(self) -> List[Any]:
+        """
+        在所有实例上开始推流
+        
+        Returns:
+            List: 各实例的操作结果
+        """
+        return await self._broadcast('start')
+    
+    async def stop(self) -> List[Any]:
+        """
+        在所有实例上停止推流
+        
+        Returns:
+            List: 各实例的操作结果
+        """
+        return await self._broadcast('stop')
+    
+    async def toggle(self) -> List[Any]:
+        """
+        切换所有实例的推流状态
+        
+        Returns:
+            List: 各实例切换后的推流状态
+        """
+        return await self._broadcast('toggle')
+    
+    async def get_info(self) -> List[Any]:
+        """
+        获取所有实例的推流信息摘要
+        
+        Returns:
+            List: 各实例的推流信息
+        """
+        return await self._broadcast('get_info')
@@ -5,14 +5,14 @@
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 try:
     from obswebsocket import requests
 except ImportError:
     raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
 
-from ..core.client import OBSClient
+from ..core.client import OBSClient, _extract
 from ..core.exceptions import OBSResourceNotFoundError
 from ..types.input_types import InputTypeHelper, to_chinese, to_english
 
@@ -37,6 +37,10 @@ class InputManager:
         self.client = client
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
+        # 输入类型列表缓存（按 unversioned 区分）及其对应的连接代数
+        self._kinds_cache: Dict[bool, List[str]] = {}
+        self._kinds_generation: Optional[int] = None
+
     def get_all(self) -> List[Dict[str, Any]]:
         """
         获取所有输入源(所有的输入源，不管是哪一个场景)
@@ -45,9 +49,7 @@ class InputManager:
             List[Dict]: 输入源列表
         """
         response = self.client.call(requests.GetInputList())
-        if hasattr(response, 'datain'):
-            return response.datain.get('inputs', [])
-        return []
+        return _extract(response, 'inputs', [])
 
     def get_names(self) -> List[str]:
         """
@@ -71,13 +73,35 @@ class InputManager:
         """
         try:
             response = self.client.call(requests.GetInputKindList(unversioned=unversioned))
-            if hasattr(response, 'datain'):
-                return response.datain.get('inputKinds', [])
-            return []
+            return _extract(response, 'inputKinds', [])
         except Exception as e:
             self.logger.error(f"获取输入类型列表失败: {e}")
             return []
 
+    def get_input_kinds_cached(self, unversioned: bool = False) -> List[str]:
+        """
+        获取所有可用的输入类型（带缓存）
+
+        输入类型由 OBS 插件决定，运行期间不会变化，因此只在首次调用或断线重连后请求 OBS。
+
+        Args:
+            unversioned: True=返回未版本化的类型，False=返回带版本后缀的类型（如果可用）
+
+        Returns:
+            List[str]: 输入类型列表
+        """
+        if self._kinds_generation != self.client.generation:
+            self._kinds_generation = self.client.generation
+            self._kinds_cache.clear()
+
+        if unversioned not in self._kinds_cache:
+            kinds = self.get_input_kinds(unversioned)
+            if not kinds:
+                # 获取失败时不缓存，下次调用重试
+                return kinds
+            self._kinds_cache[unversioned] = kinds
+        return list(self._kinds_cache[unversioned])
+
     def get_special_inputs(self) -> Dict[str, str]:
         """
         获取特殊输入源名称
@@ -88,28 +112,33 @@ class InputManager:
         """
         try:
             response = self.client.call(requests.GetSpecialInputs())
-            if hasattr(response, 'datain'):
+            data = _extract(response)
+            if data is not None:
                 return {
-                    'desktop1': response.datain.get('desktop1') or '',
-                    'desktop2': response.datain.get('desktop2') or '',
-                    'mic1': response.datain.get('mic1') or '',
-                    'mic2': response.datain.get('mic2') or '',
-                    'mic3': response.datain.get('mic3') or '',
-                    'mic4': response.datain.get('mic4') or ''
+                    'desktop1': data.get('desktop1') or '',
+                    'desktop2': data.get('desktop2') or '',
+                    'mic1': data.get('mic1') or '',
+                    'mic2': data.get('mic2') or '',
+                    'mic3': data.get('mic3') or '',
+                    'mic4': data.get('mic4') or ''
                 }
             return {}
         except Exception as e:
             self.logger.error(f"获取特殊输入源失败: {e}")
             return {}
 
-    def get_audio_inputs(self) -> List[str]:
+    def get_audio_inputs(self, inputs: Optional[List[Dict[str, Any]]] = None) -> List[str]:
         """
         获取音频输入源名称
 
+        Args:
+            inputs: 已获取的输入源列表（get_all() 的返回值），为 None 时请求 OBS
+
         Returns:
             List[str]: 音频输入源名称列表
         """
-        inputs = self.get_all()
+        if inputs is None:
+            inputs = self.get_all()
         audio_inputs = []
 
         for inp in inputs:
@@ -154,9 +183,7 @@ class InputManager:
                 raise OBSResourceNotFoundError("输入源", input_name, self.get_names())
 
             response = self.client.call(requests.GetInputMute(inputName=input_name))
-            if hasattr(response, 'datain'):
-                return response.datain.get('inputMuted', False)
-            return False
+            return _extract(response, 'inputMuted', False)
 
         except OBSResourceNotFoundError:
             raise
@@ -237,9 +264,7 @@ class InputManager:
 
             response = self.client.call(requests.ToggleInputMute(inputName=input_name))
 
-            muted = False
-            if hasattr(response, 'datain'):
-                muted = response.datain.get('inputMuted', False)
+            muted = _extract(response, 'inputMuted', False)
 
             status = "静音" if muted else "取消静音"
             self.logger.info(f"输入源 '{input_name}' 已{status}")
@@ -269,9 +294,7 @@ class InputManager:
                 raise OBSResourceNotFoundError("输入源", input_name, self.get_names())
 
             response = self.client.call(requests.GetInputSettings(inputName=input_name))
-            if hasattr(response, 'datain'):
-                return response.datain.get('inputSettings', {})
-            return {}
+            return _extract(response, 'inputSettings', {})
 
         except OBSResourceNotFoundError:
             raise
@@ -317,17 +340,26 @@ class InputManager:
         Returns:
             Dict: 输入源信息
         """
+        # 输入源列表只请求一次，名称和音频输入源都从中推导
         all_inputs = self.get_all()
-        audio_inputs = self.get_audio_inputs()
+        audio_inputs = self.get_audio_inputs(all_inputs)
         input_kinds = self.get_input_kinds()
 
-        # 获取音频输入的静音状态
+        # 批量获取音频输入的静音状态（输入源刚从列表中取得，无需逐个检查是否存在）
         audio_status = {}
+        try:
+            responses = self.client.call_batch(
+                [requests.GetInputMute(inputName=name) for name in audio_inputs]
+            )
+            for input_name, response in zip(audio_inputs, responses):
+                if getattr(response, 'status', True) is False:
+                    audio_status[input_name] = None
+                else:
+                    audio_status[input_name] = _extract(response, 'inputMuted', False)
+        except Exception as e:
+            self.logger.error(f"获取音频输入源静音状态失败: {e}")
         for input_name in audio_inputs:
-            try:
-                audio_status[input_name] = self.is_muted(input_name)
-            except:
-                audio_status[input_name] = None
+            audio_status.setdefault(input_name, None)
 
         # 统计输入源类型分布
         input_type_count = {}
@@ -339,7 +371,7 @@ class InputManager:
             "total_inputs": len(all_inputs),
             "audio_inputs": len(audio_inputs),
             "available_input_kinds": len(input_kinds),
-            "input_names": self.get_names(),
+            "input_names": [inp.get('inputName', '') for inp in all_inputs],
             "audio_input_names": audio_inputs,
             "audio_mute_status": audio_status,
             "available_kinds": input_kinds,
@@ -470,7 +502,7 @@ class InputManager:
                 raise ValueError(f"输入名称 '{input_name}' 已存在")
 
             # 3. 验证输入类型是否支持
-            available_kinds = self.get_input_kinds()
+            available_kinds = self.get_input_kinds_cached()
             if available_kinds and input_kind not in available_kinds:
                 self.logger.warning(f"输入类型 '{input_kind}' 可能不受支持")
 
@@ -493,8 +525,8 @@ class InputManager:
             response = self.client.call(requests.CreateInput(**request_params))
 
             # 6. 处理响应
-            if hasattr(response, 'datain') and response.datain:
-                result = response.datain
+            result = _extract(response)
+            if result:
                 input_uuid = result.get('inputUuid', '')
                 scene_item_id = result.get('sceneItemId', 0)
 
@@ -532,6 +564,69 @@ class InputManager:
                 self.logger.error(f"创建输入失败: {e}")
                 raise
 
+    def create_inputs_batch(self, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        批量创建输入并添加到场景
+
+        所有 CreateInput 请求一次性发出后再统一收集响应，不逐个做重名和类型检查，
+        单个输入失败不影响其他输入。
+
+        Args:
+            inputs: 输入描述列表，每项的键与 create_input 的参数相同
+                    （input_name、input_kind、scene_name 或 scene_uuid、
+                    input_settings、scene_item_enabled）
+
+        Returns:
+            List[Dict[str, Any]]: 与 inputs 一一对应的结果，结构与 create_input 的返回值相同
+
+        Raises:
+            ValueError: 当参数验证失败时
+        """
+        request_list = []
+        for item in inputs:
+            input_name = item.get('input_name')
+            input_kind = item.get('input_kind')
+            scene_name = item.get('scene_name')
+            scene_uuid = item.get('scene_uuid')
+
+            if not input_name or not input_name.strip():
+                raise ValueError("输入名称不能为空")
+            if not input_kind or not input_kind.strip():
+                raise ValueError("输入类型不能为空")
+            if (scene_name is None) == (scene_uuid is None):
+                raise ValueError("必须提供 scene_name 或 scene_uuid，但不能同时提供两者")
+
+            request_params = {
+                "inputName": input_name.strip(),
+                "inputKind": input_kind.strip(),
+                "sceneItemEnabled": item.get('scene_item_enabled', True)
+            }
+            if scene_name is not None:
+                request_params["sceneName"] = scene_name.strip()
+            if scene_uuid is not None:
+                request_params["sceneUuid"] = scene_uuid.strip()
+            if item.get('input_settings') is not None:
+                request_params["inputSettings"] = item['input_settings']
+
+            request_list.append(requests.CreateInput(**request_params))
+
+        responses = self.client.call_batch(request_list)
+
+        results = []
+        for item, response in zip(inputs, responses):
+            result = _extract(response) if getattr(response, 'status', True) else None
+            results.append({
+                'input_uuid': result.get('inputUuid', '') if result else '',
+                'scene_item_id': result.get('sceneItemId', 0) if result else 0,
+                'input_name': item['input_name'],
+                'input_kind': item['input_kind'],
+                'success': bool(result)
+            })
+
+        created = sum(1 for result in results if result['success'])
+        self.logger.info(f"批量创建输入完成: {created}/{len(inputs)} 成功")
+        return results
+
     def get_input_types_with_chinese(self) -> Dict[str, str]:
         """
         获取输入类型及其中文名称映射
@@ -539,7 +634,7 @@ class InputManager:
         Returns:
             Dict[str, str]: 英文类型 -> 中文名称的映射
         """
-        return InputTypeHelper.get_all_mappings()
+        return dict(InputTypeHelper.get_all_mappings())
 
     def get_chinese_name(self, input_kind: str) -> str:
         """
@@ -617,6 +712,27 @@ class InputManager:
                 self.logger.error(f"删除输入源失败: {e}")
                 raise
 
+    def remove_inputs_batch(self, input_names: List[str]) -> List[bool]:
+        """
+        批量删除输入源
+
+        所有 RemoveInput 请求一次性发出后再统一收集响应，单个输入源失败不影响其他输入源。
+
+        Args:
+            input_names: 要删除的输入源名称列表
+
+        Returns:
+            List[bool]: 与 input_names 一一对应的删除结果
+        """
+        responses = self.client.call_batch(
+            [requests.RemoveInput(inputName=name.strip()) for name in input_names]
+        )
+        results = [getattr(response, 'status', True) is not False for response in responses]
+
+        removed = sum(results)
+        self.logger.info(f"批量删除输入源完成: {removed}/{len(input_names)} 成功")
+        return results
+
     def rename_input(self, new_input_name: str, input_name: str = None, input_uuid: str = None) -> bool:
         """
         重命名输入源
@@ -702,8 +818,9 @@ class InputManager:
             response = self.client.call(requests.GetInputDefaultSettings(inputKind=input_kind.strip()))
 
             # 处理响应
-            if hasattr(response, 'datain') and response.datain:
-                default_settings = response.datain.get('defaultInputSettings', {})
+            data = _extract(response)
+            if data:
+                default_settings = data.get('defaultInputSettings', {})
                 self.logger.info(f"成功获取输入类型 '{input_kind}' 的默认设置")
                 return default_settings
             else:
@@ -723,3 +840,28 @@ class InputManager:
                 self.logger.error(f"获取输入类型默认设置失败: {e}")
                 raise
 
+    def get_input_default_settings_batch(self, input_kinds: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        批量获取多个输入类型的默认设置
+
+        所有 GetInputDefaultSettings 请求一次性发出后再统一收集响应，单个类型失败不影响其他类型。
+
+        Args:
+            input_kinds: 输入类型名称列表
+
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: 输入类型 -> 默认设置，获取失败的类型对应 None
+        """
+        responses = self.client.call_batch(
+            [requests.GetInputDefaultSettings(inputKind=kind.strip()) for kind in input_kinds]
+        )
+
+        results = {}
+        for kind, response in zip(input_kinds, responses):
+            if getattr(response, 'status', True) is False:
+                self.logger.warning(f"获取输入类型 '{kind}' 的默认设置失败")
+                results[kind] = None
+            else:
+                results[kind] = _extract(response, 'defaultInputSettings', {})
+
+        return results
@@ -15,7 +15,7 @@ try:
 except ImportError:
     raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
 
-from ..core.client import OBSClient
+from ..core.client import OBSClient, _extract
 from ..core.exceptions import OBSOutputRunningError, OBSOutputNotRunningError
 
 
@@ -48,9 +48,7 @@ class RecordingManager:
             Dict: 录制状态信息
         """
         response = self.client.call(requests.GetRecordStatus())
-        if hasattr(response, 'datain'):
-            return response.datain
-        return {}
+        return _extract(response, default={})
     
     def is_recording(self) -> bool:
         """
@@ -116,8 +114,8 @@ class RecordingManager:
             try:
                 # 获取当前的录制输出设置
                 response = self.client.call(requests.GetOutputSettings(outputName="adv_file_output"))
-                if hasattr(response, 'datain'):
-                    settings = response.datain.get('outputSettings', {})
+                settings = _extract(response, 'outputSettings')
+                if settings is not None:
                     # 更新路径设置
                     settings['path'] = abs_directory
                     # 设置新的输出设置
@@ -134,8 +132,8 @@ class RecordingManager:
             # 如果高级设置失败，尝试简单录制输出
             try:
                 response = self.client.call(requests.GetOutputSettings(outputName="simple_file_output"))
-                if hasattr(response, 'datain'):
-                    settings = response.datain.get('outputSettings', {})
+                settings = _extract(response, 'outputSettings')
+                if settings is not None:
                     settings['FilePath'] = abs_directory
                     self.client.call(requests.SetOutputSettings(
                         outputName="simple_file_output",
@@ -167,8 +165,8 @@ class RecordingManager:
             # 尝试从高级输出获取
             try:
                 response = self.client.call(requests.GetOutputSettings(outputName="adv_file_output"))
-                if hasattr(response, 'datain'):
-                    settings = response.datain.get('outputSettings', {})
+                settings = _extract(response, 'outputSettings')
+                if settings is not None:
                     path = settings.get('path')
                     if path:
                         return path
@@ -178,8 +176,8 @@ class RecordingManager:
             # 尝试从简单输出获取
             try:
                 response = self.client.call(requests.GetOutputSettings(outputName="simple_file_output"))
-                if hasattr(response, 'datain'):
-                    settings = response.datain.get('outputSettings', {})
+                settings = _extract(response, 'outputSettings')
+                if settings is not None:
                     path = settings.get('FilePath')
                     if path:
                         return path
@@ -295,9 +293,7 @@ class RecordingManager:
             
             response = self.client.call(requests.StopRecord())
             
-            output_path = ""
-            if hasattr(response, 'datain'):
-                output_path = response.datain.get('outputPath', '')
+            output_path = _extract(response, 'outputPath', '')
             
             self.logger.info(f"录制已停止，文件保存至: {output_path}")
             return output_path
@@ -318,9 +314,7 @@ class RecordingManager:
         try:
             response = self.client.call(requests.ToggleRecord())
             
-            active = False
-            if hasattr(response, 'datain'):
-                active = response.datain.get('outputActive', False)
+            active = _extract(response, 'outputActive', False)
             
             status = "开始" if active else "停止"
             self.logger.info(f"录制已{status}")
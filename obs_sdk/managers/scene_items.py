@@ -12,7 +12,7 @@ try:
 except ImportError:
     raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
 
-from ..core.client import OBSClient
+from ..core.client import OBSClient, _extract
 from ..core.exceptions import OBSResourceNotFoundError
 
 
@@ -48,9 +48,7 @@ class SceneItemManager:
         """
         try:
             response = self.client.call(requests.GetSceneItemList(sceneName=scene_name))
-            if hasattr(response, 'datain'):
-                return response.datain.get('sceneItems', [])
-            return []
+            return _extract(response, 'sceneItems', [])
         except Exception as e:
             self.logger.error(f"获取场景项列表失败: {e}")
             return []
@@ -71,9 +69,7 @@ class SceneItemManager:
                 sceneName=scene_name,
                 sourceName=source_name
             ))
-            if hasattr(response, 'datain'):
-                return response.datain.get('sceneItemId')
-            return None
+            return _extract(response, 'sceneItemId')
         except Exception as e:
             self.logger.error(f"获取场景项 ID 失败: {e}")
             return None
@@ -94,9 +90,7 @@ class SceneItemManager:
                 sceneName=scene_name,
                 sceneItemId=item_id
             ))
-            if hasattr(response, 'datain'):
-                return response.datain.get('sceneItemEnabled', False)
-            return False
+            return _extract(response, 'sceneItemEnabled', False)
         except Exception as e:
             self.logger.error(f"获取场景项启用状态失败: {e}")
             return False
@@ -241,9 +235,7 @@ class SceneItemManager:
                 sceneName=scene_name,
                 sceneItemId=item_id
             ))
-            if hasattr(response, 'datain'):
-                return response.datain.get('sceneItemTransform', {})
-            return {}
+            return _extract(response, 'sceneItemTransform', {})
         except Exception as e:
             self.logger.error(f"获取场景项变换信息失败: {e}")
             return {}
@@ -12,7 +12,7 @@ try:
 except ImportError:
     raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
 
-from ..core.client import OBSClient
+from ..core.client import OBSClient, _extract
 from ..core.exceptions import OBSResourceNotFoundError
 
 
@@ -26,6 +26,9 @@ class SceneManager:
     提供场景相关的所有功能，包括场景切换、Studio Mode 等。
     """
 
+    # 会改变场景列表的 OBS 事件，收到后使场景名称缓存失效
+    _INVALIDATING_EVENTS = ('SceneCreated', 'SceneRemoved', 'SceneNameChanged')
+
     def __init__(self, client: OBSClient):
         """
         初始化场景管理器
@@ -36,6 +39,17 @@ class SceneManager:
         self.client = client
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
+        # 场景名称缓存及其对应的连接代数
+        self._names_cache: Optional[List[str]] = None
+        self._names_generation: Optional[int] = None
+
+        for event_type in self._INVALIDATING_EVENTS:
+            self.client.register_event_callback(self._invalidate, event_type)
+
+    def _invalidate(self, *_):
+        """使场景名称缓存失效（也用作 OBS 事件回调）"""
+        self._names_cache = None
+
     def get_all(self) -> List[Dict[str, Any]]:
         """
         获取所有场景
@@ -44,9 +58,7 @@ class SceneManager:
             List[Dict]: 场景列表
         """
         response = self.client.call(requests.GetSceneList())
-        if hasattr(response, 'datain'):
-            return response.datain.get('scenes', [])
-        return []
+        return _extract(response, 'scenes', [])
 
     def get_names(self) -> List[str]:
         """
@@ -58,6 +70,21 @@ class SceneManager:
         scenes = self.get_all()
         return [scene.get('sceneName', '') for scene in scenes]
 
+    def get_names_cached(self) -> List[str]:
+        """
+        获取所有场景名称（带缓存）
+
+        首次调用时请求 OBS，之后直接返回缓存；通过本管理器创建、删除、重命名场景，
+        收到场景增删改事件或断线重连后，缓存自动失效。
+
+        Returns:
+            List[str]: 场景名称列表
+        """
+        if self._names_cache is None or self._names_generation != self.client.generation:
+            self._names_generation = self.client.generation
+            self._names_cache = self.get_names()
+        return list(self._names_cache)
+
     def get_group_list(self) -> List[str]:
         """
         获取所有组列表
@@ -70,9 +97,7 @@ class SceneManager:
         """
         try:
             response = self.client.call(requests.GetGroupList())
-            if hasattr(response, 'datain'):
-                return response.datain.get('groups', [])
-            return []
+            return _extract(response, 'groups', [])
         except Exception as e:
             self.logger.error(f"获取组列表失败: {e}")
             return []
@@ -85,9 +110,7 @@ class SceneManager:
             str: 当前节目场景名称
         """
         response = self.client.call(requests.GetCurrentProgramScene())
-        if hasattr(response, 'datain'):
-            return response.datain.get('currentProgramSceneName', '')
-        return ''
+        return _extract(response, 'currentProgramSceneName', '')
 
     def get_current_preview(self) -> str:
         """
@@ -98,8 +121,7 @@ class SceneManager:
         """
         try:
             response = self.client.call(requests.GetCurrentPreviewScene())
-            if hasattr(response, 'datain'):
-                return response.datain.get('currentPreviewSceneName', '')
+            return _extract(response, 'currentPreviewSceneName', '')
         except Exception as e:
             self.logger.debug(f"获取预览场景失败（可能未启用 Studio Mode）: {e}")
         return ''
@@ -171,8 +193,7 @@ class SceneManager:
         """
         try:
             response = self.client.call(requests.GetStudioModeEnabled())
-            if hasattr(response, 'datain'):
-                return response.datain.get('studioModeEnabled', False)
+            return _extract(response, 'studioModeEnabled', False)
         except Exception as e:
             self.logger.debug(f"获取 Studio Mode 状态失败: {e}")
         return False
@@ -255,6 +276,7 @@ class SceneManager:
                 return False
 
             self.client.call(requests.CreateScene(sceneName=scene_name))
+            self._invalidate()
             self.logger.info(f"已创建场景: {scene_name}")
             return True
 
@@ -282,6 +304,7 @@ class SceneManager:
                 raise OBSResourceNotFoundError("场景", scene_name, available_scenes)
 
             self.client.call(requests.RemoveScene(sceneName=scene_name))
+            self._invalidate()
             self.logger.info(f"已删除场景: {scene_name}")
             return True
 
@@ -291,6 +314,50 @@ class SceneManager:
             self.logger.error(f"删除场景失败: {e}")
             return False
 
+    def create_batch(self, scene_names: List[str]) -> List[bool]:
+        """
+        批量创建场景
+
+        所有 CreateScene 请求一次性发出后再统一收集响应，不逐个检查是否重名
+        （已存在的场景由 OBS 返回失败），单个场景失败不影响其他场景。
+
+        Args:
+            scene_names: 要创建的场景名称列表
+
+        Returns:
+            List[bool]: 与 scene_names 一一对应的创建结果
+        """
+        responses = self.client.call_batch(
+            [requests.CreateScene(sceneName=name) for name in scene_names]
+        )
+        self._invalidate()
+        results = [getattr(response, 'status', True) is not False for response in responses]
+
+        self.logger.info(f"批量创建场景完成: {sum(results)}/{len(scene_names)} 成功")
+        return results
+
+    def delete_batch(self, scene_names: List[str]) -> List[bool]:
+        """
+        批量删除场景
+
+        所有 RemoveScene 请求一次性发出后再统一收集响应，不逐个检查是否存在
+        （不存在的场景由 OBS 返回失败），单个场景失败不影响其他场景。
+
+        Args:
+            scene_names: 要删除的场景名称列表
+
+        Returns:
+            List[bool]: 与 scene_names 一一对应的删除结果
+        """
+        responses = self.client.call_batch(
+            [requests.RemoveScene(sceneName=name) for name in scene_names]
+        )
+        self._invalidate()
+        results = [getattr(response, 'status', True) is not False for response in responses]
+
+        self.logger.info(f"批量删除场景完成: {sum(results)}/{len(scene_names)} 成功")
+        return results
+
     def get_info(self) -> Dict[str, Any]:
         """
         获取场景信息摘要
@@ -332,6 +399,7 @@ class SceneManager:
                 return False
 
             self.client.call(requests.SetSceneName(sceneName=scene_name, newSceneName=new_scene_name))
+            self._invalidate()
             self.logger.info(f"已将场景 '{scene_name}' 重命名为 '{new_scene_name}'")
             return True
 
@@ -365,10 +433,11 @@ class SceneManager:
                 raise OBSResourceNotFoundError("场景", scene_name, available_scenes)
 
             response = self.client.call(requests.GetSceneSceneTransitionOverride(sceneName=scene_name))
-            if hasattr(response, 'datain'):
+            data = _extract(response)
+            if data is not None:
                 return {
-                    "transition_name": response.datain.get('transitionName'),
-                    "transition_duration": response.datain.get('transitionDuration')
+                    "transition_name": data.get('transitionName'),
+                    "transition_duration": data.get('transitionDuration')
                 }
             return {}
 
@@ -5,20 +5,97 @@
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Union
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Union
 
 try:
     from obswebsocket import requests
 except ImportError:
     raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
 
-from ..core.client import OBSClient
+from ..core.client import OBSClient, _extract
 from ..core.exceptions import OBSResourceNotFoundError
 
 
 logger = logging.getLogger(__name__)
 
 
+# 常用源的 inputKind
+_TEXT_KIND = 'text_gdiplus_v2'
+_IMAGE_KIND = 'image_source'
+_MEDIA_KIND = 'ffmpeg_source'
+_BROWSER_KIND = 'browser_source'
+_COLOR_KIND = 'color_source'
+
+# 各类源的默认设置模板（只读，创建时复制后再填入用户参数）
+_TEXT_TEMPLATE = MappingProxyType({
+    'font': MappingProxyType({'face': 'Arial', 'style': ''}),
+    'opacity': 100,
+    'outline': False,
+    'drop_shadow': False,
+})
+_IMAGE_TEMPLATE = MappingProxyType({'unload': False})
+_VIDEO_TEMPLATE = MappingProxyType({'restart_on_activate': True})
+_BROWSER_TEMPLATE = MappingProxyType({
+    'fps': 30,
+    'shutdown': False,
+    'restart_when_active': False,
+})
+
+
+def _text_settings(text: str, font_size: int, color: int) -> Dict[str, Any]:
+    """生成文本源设置"""
+    return {**_TEXT_TEMPLATE, 'text': text, 'color': color,
+            'font': {**_TEXT_TEMPLATE['font'], 'size': font_size}}
+
+
+def _image_settings(file_path: str) -> Dict[str, Any]:
+    """生成图像源设置"""
+    return {**_IMAGE_TEMPLATE, 'file': file_path}
+
+
+def _video_settings(file_path: str, loop: bool) -> Dict[str, Any]:
+    """生成视频源设置"""
+    return {**_VIDEO_TEMPLATE, 'local_file': file_path, 'looping': loop}
+
+
+def _color_settings(color: int, width: int, height: int) -> Dict[str, Any]:
+    """生成颜色源设置"""
+    return {'color': color, 'width': width, 'height': height}
+
+
+def _browser_settings(url: str, width: int, height: int) -> Dict[str, Any]:
+    """生成浏览器源设置"""
+    return {**_BROWSER_TEMPLATE, 'url': url, 'width': width, 'height': height}
+
+
+def _scene_item_transform(position: Optional[tuple], scale: Optional[tuple]) -> Dict[str, Any]:
+    """根据位置和缩放生成场景项变换，未指定时返回空字典"""
+    transform = {}
+    if position is not None:
+        transform['positionX'] = position[0]
+        transform['positionY'] = position[1]
+    if scale is not None:
+        transform['scaleX'] = scale[0]
+        transform['scaleY'] = scale[1]
+    return transform
+
+
+@dataclass
+class SourceSpec:
+    """批量创建源时的单个源描述"""
+    
+    name: str
+    kind: str                               # 源类型，可使用 SOURCE_TYPES 中的简称
+    settings: Optional[Dict[str, Any]] = None
+    scene: Optional[str] = None             # 为 None 时只创建源，不添加到场景
+    position: Optional[tuple] = None
+    scale: Optional[tuple] = None
+
+
 class SourceManager:
     """
     源管理器
@@ -26,28 +103,48 @@ class SourceManager:
     提供源相关的所有功能，包括创建、删除、配置各种类型的源。
     """
     
+    logger = logging.getLogger(f"{__name__}.SourceManager")
+    
     # 常用源类型定义
     SOURCE_TYPES = {
-        'text': 'text_gdiplus_v2',  # 文本源
-        'image': 'image_source',    # 图像源
-        'video': 'ffmpeg_source',   # 视频源
-        'audio': 'ffmpeg_source',   # 音频源
+        'text': _TEXT_KIND,         # 文本源
+        'image': _IMAGE_KIND,       # 图像源
+        'video': _MEDIA_KIND,       # 视频源
+        'audio': _MEDIA_KIND,       # 音频源
         'window': 'window_capture', # 窗口捕获
         'display': 'monitor_capture', # 显示器捕获
         'camera': 'dshow_input',    # 摄像头
-        'browser': 'browser_source', # 浏览器源
-        'color': 'color_source',    # 颜色源
+        'browser': _BROWSER_KIND,   # 浏览器源
+        'color': _COLOR_KIND,       # 颜色源
     }
     
-    def __init__(self, client: OBSClient):
+    # 源列表缓存的默认有效期（秒）
+    DEFAULT_CACHE_TTL = 0.5
+    
+    # 会改变源列表的 OBS 事件
+    _INVALIDATING_EVENTS = ('InputCreated', 'InputRemoved', 'InputNameChanged')
+    
+    def __init__(self, client: OBSClient, cache_ttl: float = DEFAULT_CACHE_TTL):
         """
         初始化源管理器
         
         Args:
             client: OBS 客户端实例
+            cache_ttl: 源列表缓存有效期（秒），0 表示不缓存
         """
         self.client = client
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        
+        # 源列表缓存，减少 "先检查再操作" 模式下重复的 GetInputList 请求
+        # 列表与按名称索引来自同一次请求，整体替换，不会出现两者不一致
+        self._ttl = cache_ttl
+        self._cache = {'inputs': None, 'by_name': {}, 'ts': 0.0}
+        
+        for event_type in self._INVALIDATING_EVENTS:
+            self.client.register_event_callback(self._invalidate, event_type)
+    
+    def _invalidate(self, *_):
+        """使源列表缓存失效（也用作 OBS 事件回调）"""
+        self._cache = {'inputs': None, 'by_name': {}, 'ts': 0.0}
     
     def get_all(self) -> List[Dict[str, Any]]:
         """
@@ -56,14 +153,36 @@ class SourceManager:
         Returns:
             List[Dict]: 源列表
         """
+        return list(self._snapshot()['inputs'] or [])
+    
+    def _snapshot(self) -> Dict[str, Any]:
+        """
+        获取源列表快照
+        
+        缓存有效时直接返回，否则重新请求。请求失败时清空快照，
+        不会继续使用上一次的结果。
+        
+        Returns:
+            Dict: {'inputs': 源列表（失败时为 None）, 'by_name': {名称: 源}, 'ts': 获取时间}
+        """
+        cache = self._cache
+        if cache['inputs'] is not None and time.monotonic() - cache['ts'] < self._ttl:
+            return cache
+        
         try:
             response = self.client.call(requests.GetInputList())
-            if hasattr(response, 'datain'):
-                return response.datain.get('inputs', [])
-            return []
+            inputs = _extract(response, 'inputs', [])
         except Exception as e:
-            self.logger.error(f"获取源列表失败: {e}")
-            return []
+            self.logger.error("获取源列表失败: %s", e)
+            self._cache = {'inputs': None, 'by_name': {}, 'ts': 0.0}
+            return self._cache
+        
+        self._cache = {
+            'inputs': inputs,
+            'by_name': {source.get('inputName', ''): source for source in inputs},
+            'ts': time.monotonic(),
+        }
+        return self._cache
     
     def get_names(self) -> List[str]:
         """
@@ -85,7 +204,7 @@ class SourceManager:
         Returns:
             bool: True 表示源存在
         """
-        return source_name in self.get_names()
+        return source_name in self._snapshot()['by_name']
     
     def get_source_info(self, source_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -95,19 +214,13 @@ class SourceManager:
             source_name: 源名称
             
         Returns:
-            Dict: 源信息，如果源不存在返回 None
+            Dict: 源信息的副本（修改不影响缓存），如果源不存在返回 None
         """
         try:
-            if not self.exists(source_name):
-                return None
-            
-            sources = self.get_all()
-            for source in sources:
-                if source.get('inputName') == source_name:
-                    return source
-            return None
+            source = self._snapshot()['by_name'].get(source_name)
+            return dict(source) if source is not None else None
         except Exception as e:
-            self.logger.error(f"获取源信息失败: {e}")
+            self.logger.error("获取源信息失败: %s", e)
             return None
     
     def create_source(self, source_name: str, source_type: str, settings: Optional[Dict[str, Any]] = None) -> bool:
@@ -124,7 +237,7 @@ class SourceManager:
         """
         try:
             if self.exists(source_name):
-                self.logger.warning(f"源 '{source_name}' 已存在")
+                self.logger.warning("源 '%s' 已存在", source_name)
                 return False
             
             settings = settings or {}
@@ -134,12 +247,13 @@ class SourceManager:
                 inputKind=source_type,
                 inputSettings=settings
             ))
+            self._invalidate()
             
-            self.logger.info(f"成功创建源: {source_name} (类型: {source_type})")
+            self.logger.info("成功创建源: %s (类型: %s)", source_name, source_type)
             return True
             
         except Exception as e:
-            self.logger.error(f"创建源失败: {e}")
+            self.logger.error("创建源失败: %s", e)
             return False
     
     def delete_source(self, source_name: str) -> bool:
@@ -157,13 +271,14 @@ class SourceManager:
                 raise OBSResourceNotFoundError("源", source_name, self.get_names())
             
             self.client.call(requests.RemoveInput(inputName=source_name))
-            self.logger.info(f"成功删除源: {source_name}")
+            self._invalidate()
+            self.logger.info("成功删除源: %s", source_name)
             return True
             
         except OBSResourceNotFoundError:
             raise
         except Exception as e:
-            self.logger.error(f"删除源失败: {e}")
+            self.logger.error("删除源失败: %s", e)
             return False
 
     def get_settings(self, source_name: str) -> Dict[str, Any]:
@@ -181,42 +296,48 @@ class SourceManager:
                 raise OBSResourceNotFoundError("源", source_name, self.get_names())
 
             response = self.client.call(requests.GetInputSettings(inputName=source_name))
-            if hasattr(response, 'datain'):
-                return response.datain.get('inputSettings', {})
-            return {}
+            return _extract(response, 'inputSettings', {})
 
         except OBSResourceNotFoundError:
             raise
         except Exception as e:
-            self.logger.error(f"获取源设置失败: {e}")
+            self.logger.error("获取源设置失败: %s", e)
             return {}
 
-    def set_settings(self, source_name: str, settings: Dict[str, Any]) -> bool:
+    def set_settings(self, source_name: str, settings: Dict[str, Any], merge: bool = True) -> bool:
         """
         设置源设置
 
         Args:
             source_name: 源名称
             settings: 设置字典
+            merge: True 表示只更新传入的键（overlay），False 表示整体替换
 
         Returns:
             bool: 操作是否成功
         """
         try:
-            if not self.exists(source_name):
-                raise OBSResourceNotFoundError("源", source_name, self.get_names())
-
-            self.client.call(requests.SetInputSettings(
+            response = self.client.call(requests.SetInputSettings(
                 inputName=source_name,
-                inputSettings=settings
+                inputSettings=settings,
+                overlay=merge
             ))
-            self.logger.info(f"已更新源设置: {source_name}")
+
+            # 请求失败时才确认源是否存在，成功路径只需一次请求
+            if getattr(response, 'status', True) is False:
+                self._invalidate()
+                if not self.exists(source_name):
+                    raise OBSResourceNotFoundError("源", source_name, self.get_names())
+                self.logger.error("设置源设置失败: %s", source_name)
+                return False
+
+            self.logger.info("已更新源设置: %s", source_name)
             return True
 
         except OBSResourceNotFoundError:
             raise
         except Exception as e:
-            self.logger.error(f"设置源设置失败: {e}")
+            self.logger.error("设置源设置失败: %s", e)
             return False
 
     # 便捷方法 - 创建特定类型的源
@@ -233,20 +354,9 @@ class SourceManager:
         Returns:
             bool: 创建是否成功
         """
-        settings = {
-            'text': text,
-            'font': {
-                'face': 'Arial',
-                'size': font_size,
-                'style': ''
-            },
-            'color': color,
-            'opacity': 100,
-            'outline': False,
-            'drop_shadow': False
-        }
+        settings = _text_settings(text, font_size, color)
 
-        return self.create_source(source_name, self.SOURCE_TYPES['text'], settings)
+        return self.create_source(source_name, _TEXT_KIND, settings)
 
     def create_image_source(self, source_name: str, file_path: str) -> bool:
         """
@@ -259,12 +369,9 @@ class SourceManager:
         Returns:
             bool: 创建是否成功
         """
-        settings = {
-            'file': file_path,
-            'unload': False
-        }
+        settings = _image_settings(file_path)
 
-        return self.create_source(source_name, self.SOURCE_TYPES['image'], settings)
+        return self.create_source(source_name, _IMAGE_KIND, settings)
 
     def create_video_source(self, source_name: str, file_path: str, loop: bool = True) -> bool:
         """
@@ -278,13 +385,9 @@ class SourceManager:
         Returns:
             bool: 创建是否成功
         """
-        settings = {
-            'local_file': file_path,
-            'looping': loop,
-            'restart_on_activate': True
-        }
+        settings = _video_settings(file_path, loop)
 
-        return self.create_source(source_name, self.SOURCE_TYPES['video'], settings)
+        return self.create_source(source_name, _MEDIA_KIND, settings)
 
     def create_color_source(self, source_name: str, color: int = 0x000000, width: int = 1920, height: int = 1080) -> bool:
         """
@@ -299,13 +402,9 @@ class SourceManager:
         Returns:
             bool: 创建是否成功
         """
-        settings = {
-            'color': color,
-            'width': width,
-            'height': height
-        }
+        settings = _color_settings(color, width, height)
 
-        return self.create_source(source_name, self.SOURCE_TYPES['color'], settings)
+        return self.create_source(source_name, _COLOR_KIND, settings)
 
     def create_browser_source(self, source_name: str, url: str, width: int = 1920, height: int = 1080) -> bool:
         """
@@ -320,16 +419,9 @@ class SourceManager:
         Returns:
             bool: 创建是否成功
         """
-        settings = {
-            'url': url,
-            'width': width,
-            'height': height,
-            'fps': 30,
-            'shutdown': False,
-            'restart_when_active': False
-        }
+        settings = _browser_settings(url, width, height)
 
-        return self.create_source(source_name, self.SOURCE_TYPES['browser'], settings)
+        return self.create_source(source_name, _BROWSER_KIND, settings)
 
     # 便捷方法 - 创建源并添加到场景
     def create_text_source_in_scene(self, scene_name: str, source_name: str, text: str = "",
@@ -350,20 +442,9 @@ class SourceManager:
         Returns:
             bool: 创建并添加是否成功
         """
-        settings = {
-            'text': text,
-            'font': {
-                'face': 'Arial',
-                'size': font_size,
-                'style': ''
-            },
-            'color': color,
-            'opacity': 100,
-            'outline': False,
-            'drop_shadow': False
-        }
+        settings = _text_settings(text, font_size, color)
 
-        return self.create_and_add_to_scene(scene_name, source_name, self.SOURCE_TYPES['text'],
+        return self.create_and_add_to_scene(scene_name, source_name, _TEXT_KIND,
                                           settings, position, scale)
 
     def create_image_source_in_scene(self, scene_name: str, source_name: str, file_path: str,
@@ -381,12 +462,9 @@ class SourceManager:
         Returns:
             bool: 创建并添加是否成功
         """
-        settings = {
-            'file': file_path,
-            'unload': False
-        }
+        settings = _image_settings(file_path)
 
-        return self.create_and_add_to_scene(scene_name, source_name, self.SOURCE_TYPES['image'],
+        return self.create_and_add_to_scene(scene_name, source_name, _IMAGE_KIND,
                                           settings, position, scale)
 
     def create_video_source_in_scene(self, scene_name: str, source_name: str, file_path: str,
@@ -406,13 +484,9 @@ class SourceManager:
         Returns:
             bool: 创建并添加是否成功
         """
-        settings = {
-            'local_file': file_path,
-            'looping': loop,
-            'restart_on_activate': True
-        }
+        settings = _video_settings(file_path, loop)
 
-        return self.create_and_add_to_scene(scene_name, source_name, self.SOURCE_TYPES['video'],
+        return self.create_and_add_to_scene(scene_name, source_name, _MEDIA_KIND,
                                           settings, position, scale)
 
     def create_color_source_in_scene(self, scene_name: str, source_name: str, color: int = 0x000000,
@@ -433,13 +507,9 @@ class SourceManager:
         Returns:
             bool: 创建并添加是否成功
         """
-        settings = {
-            'color': color,
-            'width': width,
-            'height': height
-        }
+        settings = _color_settings(color, width, height)
 
-        return self.create_and_add_to_scene(scene_name, source_name, self.SOURCE_TYPES['color'],
+        return self.create_and_add_to_scene(scene_name, source_name, _COLOR_KIND,
                                           settings, position, scale)
 
     def create_browser_source_in_scene(self, scene_name: str, source_name: str, url: str,
@@ -460,16 +530,9 @@ class SourceManager:
         Returns:
             bool: 创建并添加是否成功
         """
-        settings = {
-            'url': url,
-            'width': width,
-            'height': height,
-            'fps': 30,
-            'shutdown': False,
-            'restart_when_active': False
-        }
+        settings = _browser_settings(url, width, height)
 
-        return self.create_and_add_to_scene(scene_name, source_name, self.SOURCE_TYPES['browser'],
+        return self.create_and_add_to_scene(scene_name, source_name, _BROWSER_KIND,
                                           settings, position, scale)
 
     # 源属性设置的便捷方法
@@ -485,11 +548,9 @@ class SourceManager:
             bool: 设置是否成功
         """
         try:
-            current_settings = self.get_settings(source_name)
-            current_settings['text'] = text
-            return self.set_settings(source_name, current_settings)
+            return self.set_settings(source_name, {'text': text})
         except Exception as e:
-            self.logger.error(f"设置文本内容失败: {e}")
+            self.logger.error("设置文本内容失败: %s", e)
             return False
 
     def set_image_path(self, source_name: str, file_path: str) -> bool:
@@ -504,11 +565,9 @@ class SourceManager:
             bool: 设置是否成功
         """
         try:
-            current_settings = self.get_settings(source_name)
-            current_settings['file'] = file_path
-            return self.set_settings(source_name, current_settings)
+            return self.set_settings(source_name, {'file': file_path})
         except Exception as e:
-            self.logger.error(f"设置图像路径失败: {e}")
+            self.logger.error("设置图像路径失败: %s", e)
             return False
 
     def set_video_path(self, source_name: str, file_path: str) -> bool:
@@ -523,11 +582,9 @@ class SourceManager:
             bool: 设置是否成功
         """
         try:
-            current_settings = self.get_settings(source_name)
-            current_settings['local_file'] = file_path
-            return self.set_settings(source_name, current_settings)
+            return self.set_settings(source_name, {'local_file': file_path})
         except Exception as e:
-            self.logger.error(f"设置视频路径失败: {e}")
+            self.logger.error("设置视频路径失败: %s", e)
             return False
 
     def create_and_add_to_scene(self, scene_name: str, source_name: str, source_type: str,
@@ -549,17 +606,105 @@ class SourceManager:
             bool: 创建并添加是否成功
         """
         try:
-            # 首先创建源
-            if not self.create_source(source_name, source_type, settings):
+            if self.exists(source_name):
+                self.logger.warning("源 '%s' 已存在", source_name)
                 return False
 
-            # 然后添加到场景
-            return self.add_source_to_scene(scene_name, source_name, position, scale)
+            # CreateInput 指定 sceneName 时会同时创建场景项并返回其 ID
+            response = self.client.call(requests.CreateInput(
+                sceneName=scene_name,
+                inputName=source_name,
+                inputKind=source_type,
+                inputSettings=settings or {}
+            ))
+            self._invalidate()
+
+            item_id = _extract(response, 'sceneItemId')
+            if getattr(response, 'status', True) is False or item_id is None:
+                self.logger.error("创建源 '%s' 并添加到场景 '%s' 失败", source_name, scene_name)
+                return False
+
+            transform = _scene_item_transform(position, scale)
+            if transform:
+                self.client.call(requests.SetSceneItemTransform(
+                    sceneName=scene_name,
+                    sceneItemId=item_id,
+                    sceneItemTransform=transform
+                ))
+
+            self.logger.info("成功创建源 '%s' 并添加到场景 '%s'", source_name, scene_name)
+            return True
 
         except Exception as e:
-            self.logger.error(f"创建并添加源到场景失败: {e}")
+            self.logger.error("创建并添加源到场景失败: %s", e)
             return False
 
+    def create_many(self, specs: List[SourceSpec]) -> List[Tuple[bool, Optional[str]]]:
+        """
+        批量创建源（可同时添加到场景）
+
+        先一次性发出所有 CreateInput 请求，收到响应后再统一设置需要的变换，
+        单个源失败不影响其他源。
+
+        Args:
+            specs: 源描述列表
+
+        Returns:
+            List[Tuple[bool, Optional[str]]]: 与 specs 一一对应的 (是否成功, 错误信息)
+        """
+        results: List[Tuple[bool, Optional[str]]] = [(False, None)] * len(specs)
+
+        try:
+            # 第一阶段：创建所有源
+            create_requests = []
+            for spec in specs:
+                params = {
+                    'inputName': spec.name,
+                    'inputKind': self.SOURCE_TYPES.get(spec.kind, spec.kind),
+                    'inputSettings': spec.settings or {}
+                }
+                if spec.scene is not None:
+                    params['sceneName'] = spec.scene
+                create_requests.append(requests.CreateInput(**params))
+
+            responses = self.client.call_batch(create_requests)
+
+            # 第二阶段：为已添加到场景的源设置变换
+            transform_requests = []
+            transform_indexes = []
+            for index, (spec, response) in enumerate(zip(specs, responses)):
+                if getattr(response, 'status', True) is False:
+                    results[index] = (False, f"创建源 '{spec.name}' 失败")
+                    continue
+
+                results[index] = (True, None)
+                transform = _scene_item_transform(spec.position, spec.scale)
+                item_id = _extract(response, 'sceneItemId')
+                if spec.scene is not None and transform and item_id is not None:
+                    transform_requests.append(requests.SetSceneItemTransform(
+                        sceneName=spec.scene,
+                        sceneItemId=item_id,
+                        sceneItemTransform=transform
+                    ))
+                    transform_indexes.append(index)
+
+            if transform_requests:
+                responses = self.client.call_batch(transform_requests)
+                for index, response in zip(transform_indexes, responses):
+                    if getattr(response, 'status', True) is False:
+                        results[index] = (False, f"设置源 '{specs[index].name}' 的变换失败")
+
+        except Exception as e:
+            self.logger.error("批量创建源失败: %s", e)
+            results = [result if result[0] else (False, str(e)) for result in results]
+
+        finally:
+            self._invalidate()
+
+        created = sum(1 for ok, _ in results if ok)
+        self.logger.info("批量创建源完成: %s/%s 成功", created, len(specs))
+        return results
+
     def add_source_to_scene(self, scene_name: str, source_name: str,
                            position: Optional[tuple] = None,
                            scale: Optional[tuple] = None) -> bool:
@@ -579,45 +724,29 @@ class SourceManager:
             if not self.exists(source_name):
                 raise OBSResourceNotFoundError("源", source_name, self.get_names())
 
-            # 添加源到场景
-            self.client.call(requests.CreateSceneItem(
+            # 添加源到场景，响应中直接包含新场景项的 ID
+            response = self.client.call(requests.CreateSceneItem(
                 sceneName=scene_name,
                 sourceName=source_name
             ))
 
             # 如果指定了位置或缩放，设置变换
-            if position is not None or scale is not None:
-                # 获取刚创建的场景项ID
-                scene_items_response = self.client.call(requests.GetSceneItemList(sceneName=scene_name))
-                if hasattr(scene_items_response, 'datain'):
-                    scene_items = scene_items_response.datain.get('sceneItems', [])
-                    for item in scene_items:
-                        if item.get('sourceName') == source_name:
-                            item_id = item.get('sceneItemId')
-
-                            transform = {}
-                            if position is not None:
-                                transform['positionX'] = position[0]
-                                transform['positionY'] = position[1]
-                            if scale is not None:
-                                transform['scaleX'] = scale[0]
-                                transform['scaleY'] = scale[1]
-
-                            if transform:
-                                self.client.call(requests.SetSceneItemTransform(
-                                    sceneName=scene_name,
-                                    sceneItemId=item_id,
-                                    sceneItemTransform=transform
-                                ))
-                            break
-
-            self.logger.info(f"成功将源 '{source_name}' 添加到场景 '{scene_name}'")
+            transform = _scene_item_transform(position, scale)
+            item_id = _extract(response, 'sceneItemId')
+            if transform and item_id is not None:
+                self.client.call(requests.SetSceneItemTransform(
+                    sceneName=scene_name,
+                    sceneItemId=item_id,
+                    sceneItemTransform=transform
+                ))
+
+            self.logger.info("成功将源 '%s' 添加到场景 '%s'", source_name, scene_name)
             return True
 
         except OBSResourceNotFoundError:
             raise
         except Exception as e:
-            self.logger.error(f"添加源到场景失败: {e}")
+            self.logger.error("添加源到场景失败: %s", e)
             return False
 
     def get_info(self) -> Dict[str, Any]:
@@ -628,16 +757,12 @@ class SourceManager:
             Dict: 源管理信息
         """
         all_sources = self.get_all()
-        source_types = {}
-
-        for source in all_sources:
-            source_type = source.get('inputKind', 'unknown')
-            source_types[source_type] = source_types.get(source_type, 0) + 1
+        source_types = Counter(source.get('inputKind', 'unknown') for source in all_sources)
 
         return {
             "total_sources": len(all_sources),
-            "source_names": self.get_names(),
-            "source_types": source_types,
+            "source_names": [source.get('inputName', '') for source in all_sources],
+            "source_types": dict(source_types),
             "available_types": list(self.SOURCE_TYPES.keys())
         }
 
@@ -5,6 +5,7 @@
 """
 
 import logging
+import time
 from typing import Dict, Any
 
 try:
@@ -12,7 +13,7 @@ try:
 except ImportError:
     raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
 
-from ..core.client import OBSClient
+from ..core.client import OBSClient, _extract
 from ..core.exceptions import OBSOutputRunningError, OBSOutputNotRunningError
 
 
@@ -26,15 +27,33 @@ class StreamingManager:
     提供推流相关的所有功能，包括开始、停止推流等。
     """
     
-    def __init__(self, client: OBSClient):
+    logger = logging.getLogger(f"{__name__}.StreamingManager")
+    
+    def __init__(self, client: OBSClient, status_max_age: float = 0.0):
         """
         初始化推流管理器
         
         Args:
             client: OBS 客户端实例
+            status_max_age: get_status() 结果的复用时间（秒），0 表示每次都请求
         """
         self.client = client
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        
+        # 当前激活状态，由状态请求和 StreamStateChanged 事件维护，请求失败时作为回退值
+        self._last_active = False
+        self._synced_generation = None
+        
+        # 完整状态（时长、字节数等动态字段）的缓存
+        self._status: Dict[str, Any] = {}
+        self._status_ts = 0.0
+        self._status_max_age = status_max_age
+        
+        self.client.register_event_callback(self._on_state_changed, 'StreamStateChanged')
+    
+    def _on_state_changed(self, event):
+        """StreamStateChanged 事件回调"""
+        self._last_active = event.datain.get('outputActive', False)
+        self._status_ts = 0.0
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -43,10 +62,20 @@ class StreamingManager:
         Returns:
             Dict: 推流状态信息
         """
+        generation = self.client.generation
+        if (self._status_max_age and self._synced_generation == generation
+                and time.monotonic() - self._status_ts < self._status_max_age):
+            return dict(self._status)
+        
         response = self.client.call(requests.GetStreamStatus())
-        if hasattr(response, 'datain'):
-            return response.datain
-        return {}
+        status = _extract(response, default={})
+        if getattr(response, 'status', True):
+            # 只有请求成功时才记录同步状态，失败时下次调用会重新请求
+            self._last_active = status.get('outputActive', self._last_active)
+            self._synced_generation = generation
+            self._status = status
+            self._status_ts = time.monotonic()
+        return dict(status)
     
     def is_streaming(self) -> bool:
         """
@@ -55,8 +84,10 @@ class StreamingManager:
         Returns:
             bool: True 表示正在推流
         """
-        status = self.get_status()
-        return status.get('outputActive', False)
+        # 状态由事件维护，只在首次调用或重连后（可能丢失事件）请求一次
+        if self._synced_generation != self.client.generation or not self.client.is_connected():
+            self.get_status()
+        return self._last_active
     
     def is_reconnecting(self) -> bool:
         """
@@ -149,7 +180,7 @@ class StreamingManager:
         except OBSOutputRunningError:
             raise
         except Exception as e:
-            self.logger.error(f"开始推流失败: {e}")
+            self.logger.error("开始推流失败: %s", e)
             return False
     
     def stop(self) -> bool:
@@ -173,7 +204,7 @@ class StreamingManager:
         except OBSOutputNotRunningError:
             raise
         except Exception as e:
-            self.logger.error(f"停止推流失败: {e}")
+            self.logger.error("停止推流失败: %s", e)
             return False
     
     def toggle(self) -> bool:
@@ -186,17 +217,16 @@ class StreamingManager:
         try:
             response = self.client.call(requests.ToggleStream())
             
-            active = False
-            if hasattr(response, 'datain'):
-                active = response.datain.get('outputActive', False)
+            active = _extract(response, 'outputActive', False)
+            self._last_active = active
             
             status = "开始" if active else "停止"
-            self.logger.info(f"推流已{status}")
+            self.logger.info("推流已%s", status)
             return active
             
         except Exception as e:
-            self.logger.error(f"切换推流状态失败: {e}")
-            return self.is_streaming()
+            self.logger.error("切换推流状态失败: %s", e)
+            return self._last_active
     
     def get_info(self) -> Dict[str, Any]:
         """
@@ -205,18 +235,22 @@ class StreamingManager:
         Returns:
             Dict: 推流信息
         """
+        # 只请求一次 GetStreamStatus，所有字段均从同一份状态中读取
         status = self.get_status()
+        dropped = status.get('outputSkippedFrames', 0)
+        total = status.get('outputTotalFrames', 0)
         return {
-            "streaming": self.is_streaming(),
-            "reconnecting": self.is_reconnecting(),
-            "duration": self.get_duration(),
-            "timecode": self.get_timecode(),
-            "bytes_sent": self.get_bytes_sent(),
-            "dropped_frames": self.get_dropped_frames(),
-            "total_frames": self.get_total_frames(),
-            "congestion": self.get_congestion(),
-            "drop_rate": (
-                self.get_dropped_frames() / max(self.get_total_frames(), 1) * 100
-                if self.get_total_frames() > 0 else 0.0
-            )
+            "streaming": status.get('outputActive', False),
+            "reconnecting": status.get('outputReconnecting', False),
+            "duration": status.get('outputDuration', 0),
+            "timecode": status.get('outputTimecode', '00:00:00'),
+            "bytes_sent": status.get('outputBytes', 0),
+            "dropped_frames": dropped,
+            "total_frames": total,
+            "congestion": status.get('outputCongestion', 0.0),
+            "drop_rate": dropped / max(total, 1) * 100 if total > 0 else 0.0
         }
+    
+    def close(self):
+        """取消在客户端上注册的 StreamStateChanged 事件回调，管理器不再使用时调用"""
+        self.client.unregister_event_callback(self._on_state_changed, 'StreamStateChanged')
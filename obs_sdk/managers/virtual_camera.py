@@ -5,6 +5,7 @@
 """
 
 import logging
+import time
 from typing import Dict, Any
 
 try:
@@ -12,7 +13,7 @@ try:
 except ImportError:
     raise ImportError("请安装 obs-websocket-py: pip install obs-websocket-py")
 
-from ..core.client import OBSClient
+from ..core.client import OBSClient, _extract
 from ..core.exceptions import OBSOutputRunningError, OBSOutputNotRunningError
 
 
@@ -26,15 +27,33 @@ class VirtualCameraManager:
     提供虚拟摄像头相关的所有功能。
     """
     
-    def __init__(self, client: OBSClient):
+    logger = logging.getLogger(f"{__name__}.VirtualCameraManager")
+    
+    def __init__(self, client: OBSClient, status_max_age: float = 0.0):
         """
         初始化虚拟摄像头管理器
         
         Args:
             client: OBS 客户端实例
+            status_max_age: get_status() 结果的复用时间（秒），0 表示每次都请求
         """
         self.client = client
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        
+        # 当前激活状态，由状态请求和 VirtualcamStateChanged 事件维护，请求失败时作为回退值
+        self._last_active = False
+        self._synced_generation = None
+        
+        # 完整状态的缓存
+        self._status: Dict[str, Any] = {}
+        self._status_ts = 0.0
+        self._status_max_age = status_max_age
+        
+        self.client.register_event_callback(self._on_state_changed, 'VirtualcamStateChanged')
+    
+    def _on_state_changed(self, event):
+        """VirtualcamStateChanged 事件回调"""
+        self._last_active = event.datain.get('outputActive', False)
+        self._status_ts = 0.0
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -43,10 +62,20 @@ class VirtualCameraManager:
         Returns:
             Dict: 虚拟摄像头状态信息
         """
+        generation = self.client.generation
+        if (self._status_max_age and self._synced_generation == generation
+                and time.monotonic() - self._status_ts < self._status_max_age):
+            return dict(self._status)
+        
         response = self.client.call(requests.GetVirtualCamStatus())
-        if hasattr(response, 'datain'):
-            return response.datain
-        return {}
+        status = _extract(response, default={})
+        if getattr(response, 'status', True):
+            # 只有请求成功时才记录同步状态，失败时下次调用会重新请求
+            self._last_active = status.get('outputActive', self._last_active)
+            self._synced_generation = generation
+            self._status = status
+            self._status_ts = time.monotonic()
+        return dict(status)
     
     def is_active(self) -> bool:
         """
@@ -55,8 +84,10 @@ class VirtualCameraManager:
         Returns:
             bool: True 表示虚拟摄像头已激活
         """
-        status = self.get_status()
-        return status.get('outputActive', False)
+        # 状态由事件维护，只在首次调用或重连后（可能丢失事件）请求一次
+        if self._synced_generation != self.client.generation or not self.client.is_connected():
+            self.get_status()
+        return self._last_active
     
     def start(self) -> bool:
         """
@@ -79,7 +110,7 @@ class VirtualCameraManager:
         except OBSOutputRunningError:
             raise
         except Exception as e:
-            self.logger.error(f"启动虚拟摄像头失败: {e}")
+            self.logger.error("启动虚拟摄像头失败: %s", e)
             return False
     
     def stop(self) -> bool:
@@ -103,7 +134,7 @@ class VirtualCameraManager:
         except OBSOutputNotRunningError:
             raise
         except Exception as e:
-            self.logger.error(f"停止虚拟摄像头失败: {e}")
+            self.logger.error("停止虚拟摄像头失败: %s", e)
             return False
     
     def toggle(self) -> bool:
@@ -116,17 +147,16 @@ class VirtualCameraManager:
         try:
             response = self.client.call(requests.ToggleVirtualCam())
             
-            active = False
-            if hasattr(response, 'datain'):
-                active = response.datain.get('outputActive', False)
+            active = _extract(response, 'outputActive', False)
+            self._last_active = active
             
             status = "启动" if active else "停止"
-            self.logger.info(f"虚拟摄像头已{status}")
+            self.logger.info("虚拟摄像头已%s", status)
             return active
             
         except Exception as e:
-            self.logger.error(f"切换虚拟摄像头状态失败: {e}")
-            return self.is_active()
+            self.logger.error("切换虚拟摄像头状态失败: %s", e)
+            return self._last_active
     
     def get_info(self) -> Dict[str, Any]:
         """
@@ -10,7 +10,9 @@ OBS 输入类型映射配置
 "text_ft2_source_v2": "文本(FreeType 2)",  在真实软件中已经被启用
 """
 
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from enum import Enum
 
 
@@ -51,6 +53,9 @@ INPUT_TYPE_MAPPING = {
     "color_source_v3": "色源",
 }
 
+# 映射表的只读视图，避免每次调用复制字典
+INPUT_TYPE_MAPPING_VIEW: Mapping[str, str] = MappingProxyType(INPUT_TYPE_MAPPING)
+
 # 输入类型分类映射
 INPUT_TYPE_CATEGORIES = {
     # 媒体类
@@ -78,8 +83,58 @@ INPUT_TYPE_CATEGORIES = {
     "color_source_v3": InputCategory.EFFECT,
 }
 
-# 反向映射（中文到英文）
-CHINESE_TO_ENGLISH_MAPPING = {v: k for k, v in INPUT_TYPE_MAPPING.items()}
+# 反向映射（中文到英文），只读以保证始终是 INPUT_TYPE_MAPPING 的逆映射
+CHINESE_TO_ENGLISH_MAPPING: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in INPUT_TYPE_MAPPING.items()}
+)
+
+# 有效类型 / 中文名称集合，用于成员检查
+_VALID_TYPES = frozenset(INPUT_TYPE_MAPPING)
+_VALID_CHINESE = frozenset(CHINESE_TO_ENGLISH_MAPPING)
+
+# 分类到输入类型的反向索引
+CATEGORY_TO_TYPES: Dict[InputCategory, Tuple[str, ...]] = {
+    category: tuple(k for k, v in INPUT_TYPE_CATEGORIES.items() if v == category)
+    for category in InputCategory
+}
+
+# 关键词搜索索引：(英文类型, 中文名称, 小写的被搜索字段)
+_SEARCH_INDEX_CN: Tuple[Tuple[str, str, str], ...] = tuple(
+    (k, v, v.lower()) for k, v in INPUT_TYPE_MAPPING.items()
+)
+_SEARCH_INDEX_EN: Tuple[Tuple[str, str, str], ...] = tuple(
+    (k, v, k.lower()) for k, v in INPUT_TYPE_MAPPING.items()
+)
+
+
+@lru_cache(maxsize=None)
+def _build_mapping_with_category() -> Dict[str, Tuple[str, str]]:
+    """生成带分类的映射关系（映射表在导入后不再变化，结果可长期缓存）"""
+    result = {}
+    for english_type, chinese_name in INPUT_TYPE_MAPPING.items():
+        category = INPUT_TYPE_CATEGORIES.get(english_type)
+        category_name = category.value if category else "未分类"
+        result[english_type] = (chinese_name, category_name)
+    return result
+
+
+def _build_formatted_list() -> str:
+    """生成格式化的类型列表"""
+    lines = ["输入类型对照表:", "=" * 50]
+    
+    # 按分类组织
+    for category in InputCategory:
+        types_in_category = CATEGORY_TO_TYPES[category]
+        if types_in_category:
+            lines.append(f"\n【{category.value}】")
+            lines.extend([f"  {english_type:<30} -> {INPUT_TYPE_MAPPING[english_type]}"
+                          for english_type in types_in_category])
+    
+    return "\n".join(lines)
+
+
+# 映射表在导入后不再变化，格式化列表只需生成一次
+_FORMATTED_LIST_CACHE = _build_formatted_list()
 
 
 class InputTypeHelper:
@@ -135,17 +190,17 @@ class InputTypeHelper:
         Returns:
             List[str]: 该分类下的英文输入类型列表
         """
-        return [k for k, v in INPUT_TYPE_CATEGORIES.items() if v == category]
+        return list(CATEGORY_TO_TYPES.get(category, ()))
     
     @staticmethod
-    def get_all_mappings() -> Dict[str, str]:
+    def get_all_mappings() -> Mapping[str, str]:
         """
         获取所有映射关系
         
         Returns:
-            Dict[str, str]: 英文到中文的映射字典
+            Mapping[str, str]: 英文到中文的只读映射
         """
-        return INPUT_TYPE_MAPPING.copy()
+        return INPUT_TYPE_MAPPING_VIEW
     
     @staticmethod
     def get_mapping_with_category() -> Dict[str, Tuple[str, str]]:
@@ -155,12 +210,7 @@ class InputTypeHelper:
         Returns:
             Dict[str, Tuple[str, str]]: 英文类型 -> (中文名称, 分类名称)
         """
-        result = {}
-        for english_type, chinese_name in INPUT_TYPE_MAPPING.items():
-            category = INPUT_TYPE_CATEGORIES.get(english_type)
-            category_name = category.value if category else "未分类"
-            result[english_type] = (chinese_name, category_name)
-        return result
+        return dict(_build_mapping_with_category())
     
     @staticmethod
     def search_by_keyword(keyword: str, search_chinese: bool = True) -> List[Tuple[str, str]]:
@@ -175,17 +225,8 @@ class InputTypeHelper:
             List[Tuple[str, str]]: 匹配的 (英文类型, 中文名称) 列表
         """
         keyword = keyword.lower()
-        results = []
-        
-        for english_type, chinese_name in INPUT_TYPE_MAPPING.items():
-            if search_chinese:
-                if keyword in chinese_name.lower():
-                    results.append((english_type, chinese_name))
-            else:
-                if keyword in english_type.lower():
-                    results.append((english_type, chinese_name))
-        
-        return results
+        index = _SEARCH_INDEX_CN if search_chinese else _SEARCH_INDEX_EN
+        return [(english_type, chinese_name) for english_type, chinese_name, text in index if keyword in text]
     
     @staticmethod
     def is_valid_type(english_type: str) -> bool:
@@ -198,7 +239,20 @@ class InputTypeHelper:
         Returns:
             bool: 是否为有效类型
         """
-        return english_type in INPUT_TYPE_MAPPING
+        return english_type in _VALID_TYPES
+    
+    @staticmethod
+    def is_valid_chinese_name(chinese_name: str) -> bool:
+        """
+        检查是否为有效的中文类型名称
+        
+        Args:
+            chinese_name: 中文名称
+            
+        Returns:
+            bool: 是否为有效名称
+        """
+        return chinese_name in _VALID_CHINESE
     
     @staticmethod
     def get_formatted_list() -> str:
@@ -208,27 +262,17 @@ class InputTypeHelper:
         Returns:
             str: 格式化的字符串
         """
-        lines = ["输入类型对照表:"]
-        lines.append("=" * 50)
-        
-        # 按分类组织
-        for category in InputCategory:
-            types_in_category = InputTypeHelper.get_types_by_category(category)
-            if types_in_category:
-                lines.append(f"\n【{category.value}】")
-                for english_type in types_in_category:
-                    chinese_name = INPUT_TYPE_MAPPING[english_type]
-                    lines.append(f"  {english_type:<30} -> {chinese_name}")
-        
-        return "\n".join(lines)
+        return _FORMATTED_LIST_CACHE
 
 
 # 便捷函数
+@lru_cache(maxsize=256)
 def to_chinese(english_type: str) -> str:
     """将英文输入类型转换为中文名称"""
     return InputTypeHelper.get_chinese_name(english_type)
 
 
+@lru_cache(maxsize=256)
 def to_english(chinese_name: str) -> str:
     """将中文名称转换为英文输入类型"""
     return InputTypeHelper.get_english_type(chinese_name)
@@ -243,8 +287,10 @@ def get_category_name(english_type: str) -> str:
 # 导出常用的映射表
 __all__ = [
     'INPUT_TYPE_MAPPING',
+    'INPUT_TYPE_MAPPING_VIEW',
     'CHINESE_TO_ENGLISH_MAPPING', 
     'INPUT_TYPE_CATEGORIES',
+    'CATEGORY_TO_TYPES',
     'InputCategory',
     'InputTypeHelper',
     'to_chinese',
@@ -5,6 +5,27 @@
 OBS Studio 内部使用 BGR 格式，而大多数其他应用使用 RGB 格式。
 """
 
+from functools import lru_cache
+from typing import Iterable, Iterator
+
+
+@lru_cache(maxsize=512)
+def _hex_to_rgb(hex_color: str) -> int:
+    """解析十六进制颜色字符串（界面调色板通常反复使用少量颜色，结果可缓存）"""
+    # 移除可能的 # 前缀
+    digits = hex_color[1:] if hex_color[:1] == '#' else hex_color
+
+    # 确保是 6 位十六进制
+    if len(digits) == 6:
+        return int(digits, 16)
+    raise ValueError(f"Invalid hex color format: {digits}. Expected 6 characters.")
+
+
+@lru_cache(maxsize=512)
+def _rgb_to_hex(rgb_color: int) -> str:
+    """格式化 RGB 颜色为十六进制字符串"""
+    return f"#{rgb_color:06X}"
+
 
 class ColorUtils:
     """颜色转换工具类"""
@@ -24,12 +45,8 @@ class ColorUtils:
             >>> ColorUtils.rgb_to_bgr(0xFF557F)  # RGB 粉红色
             8345087  # 0x7F55FF (BGR 粉红色)
         """
-        r = (rgb_color >> 16) & 0xFF  # 提取红色分量
-        g = (rgb_color >> 8) & 0xFF   # 提取绿色分量
-        b = rgb_color & 0xFF          # 提取蓝色分量
-
-        # 重新组合为 BGR 格式
-        return (b << 16) | (g << 8) | r
+        # 交换红、蓝分量，绿色分量保持不变
+        return ((rgb_color & 0xFF) << 16) | (rgb_color & 0xFF00) | ((rgb_color >> 16) & 0xFF)
 
     @staticmethod
     def bgr_to_rgb(bgr_color: int) -> int:
@@ -46,12 +63,112 @@ class ColorUtils:
             >>> ColorUtils.bgr_to_rgb(0x7F55FF)  # BGR 粉红色
             16733567  # 0xFF557F (RGB 粉红色)
         """
-        b = (bgr_color >> 16) & 0xFF  # 提取蓝色分量
-        g = (bgr_color >> 8) & 0xFF   # 提取绿色分量
-        r = bgr_color & 0xFF          # 提取红色分量
+        # 交换操作是对称的，与 rgb_to_bgr 相同
+        return ((bgr_color & 0xFF) << 16) | (bgr_color & 0xFF00) | ((bgr_color >> 16) & 0xFF)
 
-        # 重新组合为 RGB 格式
-        return (r << 16) | (g << 8) | b
+    @staticmethod
+    def rgb_to_bgr_bulk(data: bytes) -> bytes:
+        """
+        批量转换紧密排列的 24 位像素数据（RGBRGB... -> BGRBGR...）
+
+        Args:
+            data: RGB 字节序列，长度必须是 3 的倍数
+
+        Returns:
+            bytes: BGR 字节序列（反向转换同样适用）
+
+        Raises:
+            ValueError: 数据长度不是 3 的倍数
+
+        Example:
+            >>> ColorUtils.rgb_to_bgr_bulk(bytes([0xFF, 0x55, 0x7F]))
+            b'\x7fU\xff'
+        """
+        if len(data) % 3:
+            raise ValueError(f"Invalid pixel data length: {len(data)}. Expected a multiple of 3.")
+
+        # 通过切片赋值在 C 层完成红、蓝字节的交换
+        result = bytearray(data)
+        result[0::3] = data[2::3]
+        result[2::3] = data[0::3]
+        return bytes(result)
+
+    @staticmethod
+    def rgb_to_bgr_array(arr):
+        """
+        批量转换颜色数组（需要 numpy）
+
+        转换调色板或帧缓冲等大量颜色时的首选接口，整个数组只需几次向量化运算。
+
+        Args:
+            arr: dtype 为 uint32 的 numpy 数组，元素为 0xRRGGBB 颜色值
+
+        Returns:
+            numpy.ndarray: 转换后的 BGR 颜色数组（反向转换同样适用）
+
+        Raises:
+            ImportError: 未安装 numpy
+
+        Example:
+            >>> ColorUtils.rgb_to_bgr_array(np.array([0xFF557F], dtype=np.uint32))
+            array([8345087], dtype=uint32)
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("请安装 numpy: pip install numpy")
+
+        arr = np.asarray(arr, dtype=np.uint32)
+        return ((arr & 0xFF) << 16) | (arr & 0xFF00) | ((arr >> 16) & 0xFF)
+
+    @staticmethod
+    def decode_rgba_array(colors):
+        """
+        批量分解颜色值的各个分量（需要 numpy）
+
+        Args:
+            colors: 0xAARRGGBB 颜色值序列或 numpy 数组
+
+        Returns:
+            tuple: (红色, 绿色, 蓝色, 透明度) 四个 dtype 为 uint8 的 numpy 数组
+
+        Raises:
+            ImportError: 未安装 numpy
+
+        Example:
+            >>> r, g, b, a = ColorUtils.decode_rgba_array([0xFFFF557F])
+            >>> r, g, b, a
+            (array([255], dtype=uint8), array([85], dtype=uint8), array([127], dtype=uint8), array([255], dtype=uint8))
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("请安装 numpy: pip install numpy")
+
+        arr = np.asarray(colors, dtype=np.uint32)
+        return (
+            ((arr >> 16) & 0xFF).astype(np.uint8),
+            ((arr >> 8) & 0xFF).astype(np.uint8),
+            (arr & 0xFF).astype(np.uint8),
+            ((arr >> 24) & 0xFF).astype(np.uint8),
+        )
+
+    @staticmethod
+    def rgb_to_bgr_iter(colors: Iterable[int]) -> Iterator[int]:
+        """
+        逐个转换颜色（纯 Python 实现，不依赖 numpy）
+
+        Args:
+            colors: RGB 颜色值序列
+
+        Returns:
+            Iterator[int]: BGR 颜色值迭代器
+
+        Example:
+            >>> list(ColorUtils.rgb_to_bgr_iter([0xFF557F, 0x0000FF]))
+            [8345087, 16711680]
+        """
+        return map(ColorUtils.rgb_to_bgr, colors)
 
     @staticmethod
     def rgb_values_to_bgr(r: int, g: int, b: int) -> int:
@@ -102,14 +219,16 @@ class ColorUtils:
         Returns:
             tuple[int, int, int]: (红色, 绿色, 蓝色) 分量值
 
+        Raises:
+            ValueError: 颜色值超出 0x000000-0xFFFFFF 范围
+
         Example:
             >>> ColorUtils.extract_rgb_components(0xFF557F)
             (255, 85, 127)
         """
-        r = (rgb_color >> 16) & 0xFF
-        g = (rgb_color >> 8) & 0xFF
-        b = rgb_color & 0xFF
-        return r, g, b
+        if not 0 <= rgb_color <= 0xFFFFFF:
+            raise ValueError(f"Invalid color value: {rgb_color:#x}. Expected 0x000000-0xFFFFFF.")
+        return tuple(rgb_color.to_bytes(3, 'big'))
 
     @staticmethod
     def extract_bgr_components(bgr_color: int) -> tuple[int, int, int]:
@@ -122,14 +241,16 @@ class ColorUtils:
         Returns:
             tuple[int, int, int]: (蓝色, 绿色, 红色) 分量值
 
+        Raises:
+            ValueError: 颜色值超出 0x000000-0xFFFFFF 范围
+
         Example:
             >>> ColorUtils.extract_bgr_components(0x7F55FF)
             (127, 85, 255)
         """
-        b = (bgr_color >> 16) & 0xFF
-        g = (bgr_color >> 8) & 0xFF
-        r = bgr_color & 0xFF
-        return b, g, r
+        if not 0 <= bgr_color <= 0xFFFFFF:
+            raise ValueError(f"Invalid color value: {bgr_color:#x}. Expected 0x000000-0xFFFFFF.")
+        return tuple(bgr_color.to_bytes(3, 'big'))
 
     @staticmethod
     def hex_to_rgb(hex_color: str) -> int:
@@ -148,14 +269,7 @@ class ColorUtils:
             >>> ColorUtils.hex_to_rgb("FF557F")
             16733567  # 0xFF557F
         """
-        # 移除可能的 # 前缀
-        hex_color = hex_color.lstrip('#')
-        
-        # 确保是 6 位十六进制
-        if len(hex_color) != 6:
-            raise ValueError(f"Invalid hex color format: {hex_color}. Expected 6 characters.")
-        
-        return int(hex_color, 16)
+        return _hex_to_rgb(hex_color)
 
     @staticmethod
     def rgb_to_hex(rgb_color: int) -> str:
@@ -172,4 +286,4 @@ class ColorUtils:
             >>> ColorUtils.rgb_to_hex(16733567)
             "#FF557F"
         """
-        return f"#{rgb_color:06X}"
+        return _rgb_to_hex(rgb_color)
@@ -5,7 +5,7 @@ OBS SDK 安装脚本
 用于将 obs_sdk 安装为可导入的 Python 包。
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 
 # 读取 README 文件
@@ -25,7 +25,14 @@ setup(
     author="OBS SDK Team",
     author_email="",
     url="https://github.com/your-repo/obs-sdk",
-    packages=find_packages(),
+    # 显式列出包，避免每次安装时扫描目录；新增子包时需同步更新
+    packages=[
+        "obs_sdk",
+        "obs_sdk.core",
+        "obs_sdk.managers",
+        "obs_sdk.types",
+        "obs_sdk.utils",
+    ],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -47,9 +54,13 @@ setup(
         "dev": [
             "pytest",
             "pytest-cov",
+            "pytest-xdist",
             "black",
             "flake8",
         ],
+        "numpy": [
+            "numpy",
+        ],
     },
     entry_points={
         "console_scripts": [
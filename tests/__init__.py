@@ -0,0 +1,290 @@
+"""
+OBS SDK 测试包
+
+运行全部 unittest 测试：
+    python -m unittest discover tests
+
+需要真实 OBS 连接的测试模块将 require_obs 作为 setUpModule 导入，
+同一进程中的所有测试共享一个 OBSManager 连接，避免每个测试类重复握手。
+（不直接命名为 setUpModule，否则 pytest 会把它当作整个测试包的初始化，
+连不上 OBS 时连基于 Mock 的测试也会被跳过。）
+"""
+
+import atexit
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+import unittest
+import uuid
+
+# 添加项目根目录到 Python 路径
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+class SharedOBS:
+    """进程内共享的 OBS 连接"""
+
+    obs = None
+    connect_failed = False
+    prewarm_started = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """
+        获取共享的 OBSManager
+
+        首次调用时建立连接，进程退出时自动断开。连接失败后不再重试。
+        预热线程正在连接时，等待其完成后直接复用结果。
+
+        Returns:
+            OBSManager: 已连接的管理器，连接失败返回 None
+        """
+        with cls._lock:
+            return cls._get_locked()
+
+    @classmethod
+    def _get_locked(cls):
+        if cls.obs is None and not cls.connect_failed:
+            from obs_sdk import OBSManager
+
+            obs = OBSManager(auto_connect=False)
+            try:
+                connected = obs.connect()
+            except Exception:
+                connected = False
+
+            if connected:
+                cls.obs = obs
+                atexit.register(cls.close)
+            else:
+                cls.connect_failed = True
+
+        return cls.obs
+
+    @classmethod
+    def prewarm(cls):
+        """
+        在后台线程中提前建立共享连接
+
+        在收集测试时调用，握手与收集并行进行，第一个用到连接的测试不必再等待握手。
+        """
+        cls.prewarm_started = True
+        threading.Thread(target=cls.get, name="obs-prewarm", daemon=True).start()
+
+    @classmethod
+    def close(cls):
+        """断开共享连接"""
+        if cls.obs is not None:
+            cls.obs.disconnect()
+            cls.obs = None
+
+
+def require_obs():
+    """模块级初始化：确保共享连接可用，否则跳过整个模块"""
+    if SharedOBS.get() is None:
+        raise unittest.SkipTest("无法连接到 OBS Studio，请确保 OBS 正在运行且 WebSocket 服务器已启用")
+
+
+def use_obs(obs=None):
+    """
+    复用调用方传入的连接；未传入时新建一个（单独调用测试函数时）
+
+    Args:
+        obs: 已连接的 OBSManager
+
+    Returns:
+        上下文管理器，进入时返回可用的 OBSManager
+    """
+    if obs is not None:
+        return contextlib.nullcontext(obs)
+
+    from obs_sdk import OBSManager
+    return OBSManager()
+
+
+class EventWaiter:
+    """
+    等待指定输入源的 OBS 事件
+
+    在发出请求前进入上下文注册回调，请求后调用 wait() 等待对应事件，
+    代替固定时长的 time.sleep()。事件按输入源名称分别记录，
+    在 wait() 之前到达的事件不会丢失。
+    """
+
+    def __init__(self, obs, event_type, key="inputName"):
+        """
+        初始化等待器
+
+        Args:
+            obs: 已连接的 OBSManager
+            event_type: 事件类型，如 'InputRemoved'
+            key: 事件数据中标识输入源的字段
+        """
+        self.obs = obs
+        self.event_type = event_type
+        self.key = key
+        self._lock = threading.Lock()
+        self._events = {}
+        self._data = {}
+
+    def _slot(self, name):
+        with self._lock:
+            if name not in self._events:
+                self._events[name] = threading.Event()
+            return self._events[name]
+
+    def _on_event(self, event):
+        name = event.datain.get(self.key)
+        self._data[name] = event.datain
+        self._slot(name).set()
+
+    def __enter__(self):
+        self.obs.register_event_callback(self._on_event, self.event_type)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.obs.unregister_event_callback(self._on_event, self.event_type)
+
+    def wait(self, name, timeout=2.0):
+        """
+        等待指定输入源的下一个事件
+
+        Args:
+            name: 输入源名称
+            timeout: 超时时间（秒）
+
+        Returns:
+            dict: 事件数据，超时返回 None
+        """
+        evt = self._slot(name)
+        if not evt.wait(timeout):
+            return None
+        evt.clear()
+        return self._data.pop(name, None)
+
+    def wait_all(self, names, timeout=2.0):
+        """
+        等待多个输入源的事件全部到达
+
+        Args:
+            names: 输入源名称列表
+            timeout: 总超时时间（秒）
+
+        Returns:
+            bool: 是否在超时前收到全部事件
+        """
+        deadline = time.monotonic() + timeout
+        return all(self.wait(name, max(0.0, deadline - time.monotonic())) is not None
+                   for name in names)
+
+
+def wait_until(predicate, timeout=1.0, interval=0.02):
+    """
+    轮询等待条件成立
+
+    用于没有对应事件可等、或需要确认事件之后的状态时，代替固定时长的 time.sleep()，
+    条件一成立立即返回。
+
+    Args:
+        predicate: 无参数的判断函数
+        timeout: 超时时间（秒）
+        interval: 轮询间隔（秒）
+
+    Returns:
+        bool: 超时前条件是否成立
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(interval)
+    return bool(predicate())
+
+
+# 各平台的音频采集输入类型，按优先级排列
+AUDIO_INPUT_KINDS = ("wasapi_input_capture", "pulse_input_capture", "coreaudio_input_capture")
+
+
+@contextlib.contextmanager
+def temp_audio_input(obs):
+    """
+    创建一个临时音频输入源供多个测试共用，退出时删除
+
+    删除后等待 InputRemoved 事件确认，不再轮询输入源列表。
+
+    Args:
+        obs: 已连接的 OBSManager
+
+    Yields:
+        str: 输入源名称；当前平台没有音频采集类型或创建失败时为 None
+    """
+    kinds = obs.inputs.get_input_kinds_cached()
+    kind = next((k for k in AUDIO_INPUT_KINDS if k in kinds), None)
+    scenes = obs.scenes.get_names_cached()
+    if kind is None or not scenes:
+        yield None
+        return
+
+    name = f"pytest_audio_{uuid.uuid4().hex}"
+    result = obs.inputs.create_input(
+        input_name=name,
+        input_kind=kind,
+        scene_name=scenes[0],
+        input_settings={},
+        check_duplicates=False
+    )
+    if not result.get('success'):
+        yield None
+        return
+
+    try:
+        yield name
+    finally:
+        with EventWaiter(obs, 'InputRemoved') as removed:
+            if obs.inputs.remove_input(input_name=name):
+                removed.wait(name)
+
+
+class Printer:
+    """
+    测试输出写入器
+
+    用法与 print 相同。输出到终端时逐行打印以保持实时反馈；
+    重定向到文件或管道时先写入缓冲区，调用 flush() 时一次性写出。
+    """
+
+    def __init__(self, stream=None):
+        """
+        初始化写入器
+
+        Args:
+            stream: 输出流，为 None 时使用当前的 sys.stdout
+        """
+        self._stream = stream
+        self._buf = io.StringIO()
+
+    @property
+    def stream(self):
+        """实际的输出流（未指定时每次取当前的 sys.stdout，兼容输出被捕获的情况）"""
+        return self._stream if self._stream is not None else sys.stdout
+
+    def __call__(self, *args, sep=" ", end="\n"):
+        stream = self.stream
+        if stream.isatty():
+            print(*args, sep=sep, end=end, file=stream)
+        else:
+            print(*args, sep=sep, end=end, file=self._buf)
+
+    def flush(self):
+        """将缓冲的内容一次性写出"""
+        text = self._buf.getvalue()
+        if text:
+            self._buf = io.StringIO()
+            self.stream.write(text)
+        self.stream.flush()
@@ -0,0 +1,71 @@
+"""
+pytest 配置
+
+在收集测试前把项目根目录加入 sys.path，并提供整个会话共享的 OBS 连接。
+"""
+
+import os
+import sys
+
+import pytest
+
+# 添加项目根目录到 Python 路径（只需在这里设置一次）
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from tests import SharedOBS, require_obs, temp_audio_input
+
+
+def pytest_configure(config):
+    """注册 xdist_group 标记，未安装 pytest-xdist 时也不产生未知标记警告"""
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): 同组测试由同一个 xdist worker 串行执行（需配合 --dist loadgroup）"
+    )
+
+
+def _needs_obs(item):
+    """测试是否使用真实 OBS 连接（依赖 obs fixture，或所在模块以 require_obs 作为 setUpModule）"""
+    if "obs" in getattr(item, "fixturenames", ()):
+        return True
+    module = getattr(item, "module", None)
+    return getattr(module, "setUpModule", None) is require_obs
+
+
+def pytest_itemcollected(item):
+    """
+    收集到第一个需要 OBS 的测试时在后台预热连接
+
+    握手与剩余的收集并行进行；只运行纯单元测试时不会尝试连接 OBS。
+    使用 xdist 时每个 worker 各自预热自己的连接。
+    """
+    if not SharedOBS.prewarm_started and _needs_obs(item):
+        SharedOBS.prewarm()
+
+
+@pytest.fixture(scope="session")
+def obs():
+    """整个测试会话共享的 OBSManager，与 unittest 测试使用同一个连接"""
+    manager = SharedOBS.get()
+    if manager is None:
+        pytest.skip("无法连接到 OBS Studio，请确保 OBS 正在运行且 WebSocket 服务器已启用")
+    yield manager
+
+
+@pytest.fixture(scope="session")
+def test_scene(obs):
+    """创建测试输入源所用的场景，整个会话只获取一次场景列表"""
+    scenes = obs.scenes.get_names_cached()
+    if not scenes:
+        pytest.skip("没有可用的场景")
+    return scenes[0]
+
+
+@pytest.fixture(scope="module")
+def audio_input(obs):
+    """模块内共享的临时音频输入源，静音、设置等测试直接使用，模块结束时删除"""
+    with temp_audio_input(obs) as name:
+        if name is None:
+            pytest.skip("当前平台没有可用的音频采集输入类型")
+        yield name
@@ -19,15 +19,19 @@
 
 import sys
 import argparse
-import logging
 from pathlib import Path
 
 # 添加项目根目录到 Python 路径
-project_root = Path(__file__).parent.parent  # 上一级目录是项目根目录
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent)  # 上一级目录是项目根目录
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from obs_sdk import OBSManager, OBSConfig
-from obs_sdk.exceptions import OBSConnectionError
+from tests import Printer
+
+
+# 非交互运行时缓冲输出，按段落一次性写出
+out = Printer()
 
 
 def check_obs_connection(config: OBSConfig) -> bool:
@@ -40,38 +44,40 @@ def check_obs_connection(config: OBSConfig) -> bool:
     Returns:
         bool: 连接是否成功
     """
-    print("正在检查 OBS 连接...")
-    print(f"连接地址: {config.get_websocket_url()}")
+    out("正在检查 OBS 连接...")
+    out(f"连接地址: {config.get_websocket_url()}")
     
     try:
         obs = OBSManager(config, auto_connect=False)
         if obs.connect():
-            print("✓ 成功连接到 OBS Studio")
+            out("✓ 成功连接到 OBS Studio")
             
             # 获取版本信息
             version_info = obs.get_version()
             if version_info:
-                print(f"✓ OBS 版本: {version_info.get('obsVersion', 'Unknown')}")
-                print(f"✓ WebSocket 版本: {version_info.get('obsWebSocketVersion', 'Unknown')}")
+                out(f"✓ OBS 版本: {version_info.get('obsVersion', 'Unknown')}")
+                out(f"✓ WebSocket 版本: {version_info.get('obsWebSocketVersion', 'Unknown')}")
             
             # 获取基本信息
             scenes = obs.scenes.get_names()
-            print(f"✓ 发现 {len(scenes)} 个场景: {scenes}")
+            out(f"✓ 发现 {len(scenes)} 个场景: {scenes}")
             
             current_scene = obs.scenes.get_current_program()
             if current_scene:
-                print(f"✓ 当前场景: {current_scene}")
+                out(f"✓ 当前场景: {current_scene}")
             
             obs.disconnect()
             return True
             
         else:
-            print("✗ 无法连接到 OBS Studio")
+            out("✗ 无法连接到 OBS Studio")
             return False
             
     except Exception as e:
-        print(f"✗ 连接失败: {e}")
+        out(f"✗ 连接失败: {e}")
         return False
+    finally:
+        out.flush()
 
 
 def run_tests(verbose: bool = False, test_method: str = None):
@@ -82,6 +88,7 @@ def run_tests(verbose: bool = False, test_method: str = None):
         verbose: 是否详细输出
         test_method: 特定的测试方法名
     """
+    import logging
     import unittest
     
     # 配置日志级别
@@ -104,30 +111,32 @@ def run_tests(verbose: bool = False, test_method: str = None):
         loader = unittest.TestLoader()
         suite = loader.loadTestsFromTestCase(TestSceneManager)
     
-    # 运行测试
+    # 运行测试（unittest 直接写 stderr，先写出已缓冲的内容以保持顺序）
+    out.flush()
     runner = unittest.TextTestRunner(verbosity=2 if verbose else 1)
     result = runner.run(suite)
     
     # 输出结果摘要
-    print("\n" + "="*50)
-    print("测试结果摘要:")
-    print(f"运行测试: {result.testsRun}")
-    print(f"失败: {len(result.failures)}")
-    print(f"错误: {len(result.errors)}")
-    print(f"跳过: {len(result.skipped)}")
+    out("\n" + "="*50)
+    out("测试结果摘要:")
+    out(f"运行测试: {result.testsRun}")
+    out(f"失败: {len(result.failures)}")
+    out(f"错误: {len(result.errors)}")
+    out(f"跳过: {len(result.skipped)}")
     
     if result.failures:
-        print("\n失败的测试:")
+        out("\n失败的测试:")
         for test, traceback in result.failures:
-            print(f"  - {test}: {traceback.split('AssertionError:')[-1].strip()}")
+            out(f"  - {test}: {traceback.split('AssertionError:')[-1].strip()}")
     
     if result.errors:
-        print("\n错误的测试:")
+        out("\n错误的测试:")
         for test, traceback in result.errors:
-            print(f"  - {test}: {traceback.split('Exception:')[-1].strip()}")
+            out(f"  - {test}: {traceback.split('Exception:')[-1].strip()}")
     
     success = len(result.failures) == 0 and len(result.errors) == 0
-    print(f"\n测试结果: {'✓ 成功' if success else '✗ 失败'}")
+    out(f"\n测试结果: {'✓ 成功' if success else '✗ 失败'}")
+    out.flush()
     
     return success
 
@@ -169,33 +178,36 @@ def main():
     # 创建配置
     config = OBSConfig()
     
-    print("OBS 场景管理器测试工具")
-    print("="*50)
+    out("OBS 场景管理器测试工具")
+    out("="*50)
     
     # 检查连接
     if not check_obs_connection(config):
-        print("\n请检查以下事项:")
-        print("1. OBS Studio 是否正在运行")
-        print("2. WebSocket 服务器是否已启用（工具 -> WebSocket 服务器设置）")
-        print("3. 连接参数是否正确（host, port, password）")
-        print(f"4. 当前配置: {config.get_websocket_url()}")
+        out("\n请检查以下事项:")
+        out("1. OBS Studio 是否正在运行")
+        out("2. WebSocket 服务器是否已启用（工具 -> WebSocket 服务器设置）")
+        out("3. 连接参数是否正确（host, port, password）")
+        out(f"4. 当前配置: {config.get_websocket_url()}")
+        out.flush()
         return False
     
     # 如果只是检查配置，则退出
     if args.config_check:
-        print("\n配置检查完成！")
+        out("\n配置检查完成！")
+        out.flush()
         return True
     
-    print("\n开始运行测试...")
-    print("="*50)
+    out("\n开始运行测试...")
+    out("="*50)
     
     # 运行测试
     success = run_tests(args.verbose, args.test_method)
     
     if success:
-        print("\n🎉 所有测试通过！")
+        out("\n🎉 所有测试通过！")
     else:
-        print("\n❌ 部分测试失败，请检查输出信息")
+        out("\n❌ 部分测试失败，请检查输出信息")
+    out.flush()
     
     return success
 
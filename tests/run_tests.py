@@ -5,6 +5,7 @@ OBS SDK 测试运行器
 统一的测试运行脚本，支持运行所有测试模块。
 
 使用方法：
+    python -m unittest discover tests            # 只运行基于 unittest 的测试（共享一个连接）
     python tests/run_tests.py                    # 运行所有测试
     python tests/run_tests.py --scenes           # 只运行场景测试
     python tests/run_tests.py --inputs           # 只运行输入测试
@@ -15,10 +16,12 @@ OBS SDK 测试运行器
 import sys
 import os
 import argparse
-import time
+import importlib
 
-# 添加项目根目录到 Python 路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 添加项目根目录到 Python 路径（已存在时不重复插入）
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from obs_sdk import OBSManager, OBSConfig
 
@@ -52,22 +55,40 @@ def run_scenes_tests():
     print("="*60)
     
     try:
-        # 导入并运行场景测试
+        # 场景测试依赖 setUp/tearDown 创建和清理场景，仍使用 unittest 运行；
+        # argv 只保留脚本名，避免 unittest 解析本脚本的命令行参数
         import unittest
-        from test_scenes import TestSceneManager
+        test_scenes = importlib.import_module("tests.test_scenes")
         
-        # 创建测试套件
-        suite = unittest.TestLoader().loadTestsFromTestCase(TestSceneManager)
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
+        program = unittest.main(module=test_scenes, argv=sys.argv[:1], exit=False, verbosity=1)
         
-        return result.wasSuccessful()
+        return program.result.wasSuccessful()
         
     except Exception as e:
         print(f"❌ 场景测试失败: {e}")
         return False
 
 
+def run_unittest_tests():
+    """通过 unittest 发现并运行所有基于 unittest 的测试"""
+    print("\n" + "="*60)
+    print("🧪 运行 unittest 测试")
+    print("="*60)
+    
+    try:
+        import unittest
+        
+        tests_dir = os.path.dirname(os.path.abspath(__file__))
+        suite = unittest.TestLoader().discover(tests_dir, top_level_dir=os.path.dirname(tests_dir))
+        result = unittest.TextTestRunner(verbosity=2).run(suite)
+        
+        return result.wasSuccessful()
+        
+    except Exception as e:
+        print(f"❌ unittest 测试失败: {e}")
+        return False
+
+
 def run_inputs_tests():
     """运行输入管理测试"""
     print("\n" + "="*60)
@@ -75,10 +96,11 @@ def run_inputs_tests():
     print("="*60)
     
     try:
-        # 导入并运行输入测试
-        from test_inputs import main as run_comprehensive_test
-
-        return run_comprehensive_test()
+        # 输入测试是 pytest 测试（依赖 conftest 中的 obs、audio_input fixture），交给 pytest 收集运行
+        import pytest
+        tests_dir = os.path.dirname(os.path.abspath(__file__))
+        
+        return pytest.main([os.path.join(tests_dir, "test_inputs.py"), "-q"]) == 0
         
     except Exception as e:
         print(f"❌ 输入测试失败: {e}")
@@ -97,11 +119,9 @@ def run_examples():
     # 运行输入类型示例
     try:
         print("\n📋 输入类型列表示例:")
-        # 需要切换到项目根目录来导入示例
-        import sys
-        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        from examples.input_kinds_demo import main as input_kinds_example
-        input_kinds_example()
+        # 项目根目录已在模块导入时加入 sys.path
+        input_kinds_demo = importlib.import_module("examples.input_kinds_demo")
+        input_kinds_demo.main()
         examples_passed += 1
         print("✅ 输入类型示例完成")
     except Exception as e:
@@ -124,12 +144,12 @@ def run_all_tests():
     
     results = []
     
-    # 运行场景测试
+    # 运行 unittest 测试（场景管理、特殊输入源等），所有测试共享一个连接
     try:
-        results.append(("场景管理", run_scenes_tests()))
+        results.append(("unittest 测试", run_unittest_tests()))
     except Exception as e:
-        print(f"❌ 场景测试异常: {e}")
-        results.append(("场景管理", False))
+        print(f"❌ unittest 测试异常: {e}")
+        results.append(("unittest 测试", False))
     
     # 运行输入测试
     try:
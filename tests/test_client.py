@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+OBS 客户端测试
+
+测试 OBSClient.call() 在多线程下分配请求 ID 和匹配响应的逻辑，
+以及共享客户端的复用和引用计数（使用模拟的 obsws，不需要 OBS）
+"""
+
+import json
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from obswebsocket import requests
+
+from obs_sdk.core.client import OBSClient
+from obs_sdk.core.config import OBSConfig
+from obs_sdk.core.exceptions import OBSRequestError
+
+
+class FakeSocket:
+    """模拟 websocket：每收到一个请求帧，就在另一个线程中把请求数据原样作为响应返回"""
+
+    connected = True
+
+    def __init__(self, core):
+        self.core = core
+        self.sent_ids = []
+        self._lock = threading.Lock()
+
+    def send(self, payload):
+        data = json.loads(payload)["d"]
+        with self._lock:
+            self.sent_ids.append(data["requestId"])
+        threading.Thread(target=self._answer, args=(data,)).start()
+
+    def _answer(self, data):
+        """模拟 obs-websocket-py 接收线程的分发逻辑"""
+        request_id = data["requestId"]
+        if request_id in self.core.events:
+            self.core.answers[request_id] = {
+                "requestId": request_id,
+                "requestStatus": {"result": True},
+                "responseData": dict(data["requestData"]),
+            }
+            self.core.events[request_id].set()
+
+
+class HeldSocket(FakeSocket):
+    """收齐指定数量的请求帧后才开始响应，模拟只有批量发送才能在超时前完成的情况"""
+
+    def __init__(self, core, hold_until):
+        super().__init__(core)
+        self.hold_until = hold_until
+        self._held = []
+
+    def send(self, payload):
+        data = json.loads(payload)["d"]
+        with self._lock:
+            self.sent_ids.append(data["requestId"])
+            self._held.append(data)
+            if len(self._held) < self.hold_until:
+                return
+            held, self._held = self._held, []
+        for item in held:
+            threading.Thread(target=self._answer, args=(item,)).start()
+
+
+class FakeObsws:
+    """模拟 obsws 中 OBSClient 用到的属性"""
+
+    def __init__(self):
+        self.id = 1
+        self.timeout = 2
+        self.events = {}
+        self.answers = {}
+        self.ws = FakeSocket(self)
+
+
+class TestClientCall(unittest.TestCase):
+    """客户端请求测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.client = OBSClient(OBSConfig())
+        self.client._ws = FakeObsws()
+        self.client._connected = True
+
+    def test_concurrent_calls_get_own_responses(self):
+        """测试多个线程同时发请求时，请求 ID 不重复且各自收到自己的响应"""
+        names = [f"输入{i}" for i in range(200)]
+
+        def fetch(name):
+            response = self.client.call(requests.GetInputSettings(inputName=name), max_retries=0)
+            return response.datain["inputName"]
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(fetch, names))
+
+        self.assertEqual(results, names)
+        sent_ids = self.client._ws.ws.sent_ids
+        self.assertEqual(len(set(sent_ids)), len(names))
+        self.assertEqual(self.client._ws.events, {})
+
+    def test_call_batch_sends_all_before_waiting(self):
+        """测试批量请求先发出全部请求帧再等待响应，结果与请求顺序一致"""
+        names = [f"输入{i}" for i in range(5)]
+        ws = self.client._ws
+        ws.timeout = 0.5
+        ws.ws = HeldSocket(ws, hold_until=len(names))
+
+        responses = self.client.call_batch(
+            [requests.GetInputSettings(inputName=name) for name in names]
+        )
+
+        self.assertEqual([response.datain["inputName"] for response in responses], names)
+        self.assertEqual(ws.events, {})
+
+    def test_call_batch_timeout_discards_pending_answers(self):
+        """测试批量请求中途超时后，已到达但未读取的响应不会留在 obsws 中"""
+        ws = self.client._ws
+        ws.timeout = 0.2
+        answer = ws.ws._answer
+
+        def drop_first(data):
+            if data["requestData"]["inputName"] != "a":
+                answer(data)
+
+        ws.ws._answer = drop_first
+        with self.assertRaises(OBSRequestError):
+            self.client.call_batch(
+                [requests.GetInputSettings(inputName=name) for name in ("a", "b", "c")]
+            )
+
+        self.assertEqual(ws.events, {})
+        self.assertEqual(ws.answers, {})
+
+    def test_call_batch_halt_on_failure_sends_one_by_one(self):
+        """测试 halt_on_failure 时逐个发送，失败后不再发送后续请求"""
+        ws = self.client._ws
+        answer = ws.ws._answer
+
+        def fail_second(data):
+            if data["requestData"]["inputName"] == "b":
+                request_id = data["requestId"]
+                ws.answers[request_id] = {"requestStatus": {"result": False}}
+                ws.events[request_id].set()
+            else:
+                answer(data)
+
+        ws.ws._answer = fail_second
+        responses = self.client.call_batch(
+            [requests.GetInputSettings(inputName=name) for name in ("a", "b", "c")],
+            halt_on_failure=True
+        )
+
+        self.assertEqual([response.status for response in responses], [True, False])
+        self.assertEqual(len(ws.ws.sent_ids), 2)
+
+
+class TestSharedClient(unittest.TestCase):
+    """共享客户端测试类"""
+
+    def setUp(self):
+        """测试前准备"""
+        self.config = OBSConfig(host="shared-test", port=4455)
+
+    def test_same_config_reuses_client(self):
+        """测试配置相同时复用同一个客户端"""
+        first = OBSClient.get_shared(self.config)
+        second = OBSClient.get_shared(OBSConfig(host="shared-test", port=4455))
+        try:
+            self.assertIs(first, second)
+        finally:
+            first.release()
+            second.release()
+
+    def test_different_password_gets_own_client(self):
+        """测试同一 host:port 但密码不同时不复用"""
+        first = OBSClient.get_shared(self.config)
+        second = OBSClient.get_shared(OBSConfig(host="shared-test", port=4455, password="other"))
+        try:
+            self.assertIsNot(first, second)
+            self.assertEqual(second.config.password, "other")
+        finally:
+            first.release()
+            second.release()
+
+    def test_release_disconnects_last_holder_only(self):
+        """测试只有最后一个持有者归还时才断开连接"""
+        first = OBSClient.get_shared(self.config)
+        second = OBSClient.get_shared(self.config)
+        with patch.object(first, 'disconnect') as disconnect:
+            first.release()
+            disconnect.assert_not_called()
+
+            second.release()
+            disconnect.assert_called_once()
+
+        # 全部归还后重新获取会得到新的客户端
+        third = OBSClient.get_shared(self.config)
+        try:
+            self.assertIsNot(third, first)
+        finally:
+            third.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,269 +2,310 @@
 """
 颜色格式测试
 
-测试不同的颜色格式在 OBS 中的显示效果
+测试不同的颜色格式在 OBS 中的显示效果，每个测试结束时删除自己创建的输入源
+
+使用 pytest 运行（连接和测试场景由 tests/conftest.py 中的会话级 fixture 提供）：
+    python -m pytest tests/test_color_formats.py
+
+也可以直接运行脚本：
+    python tests/test_color_formats.py
 """
 
 import sys
 import os
-import time
+import re
+import contextlib
+from uuid import uuid4
 
-# 添加项目根目录到 Python 路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+
+# 直接运行脚本时添加项目根目录到 Python 路径（pytest 下已由 conftest.py 设置）
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from obs_sdk import OBSManager
+from obs_sdk.utils import ColorUtils
+from tests import Printer, use_obs
+
+
+# 本模块的测试会创建或删除输入源，并行运行时固定在同一个 worker 上
+pytestmark = pytest.mark.xdist_group("obs_mutation")
+
+# 非交互运行时缓冲输出，每个测试结束后一次性写出
+out = Printer()
+
+# 输出分隔线
+SEP20 = "=" * 20
+SEP50 = "=" * 50
+SEP60 = "=" * 60
+HEADER_FMT = SEP20 + " {} " + SEP20
+
+# 测试输入源名称特征
+_TEST_NAME_RE = re.compile(r'测试_|Test_')
 
 
-def test_color_formats():
-    """测试不同的颜色格式"""
-    print("🎨 测试不同的颜色格式")
-    print("=" * 50)
+def decode_components(values):
+    """
+    一次性分解一组颜色值的 (红, 绿, 蓝, 透明度) 分量（按 0xAARRGGBB 解读）
     
+    安装了 numpy 时使用向量化运算，否则逐个用位运算分解。
+    """
     try:
-        with OBSManager() as obs:
-            # 获取场景
-            scenes = obs.scenes.get_names()
-            if not scenes:
-                print("❌ 没有可用的场景")
-                return False
-            
-            test_scene = scenes[0]
-            
-            # 定义要测试的红色格式
-            red_formats = [
-                ("RGB_HEX", 0xFF0000),           # 标准 RGB 十六进制
-                ("RGB_DEC", 16711680),           # 标准 RGB 十进制
-                ("BGR_HEX", 0x0000FF),           # BGR 格式
-                ("BGR_DEC", 255),                # BGR 十进制
-                ("ARGB_HEX", 0xFFFF0000),        # ARGB 格式
-                ("RGBA_HEX", 0xFF0000FF),        # RGBA 格式
-                ("ABGR_HEX", 0xFF0000FF),        # ABGR 格式
-            ]
-            
-            print("创建不同颜色格式的文本输入源:")
-            created_inputs = []
-            
-            for format_name, color_value in red_formats:
-                test_name = f"红色测试_{format_name}_{int(time.time())}"
-                
-                print(f"\n测试 {format_name}: {color_value} (0x{color_value:08X})")
-                
-                try:
-                    result = obs.inputs.create_input(
-                        input_name=test_name,
-                        input_kind="text_gdiplus_v3",
-                        scene_name=test_scene,
-                        input_settings={
-                            "text": f"红色 {format_name}",
-                            "color": color_value,
-                            "align": "center",
-                            "valign": "center",
-                            "font": {
-                                "face": "微软雅黑",
-                                "size": 48
-                            }
-                        }
-                    )
-                    
-                    if result.get('success'):
-                        print(f"✅ 创建成功: {test_name}")
-                        created_inputs.append(test_name)
-                    else:
-                        print(f"❌ 创建失败")
-                        
-                except Exception as e:
-                    print(f"❌ 创建异常: {e}")
-            
-            print(f"\n🎯 请在 OBS 中查看这些文本的颜色:")
-            for name in created_inputs:
-                print(f"  - {name}")
-            
-            print(f"\n⚠️ 注意: 测试输入源未被自动删除，请手动清理或运行清理脚本")
-            
-            return len(created_inputs) > 0
-            
-    except Exception as e:
-        print(f"❌ 测试失败: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        return list(zip(*(channel.tolist() for channel in ColorUtils.decode_rgba_array(values))))
+    except ImportError:
+        return [((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF, (v >> 24) & 0xFF) for v in values]
+
+
+def group_formats(formats):
+    """
+    合并颜色值相同的格式
+    
+    相同的颜色值在 OBS 中显示效果一样，只需创建一个输入源。
+    
+    Returns:
+        List[Tuple[str, int]]: (以 "+" 连接的格式名称, 颜色值)，保持首次出现的顺序
+    """
+    grouped = {}
+    for format_name, color_value in formats:
+        grouped.setdefault(color_value, []).append(format_name)
+    return [("+".join(names), color_value) for color_value, names in grouped.items()]
+
+
+def print_components(formats):
+    """打印一组 (格式名称, 颜色值) 的 RGB 分量"""
+    out("\n颜色分量 (按 0xAARRGGBB 解读):")
+    for (format_name, _), (r, g, b, a) in zip(formats, decode_components([v for _, v in formats])):
+        out(f"  {format_name}: R={r}, G={g}, B={b}, A={a}")
+
+
+def _build_color_batch(test_scene, formats, label, font_size):
+    """
+    为每种颜色值构建一个文本输入源的创建参数（颜色值相同的格式合并为一个）
+    
+    Returns:
+        List[Dict]: 可直接传给 create_inputs_batch() 的参数列表
+    """
+    print_components(formats)
+    
+    # 先收集所有输入源的参数，再一次性批量创建
+    batch = []
+    suffix = uuid4().hex[:8]
+    for format_name, color_value in group_formats(formats):
+        out(f"\n测试 {format_name}: {color_value} (0x{color_value:08X})")
+        batch.append({
+            "input_name": f"{label}测试_{format_name}_{suffix}",
+            "input_kind": "text_gdiplus_v3",
+            "scene_name": test_scene,
+            "input_settings": {
+                "text": f"{label} {format_name}",
+                "color": color_value,
+                "align": "center",
+                "valign": "center",
+                "font": {
+                    "face": "微软雅黑",
+                    "size": font_size
+                }
+            }
+        })
+    
+    return batch
+
+
+def _check_created(results):
+    """输出并断言每个输入源都创建成功"""
+    for result in results:
+        out(f"{'✅ 创建成功' if result.get('success') else '❌ 创建失败'}: {result['input_name']}")
+    failed = [result['input_name'] for result in results if not result.get('success')]
+    assert not failed, f"创建失败: {failed}"
+
+
+def test_color_formats(obs, test_scene):
+    """
+    测试不同的颜色格式
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+        test_scene: 创建测试输入源所用的场景
+    """
+    out("🎨 测试不同的颜色格式")
+    out(SEP50)
+    
+    # 定义要测试的红色格式
+    red_formats = [
+        ("RGB_HEX", 0xFF0000),           # 标准 RGB 十六进制
+        ("RGB_DEC", 16711680),           # 标准 RGB 十进制
+        ("BGR_HEX", 0x0000FF),           # BGR 格式
+        ("BGR_DEC", 255),                # BGR 十进制
+        ("ARGB_HEX", 0xFFFF0000),        # ARGB 格式
+        ("RGBA_HEX", 0xFF0000FF),        # RGBA 格式
+        ("ABGR_HEX", 0xFF0000FF),        # ABGR 格式
+    ]
+    
+    out("创建不同颜色格式的文本输入源:")
+    batch = _build_color_batch(test_scene, red_formats, "红色", 48)
+    try:
+        _check_created(obs.inputs.create_inputs_batch(batch))
+    finally:
+        # 中途失败时也删除已创建的输入源
+        obs.inputs.remove_inputs_batch([params["input_name"] for params in batch])
+        out.flush()
 
 
-def test_specific_colors():
-    """测试特定颜色值"""
-    print("\n🌈 测试特定颜色值")
-    print("=" * 50)
+def test_specific_colors(obs, test_scene):
+    """
+    测试特定颜色值
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+        test_scene: 创建测试输入源所用的场景
+    """
+    out("\n🌈 测试特定颜色值")
+    out(SEP50)
+    
+    # 测试您想要的粉红色 #ff557f
+    pink_formats = [
+        ("粉色_RGB", 0xff557f),          # 您想要的颜色
+        ("粉色_BGR", 0x7f55ff),          # BGR 格式
+        ("粉色_DEC", 16733567),          # 十进制
+        ("粉色_ARGB", 0xFFff557f),       # ARGB 格式
+    ]
     
+    out("创建粉红色测试:")
+    batch = _build_color_batch(test_scene, pink_formats, "粉色", 36)
     try:
-        with OBSManager() as obs:
-            scenes = obs.scenes.get_names()
-            if not scenes:
-                print("❌ 没有可用的场景")
-                return False
-            
-            test_scene = scenes[0]
-            
-            # 测试您想要的粉红色 #ff557f
-            pink_formats = [
-                ("粉色_RGB", 0xff557f),          # 您想要的颜色
-                ("粉色_BGR", 0x7f55ff),          # BGR 格式
-                ("粉色_DEC", 16733567),          # 十进制
-                ("粉色_ARGB", 0xFFff557f),       # ARGB 格式
-            ]
-            
-            print("创建粉红色测试:")
-            created_inputs = []
-            
-            for format_name, color_value in pink_formats:
-                test_name = f"粉色测试_{format_name}_{int(time.time())}"
-                
-                print(f"\n测试 {format_name}: {color_value} (0x{color_value:08X})")
-                
-                try:
-                    result = obs.inputs.create_input(
-                        input_name=test_name,
-                        input_kind="text_gdiplus_v3",
-                        scene_name=test_scene,
-                        input_settings={
-                            "text": f"粉色 {format_name}",
-                            "color": color_value,
-                            "align": "center",
-                            "valign": "center",
-                            "font": {
-                                "face": "微软雅黑",
-                                "size": 36
-                            }
-                        }
-                    )
-                    
-                    if result.get('success'):
-                        print(f"✅ 创建成功: {test_name}")
-                        created_inputs.append(test_name)
-                    else:
-                        print(f"❌ 创建失败")
-                        
-                except Exception as e:
-                    print(f"❌ 创建异常: {e}")
-            
-            return len(created_inputs) > 0
-            
-    except Exception as e:
-        print(f"❌ 测试失败: {e}")
-        return False
+        _check_created(obs.inputs.create_inputs_batch(batch))
+    finally:
+        obs.inputs.remove_inputs_batch([params["input_name"] for params in batch])
+        out.flush()
 
 
-def get_default_color():
-    """获取默认颜色值"""
-    print("\n🔍 获取默认颜色值")
-    print("=" * 50)
+def get_default_color(obs):
+    """
+    获取默认颜色值
+    
+    Args:
+        obs: 已连接的 OBSManager
+    """
+    out("\n🔍 获取默认颜色值")
+    out(SEP50)
     
     try:
-        with OBSManager() as obs:
-            # 获取文本输入源的默认设置
-            defaults = obs.inputs.get_input_default_settings("text_gdiplus_v3")
-            
-            if 'color' in defaults:
-                default_color = defaults['color']
-                print(f"默认颜色值: {default_color}")
-                print(f"十六进制: 0x{default_color:08X}")
-                print(f"二进制: {bin(default_color)}")
-                
-                # 分解颜色分量 (假设是 RGB)
-                r = (default_color >> 16) & 0xFF
-                g = (default_color >> 8) & 0xFF
-                b = default_color & 0xFF
-                print(f"RGB 分量: R={r}, G={g}, B={b}")
-                
-                # 分解颜色分量 (假设是 BGR)
-                b_bgr = (default_color >> 16) & 0xFF
-                g_bgr = (default_color >> 8) & 0xFF
-                r_bgr = default_color & 0xFF
-                print(f"BGR 分量: B={b_bgr}, G={g_bgr}, R={r_bgr}")
-                
-                return True
-            else:
-                print("❌ 默认设置中没有颜色信息")
-                return False
-                
-    except Exception as e:
-        print(f"❌ 获取默认颜色失败: {e}")
-        return False
+        # 获取文本输入源的默认设置
+        defaults = obs.inputs.get_input_default_settings("text_gdiplus_v3")
+        assert 'color' in defaults, "默认设置中没有颜色信息"
+        
+        default_color = defaults['color']
+        out(f"默认颜色值: {default_color}")
+        out(f"十六进制: 0x{default_color:08X}")
+        out(f"二进制: {bin(default_color)}")
+        
+        # 分解颜色分量：高/中/低字节分别按 RGB 和 BGR 解读
+        (high, middle, low, _), = decode_components([default_color])
+        out(f"RGB 分量: R={high}, G={middle}, B={low}")
+        out(f"BGR 分量: B={high}, G={middle}, R={low}")
+    finally:
+        out.flush()
 
 
-def cleanup_test_inputs():
-    """清理测试输入源"""
-    print("\n🧹 清理测试输入源")
-    print("=" * 50)
+def cleanup_test_inputs(obs=None):
+    """
+    清理测试输入源
+    
+    Args:
+        obs: 已连接的 OBSManager，为 None 时自行建立连接
+    """
+    out("\n🧹 清理测试输入源")
+    out(SEP50)
     
     try:
-        with OBSManager() as obs:
+        with use_obs(obs) as obs:
             all_inputs = obs.inputs.get_names()
             
             # 查找测试输入源
-            test_inputs = [name for name in all_inputs if '测试_' in name or 'Test_' in name]
+            is_test_name = _TEST_NAME_RE.search
+            test_inputs = [name for name in all_inputs if is_test_name(name)]
             
             if not test_inputs:
-                print("没有找到测试输入源")
+                out("没有找到测试输入源")
                 return True
             
-            print(f"找到 {len(test_inputs)} 个测试输入源:")
+            out(f"找到 {len(test_inputs)} 个测试输入源:")
             
             cleaned = 0
-            for name in test_inputs:
-                try:
-                    if obs.inputs.remove_input(input_name=name):
-                        print(f"✅ 删除: {name}")
-                        cleaned += 1
-                    else:
-                        print(f"❌ 删除失败: {name}")
-                except Exception as e:
-                    print(f"❌ 删除异常 {name}: {e}")
+            for name, removed in zip(test_inputs, obs.inputs.remove_inputs_batch(test_inputs)):
+                if removed:
+                    out(f"✅ 删除: {name}")
+                    cleaned += 1
+                else:
+                    out(f"❌ 删除失败: {name}")
             
-            print(f"清理完成: {cleaned}/{len(test_inputs)}")
+            out(f"清理完成: {cleaned}/{len(test_inputs)}")
             return cleaned > 0
             
     except Exception as e:
-        print(f"❌ 清理失败: {e}")
+        out(f"❌ 清理失败: {e}")
         return False
+    finally:
+        out.flush()
 
 
 def main():
     """主测试函数"""
-    print("🚀 开始颜色格式测试...")
-    print("=" * 60)
-    
-    tests = [
-        ("获取默认颜色值", get_default_color),
-        ("测试不同颜色格式", test_color_formats),
-        ("测试特定颜色值", test_specific_colors),
-    ]
-    
-    passed = 0
-    total = len(tests)
+    out("🚀 开始颜色格式测试...")
+    out(SEP60)
     
-    for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
+    with contextlib.ExitStack() as stack:
+        # 所有测试共享一个连接，只需一次握手
         try:
-            if test_func():
-                print(f"✅ {test_name} 测试通过")
-                passed += 1
-            else:
-                print(f"❌ {test_name} 测试失败")
+            obs = stack.enter_context(OBSManager())
         except Exception as e:
-            print(f"❌ {test_name} 测试异常: {e}")
-    
-    print(f"\n{'='*60}")
-    print(f"测试结果: {passed}/{total} 通过")
-    print(f"{'='*60}")
-    
-    # 询问是否清理
-    print(f"\n是否要清理测试输入源? (输入 'y' 确认)")
-    try:
-        response = input().strip().lower()
-        if response == 'y':
-            cleanup_test_inputs()
-    except:
-        pass
+            out(f"❌ 连接 OBS 失败: {e}")
+            out.flush()
+            return False
+        
+        scenes = obs.scenes.get_names_cached()
+        if not scenes:
+            out("❌ 没有可用的场景")
+            out.flush()
+            return False
+        test_scene = scenes[0]
+        
+        tests = [
+            ("获取默认颜色值", lambda: get_default_color(obs)),
+            ("测试不同颜色格式", lambda: test_color_formats(obs, test_scene)),
+            ("测试特定颜色值", lambda: test_specific_colors(obs, test_scene)),
+        ]
+        
+        passed = 0
+        total = len(tests)
+        
+        for test_name, test_func in tests:
+            out("\n" + HEADER_FMT.format(test_name))
+            try:
+                test_func()
+                out(f"✅ {test_name} 测试通过")
+                passed += 1
+            except AssertionError as e:
+                out(f"❌ {test_name} 测试失败: {e}")
+            except Exception as e:
+                out(f"❌ {test_name} 测试异常: {e}")
+            out.flush()
+        
+        out("\n" + SEP60)
+        out(f"测试结果: {passed}/{total} 通过")
+        out(SEP60)
+        out.flush()
+        
+        # 询问是否清理（复用同一连接，批量删除）
+        out(f"\n是否要清理测试输入源? (输入 'y' 确认)")
+        out.flush()
+        try:
+            response = input().strip().lower()
+            if response == 'y':
+                cleanup_test_inputs(obs)
+        except:
+            pass
     
     return passed == total
 
@@ -2,293 +2,260 @@
 """
 优化后的创建输入源测试
 
-测试优化后的 InputManager.create_input() 方法的功能
+测试优化后的 InputManager.create_input() 方法的功能，
+每个测试结束时删除自己创建的输入源
+
+使用 pytest 运行（连接和测试场景由 tests/conftest.py 中的会话级 fixture 提供）：
+    python -m pytest tests/test_create_input_optimized.py
+
+也可以直接运行脚本：
+    python tests/test_create_input_optimized.py
 """
 
 import sys
 import os
-import time
+import contextlib
+from uuid import uuid4
 
-# 添加项目根目录到 Python 路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+
+# 直接运行脚本时添加项目根目录到 Python 路径（pytest 下已由 conftest.py 设置）
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from obs_sdk import OBSManager
+from tests import Printer
 
 
-def test_create_input_basic():
-    """测试基本创建功能"""
-    print("🎯 测试基本创建功能")
-    print("-" * 40)
-    
-    try:
-        with OBSManager() as obs:
-            # 获取可用场景
-            scenes = obs.scenes.get_names()
-            if not scenes:
-                print("❌ 没有可用的场景")
-                return False
-            
-            test_scene = scenes[0]
-            print(f"使用场景: {test_scene}")
-            
-            # 生成唯一的输入名称
-            test_input_name = f"Test_Basic_{int(time.time())}"
-            
-            # 创建输入
-            result = obs.inputs.create_input(
-                input_name=test_input_name,
-                input_kind="text_gdiplus_v3",
-                scene_name=test_scene,
-                input_settings={"text": "Hello World!"}
-            )
-            
-            print(f"创建结果: {result}")
-            
-            # 验证结果
-            if result.get('success'):
-                print("✅ 基本创建功能测试通过")
-                return True
-            else:
-                print("❌ 创建失败")
-                return False
-                
-    except Exception as e:
-        print(f"❌ 测试失败: {e}")
-        return False
+# 本模块的测试会创建或删除输入源，并行运行时固定在同一个 worker 上
+pytestmark = pytest.mark.xdist_group("obs_mutation")
+
+# 非交互运行时缓冲输出，每个测试结束后一次性写出
+out = Printer()
+
+# 输出分隔线
+SEP40 = "-" * 40
+SEP20 = "=" * 20
+SEP60 = "=" * 60
+HEADER_FMT = SEP20 + " {} " + SEP20
+
+
+def _cleanup(obs, *input_names):
+    """删除测试创建的输入源（不存在的名称忽略）"""
+    obs.inputs.remove_inputs_batch(list(input_names))
 
 
-def test_parameter_validation():
-    """测试参数验证"""
-    print("\n🔍 测试参数验证")
-    print("-" * 40)
+def test_create_input_basic(obs, test_scene):
+    """
+    测试基本创建功能
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+        test_scene: 创建测试输入源所用的场景
+    """
+    out("🎯 测试基本创建功能")
+    out(SEP40)
+    out(f"使用场景: {test_scene}")
+    
+    # 生成唯一的输入名称（随机后缀保证不重名，可跳过重复检查）
+    test_input_name = f"Test_Basic_{uuid4().hex[:8]}"
     
     try:
-        with OBSManager() as obs:
-            scenes = obs.scenes.get_names()
-            if not scenes:
-                print("❌ 没有可用的场景")
-                return False
-            
-            test_scene = scenes[0]
-            
-            # 测试1: 空输入名称
-            print("测试空输入名称...")
-            try:
-                obs.inputs.create_input(
-                    input_name="",
-                    input_kind="text_gdiplus_v3",
-                    scene_name=test_scene
-                )
-                print("❌ 应该抛出 ValueError")
-                return False
-            except ValueError as e:
-                print(f"✅ 正确捕获错误: {e}")
-            
-            # 测试2: 空输入类型
-            print("测试空输入类型...")
-            try:
-                obs.inputs.create_input(
-                    input_name="Test Input",
-                    input_kind="",
-                    scene_name=test_scene
-                )
-                print("❌ 应该抛出 ValueError")
-                return False
-            except ValueError as e:
-                print(f"✅ 正确捕获错误: {e}")
-            
-            # 测试3: 既不提供场景名称也不提供UUID
-            print("测试缺少场景参数...")
-            try:
-                obs.inputs.create_input(
-                    input_name="Test Input",
-                    input_kind="text_gdiplus_v3"
-                )
-                print("❌ 应该抛出 ValueError")
-                return False
-            except ValueError as e:
-                print(f"✅ 正确捕获错误: {e}")
-            
-            # 测试4: 同时提供场景名称和UUID
-            print("测试同时提供场景名称和UUID...")
-            try:
-                obs.inputs.create_input(
-                    input_name="Test Input",
-                    input_kind="text_gdiplus_v3",
-                    scene_name=test_scene,
-                    scene_uuid="fake-uuid"
-                )
-                print("❌ 应该抛出 ValueError")
-                return False
-            except ValueError as e:
-                print(f"✅ 正确捕获错误: {e}")
-            
-            print("✅ 参数验证测试通过")
-            return True
-            
-    except Exception as e:
-        print(f"❌ 参数验证测试失败: {e}")
-        return False
+        result = obs.inputs.create_input(
+            input_name=test_input_name,
+            input_kind="text_gdiplus_v3",
+            scene_name=test_scene,
+            input_settings={"text": "Hello World!"},
+            check_duplicates=False
+        )
+        out(f"创建结果: {result}")
+        assert result.get('success'), "创建失败"
+        out("✅ 基本创建功能测试通过")
+    finally:
+        _cleanup(obs, test_input_name)
+        out.flush()
 
 
-def test_duplicate_check():
-    """测试重复名称检查"""
-    print("\n🔄 测试重复名称检查")
-    print("-" * 40)
+def test_parameter_validation(obs, test_scene):
+    """
+    测试参数验证（参数无效时在发出请求前抛出 ValueError，不会创建输入源）
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+        test_scene: 创建测试输入源所用的场景
+    """
+    out("\n🔍 测试参数验证")
+    out(SEP40)
     
     try:
-        with OBSManager() as obs:
-            scenes = obs.scenes.get_names()
-            if not scenes:
-                print("❌ 没有可用的场景")
-                return False
-            
-            test_scene = scenes[0]
-            test_input_name = f"Test_Duplicate_{int(time.time())}"
-            
-            # 第一次创建
-            print(f"第一次创建输入: {test_input_name}")
-            result1 = obs.inputs.create_input(
-                input_name=test_input_name,
+        out("测试空输入名称...")
+        with pytest.raises(ValueError):
+            obs.inputs.create_input(
+                input_name="",
                 input_kind="text_gdiplus_v3",
                 scene_name=test_scene
             )
-            
-            if not result1.get('success'):
-                print("❌ 第一次创建失败")
-                return False
-            
-            print("✅ 第一次创建成功")
-            
-            # 第二次创建相同名称（应该失败）
-            print(f"第二次创建相同名称的输入...")
-            try:
-                obs.inputs.create_input(
-                    input_name=test_input_name,
-                    input_kind="text_gdiplus_v3",
-                    scene_name=test_scene
-                )
-                print("❌ 应该抛出 ValueError")
-                return False
-            except ValueError as e:
-                print(f"✅ 正确捕获重复名称错误: {e}")
-            
-            # 测试禁用重复检查
-            print("测试禁用重复检查...")
-            try:
-                result2 = obs.inputs.create_input(
-                    input_name=test_input_name,
-                    input_kind="text_gdiplus_v3",
-                    scene_name=test_scene,
-                    check_duplicates=False
-                )
-                print(f"禁用重复检查的结果: {result2}")
-                # 这可能成功也可能失败，取决于 OBS 的行为
-            except Exception as e:
-                print(f"禁用重复检查时的错误: {e}")
-            
-            print("✅ 重复名称检查测试通过")
-            return True
-            
-    except Exception as e:
-        print(f"❌ 重复名称检查测试失败: {e}")
-        return False
+        
+        out("测试空输入类型...")
+        with pytest.raises(ValueError):
+            obs.inputs.create_input(
+                input_name="Test Input",
+                input_kind="",
+                scene_name=test_scene
+            )
+        
+        out("测试缺少场景参数...")
+        with pytest.raises(ValueError):
+            obs.inputs.create_input(
+                input_name="Test Input",
+                input_kind="text_gdiplus_v3"
+            )
+        
+        out("测试同时提供场景名称和UUID...")
+        with pytest.raises(ValueError):
+            obs.inputs.create_input(
+                input_name="Test Input",
+                input_kind="text_gdiplus_v3",
+                scene_name=test_scene,
+                scene_uuid="fake-uuid"
+            )
+        
+        out("✅ 参数验证测试通过")
+    finally:
+        out.flush()
 
 
-def test_return_value_structure():
-    """测试返回值结构"""
-    print("\n📊 测试返回值结构")
-    print("-" * 40)
+def test_duplicate_check(obs, test_scene):
+    """
+    测试重复名称检查
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+        test_scene: 创建测试输入源所用的场景
+    """
+    out("\n🔄 测试重复名称检查")
+    out(SEP40)
+    
+    test_input_name = f"Test_Duplicate_{uuid4().hex[:8]}"
     
     try:
-        with OBSManager() as obs:
-            scenes = obs.scenes.get_names()
-            if not scenes:
-                print("❌ 没有可用的场景")
-                return False
-            
-            test_scene = scenes[0]
-            test_input_name = f"Test_Return_{int(time.time())}"
-            
-            # 创建输入
-            result = obs.inputs.create_input(
+        out(f"第一次创建输入: {test_input_name}")
+        result1 = obs.inputs.create_input(
+            input_name=test_input_name,
+            input_kind="text_gdiplus_v3",
+            scene_name=test_scene
+        )
+        assert result1.get('success'), "第一次创建失败"
+        
+        # 第二次创建相同名称（开启重复检查时应抛出 ValueError）
+        out("第二次创建相同名称的输入...")
+        with pytest.raises(ValueError):
+            obs.inputs.create_input(
+                input_name=test_input_name,
+                input_kind="text_gdiplus_v3",
+                scene_name=test_scene
+            )
+        
+        # 禁用重复检查时由 OBS 拒绝同名输入源，不能报告创建成功
+        out("测试禁用重复检查...")
+        try:
+            result2 = obs.inputs.create_input(
                 input_name=test_input_name,
                 input_kind="text_gdiplus_v3",
                 scene_name=test_scene,
-                input_settings={"text": "Return Value Test"}
+                check_duplicates=False
             )
-            
-            print(f"返回值: {result}")
-            
-            # 验证返回值结构
-            expected_keys = ['input_uuid', 'scene_item_id', 'input_name', 'input_kind', 'success']
-            
-            for key in expected_keys:
-                if key not in result:
-                    print(f"❌ 缺少键: {key}")
-                    return False
-                print(f"✅ 包含键: {key} = {result[key]}")
-            
-            # 验证数据类型
-            if not isinstance(result['input_uuid'], str):
-                print(f"❌ input_uuid 应该是字符串，实际是 {type(result['input_uuid'])}")
-                return False
-            
-            if not isinstance(result['scene_item_id'], int):
-                print(f"❌ scene_item_id 应该是整数，实际是 {type(result['scene_item_id'])}")
-                return False
-            
-            if not isinstance(result['success'], bool):
-                print(f"❌ success 应该是布尔值，实际是 {type(result['success'])}")
-                return False
-            
-            print("✅ 返回值结构测试通过")
-            return True
-            
-    except Exception as e:
-        print(f"❌ 返回值结构测试失败: {e}")
-        return False
+        except ValueError as e:
+            out(f"禁用重复检查时的错误: {e}")
+        else:
+            out(f"禁用重复检查的结果: {result2}")
+            assert not result2.get('success'), "同名输入源不应创建成功"
+        
+        out("✅ 重复名称检查测试通过")
+    finally:
+        _cleanup(obs, test_input_name)
+        out.flush()
+
+
+def test_return_value_structure(obs, test_scene):
+    """
+    测试返回值结构
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+        test_scene: 创建测试输入源所用的场景
+    """
+    out("\n📊 测试返回值结构")
+    out(SEP40)
+    
+    test_input_name = f"Test_Return_{uuid4().hex[:8]}"
+    
+    try:
+        result = obs.inputs.create_input(
+            input_name=test_input_name,
+            input_kind="text_gdiplus_v3",
+            scene_name=test_scene,
+            input_settings={"text": "Return Value Test"},
+            check_duplicates=False
+        )
+        out(f"返回值: {result}")
+        
+        # 验证返回值结构
+        expected_keys = ['input_uuid', 'scene_item_id', 'input_name', 'input_kind', 'success']
+        missing_keys = [key for key in expected_keys if key not in result]
+        assert not missing_keys, f"缺少键: {', '.join(missing_keys)}"
+        
+        # 验证数据类型
+        assert isinstance(result['input_uuid'], str), "input_uuid 应该是字符串"
+        assert isinstance(result['scene_item_id'], int), "scene_item_id 应该是整数"
+        assert isinstance(result['success'], bool), "success 应该是布尔值"
+        
+        out("✅ 返回值结构测试通过")
+    finally:
+        _cleanup(obs, test_input_name)
+        out.flush()
 
 
-def test_input_kind_validation():
-    """测试输入类型验证"""
-    print("\n🔧 测试输入类型验证")
-    print("-" * 40)
+def test_input_kind_validation(obs, test_scene):
+    """
+    测试输入类型验证
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+        test_scene: 创建测试输入源所用的场景
+    """
+    out("\n🔧 测试输入类型验证")
+    out(SEP40)
+    
+    test_input_name = f"Test_InvalidKind_{uuid4().hex[:8]}"
     
     try:
-        with OBSManager() as obs:
-            scenes = obs.scenes.get_names()
-            if not scenes:
-                print("❌ 没有可用的场景")
-                return False
-            
-            test_scene = scenes[0]
-            
-            # 测试不支持的输入类型
-            print("测试不支持的输入类型...")
-            test_input_name = f"Test_InvalidKind_{int(time.time())}"
-            
+        # 不支持的输入类型只记录警告，仍会发出请求，由 OBS 拒绝
+        out("测试不支持的输入类型...")
+        try:
             result = obs.inputs.create_input(
                 input_name=test_input_name,
                 input_kind="invalid_input_type",
-                scene_name=test_scene
+                scene_name=test_scene,
+                check_duplicates=False
             )
-            
-            print(f"使用无效类型的结果: {result}")
-            # 这应该会记录警告但仍然尝试创建
-            
-            print("✅ 输入类型验证测试完成")
-            return True
-            
-    except Exception as e:
-        print(f"❌ 输入类型验证测试失败: {e}")
-        return False
+        except Exception as e:
+            out(f"使用无效类型时的错误: {e}")
+        else:
+            out(f"使用无效类型的结果: {result}")
+            assert not result.get('success'), "无效类型不应创建成功"
+        
+        out("✅ 输入类型验证测试完成")
+    finally:
+        _cleanup(obs, test_input_name)
+        out.flush()
 
 
 def main():
     """主测试函数"""
-    print("🚀 开始优化后的创建输入源测试...")
-    print("=" * 60)
+    out("🚀 开始优化后的创建输入源测试...")
+    out(SEP60)
     
     tests = [
         ("基本创建功能", test_create_input_basic),
@@ -301,23 +268,38 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
+    with contextlib.ExitStack() as stack:
+        # 所有测试共享一个连接，只需一次握手
         try:
-            if test_func():
-                print(f"✅ {test_name} 测试通过")
-                passed += 1
-            else:
-                print(f"❌ {test_name} 测试失败")
+            obs = stack.enter_context(OBSManager())
         except Exception as e:
-            print(f"❌ {test_name} 测试异常: {e}")
-    
-    print(f"\n{'='*60}")
-    print(f"测试结果: {passed}/{total} 通过")
-    print(f"{'='*60}")
+            out(f"❌ 连接 OBS 失败: {e}")
+            out.flush()
+            return False
+        
+        scenes = obs.scenes.get_names_cached()
+        if not scenes:
+            out("❌ 没有可用的场景")
+            out.flush()
+            return False
+        test_scene = scenes[0]
+        
+        for test_name, test_func in tests:
+            out("\n" + HEADER_FMT.format(test_name))
+            try:
+                test_func(obs, test_scene)
+                out(f"✅ {test_name} 测试通过")
+                passed += 1
+            except AssertionError as e:
+                out(f"❌ {test_name} 测试失败: {e}")
+            except Exception as e:
+                out(f"❌ {test_name} 测试异常: {e}")
+            out.flush()
     
-    if passed < total:
-        print("\n⚠️ 注意：测试创建的输入源未被自动删除，请手动清理")
+    out("\n" + SEP60)
+    out(f"测试结果: {passed}/{total} 通过")
+    out(SEP60)
+    out.flush()
     
     return passed == total
 
@@ -3,292 +3,316 @@
 获取输入默认设置测试
 
 专门测试 InputManager.get_input_default_settings() 方法的功能
+
+使用 pytest 运行（连接和测试场景由 tests/conftest.py 中的会话级 fixture 提供）：
+    python -m pytest tests/test_input_default_settings.py
+
+也可以直接运行脚本：
+    python tests/test_input_default_settings.py
 """
 
 import sys
 import os
-import time
+import contextlib
+from uuid import uuid4
 
-# 添加项目根目录到 Python 路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+
+# 直接运行脚本时添加项目根目录到 Python 路径（pytest 下已由 conftest.py 设置）
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from obs_sdk import OBSManager
-from obs_sdk.types.input_types import InputTypeHelper
+from obs_sdk.types.input_types import INPUT_TYPE_MAPPING_VIEW
+from tests import Printer
+
 
+# 非交互运行时缓冲输出，每个测试结束后一次性写出
+out = Printer()
 
-def test_get_default_settings_basic():
-    """测试基本获取默认设置功能"""
-    print("⚙️ 测试基本获取默认设置功能")
-    print("-" * 40)
+# 输出分隔线
+SEP40 = "-" * 40
+SEP20 = "=" * 20
+SEP60 = "=" * 60
+HEADER_FMT = SEP20 + " {} " + SEP20
+
+
+def test_get_default_settings_basic(obs):
+    """
+    测试基本获取默认设置功能
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+    """
+    out("⚙️ 测试基本获取默认设置功能")
+    out(SEP40)
     
     try:
-        with OBSManager() as obs:
-            # 测试常见的输入类型
-            test_types = [
+        # 测试常见的输入类型（只检查当前 OBS 支持的类型）
+        available_types = set(obs.inputs.get_input_kinds_cached())
+        test_types = [
+            input_type for input_type in (
                 "text_gdiplus_v3",
-                "image_source", 
+                "image_source",
                 "color_source_v3",
                 "browser_source"
-            ]
+            ) if input_type in available_types
+        ]
+        assert test_types, "当前 OBS 不支持任何待测的输入类型"
+        
+        # 一次性批量获取所有类型的默认设置
+        all_settings = obs.inputs.get_input_default_settings_batch(test_types)
+        
+        for input_type in test_types:
+            out(f"\n测试输入类型: {input_type}")
+            settings = all_settings[input_type]
+            assert isinstance(settings, dict), f"获取 {input_type} 的默认设置失败"
             
-            for input_type in test_types:
-                print(f"\n测试输入类型: {input_type}")
-                
-                try:
-                    settings = obs.inputs.get_input_default_settings(input_type)
-                    
-                    print(f"✅ 成功获取默认设置")
-                    print(f"设置类型: {type(settings)}")
-                    print(f"设置数量: {len(settings) if isinstance(settings, dict) else 'N/A'}")
-                    
-                    if isinstance(settings, dict) and settings:
-                        print("主要设置项:")
-                        for key, value in list(settings.items()):  # 只显示前5个
-                            print(f"  {key}: {type(value).__name__}")
-                    
-                except Exception as e:
-                    print(f"❌ 获取失败: {e}")
-                    continue
-            
-            return True
-            
-    except Exception as e:
-        print(f"❌ 测试失败: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+            out(f"✅ 成功获取默认设置，设置数量: {len(settings)}")
+            if settings:
+                out("主要设置项:")
+                for key, value in settings.items():
+                    out(f"  {key}: {type(value).__name__}")
+    finally:
+        out.flush()
 
 
-def test_get_default_settings_all_types():
-    """测试所有可用输入类型的默认设置"""
-    print("\n📋 测试所有可用输入类型的默认设置")
-    print("-" * 40)
+def test_get_default_settings_all_types(obs):
+    """
+    测试所有可用输入类型的默认设置
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+    """
+    out("\n📋 测试所有可用输入类型的默认设置")
+    out(SEP40)
     
     try:
-        with OBSManager() as obs:
-            # 获取所有可用的输入类型
-            available_types = obs.inputs.get_input_kinds()
-            print(f"发现 {len(available_types)} 种输入类型")
-            
-            success_count = 0
-            failed_types = []
-            
-            for input_type in available_types:
-                try:
-                    settings = obs.inputs.get_input_default_settings(input_type)
-                    chinese_name = InputTypeHelper.get_chinese_name(input_type)
-                    
-                    if isinstance(settings, dict):
-                        print(f"✅ {chinese_name} ({input_type}): {len(settings)} 个设置项")
-                        success_count += 1
-                    else:
-                        print(f"⚠️ {chinese_name} ({input_type}): 非字典类型")
-                        
-                except Exception as e:
-                    chinese_name = InputTypeHelper.get_chinese_name(input_type)
-                    print(f"❌ {chinese_name} ({input_type}): {e}")
-                    failed_types.append(input_type)
-            
-            print(f"\n📊 统计结果:")
-            print(f"成功: {success_count}/{len(available_types)}")
-            print(f"失败: {len(failed_types)}")
+        # 获取所有可用的输入类型
+        available_types = obs.inputs.get_input_kinds_cached()
+        out(f"发现 {len(available_types)} 种输入类型")
+        
+        success_count = 0
+        failed_types = []
+        
+        # 一次性批量获取，避免逐个类型单独请求
+        all_settings = obs.inputs.get_input_default_settings_batch(available_types)
+        
+        # 预先计算所有类型的中文名称（直接查映射表，未收录的类型保留英文名）
+        chinese_names = {kind: INPUT_TYPE_MAPPING_VIEW.get(kind, kind) for kind in available_types}
+        
+        for input_type in available_types:
+            settings = all_settings[input_type]
+            chinese_name = chinese_names[input_type]
             
-            if failed_types:
-                print(f"失败的类型: {failed_types}")
-            
-            return success_count > 0
-            
-    except Exception as e:
-        print(f"❌ 测试失败: {e}")
-        return False
+            if settings is None:
+                out(f"❌ {chinese_name} ({input_type}): 获取失败")
+                failed_types.append(input_type)
+            elif isinstance(settings, dict):
+                out(f"✅ {chinese_name} ({input_type}): {len(settings)} 个设置项")
+                success_count += 1
+            else:
+                out(f"⚠️ {chinese_name} ({input_type}): 非字典类型")
+        
+        out("\n📊 统计结果:")
+        out(f"成功: {success_count}/{len(available_types)}")
+        out(f"失败: {len(failed_types)}")
+        
+        if failed_types:
+            out(f"失败的类型: {failed_types}")
+        
+        assert success_count > 0, "没有任何输入类型成功获取默认设置"
+    finally:
+        out.flush()
 
 
-def test_get_default_settings_detailed():
-    """测试详细的默认设置内容"""
-    print("\n🔍 测试详细的默认设置内容")
-    print("-" * 40)
+def test_get_default_settings_detailed(obs):
+    """
+    测试详细的默认设置内容
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+    """
+    out("\n🔍 测试详细的默认设置内容")
+    out(SEP40)
     
     try:
-        with OBSManager() as obs:
-            # 测试文本输入源的详细设置
-            print("测试文本输入源 (text_gdiplus_v3):")
-            text_settings = obs.inputs.get_input_default_settings("text_gdiplus_v3")
-            
-            if isinstance(text_settings, dict):
-                print(f"✅ 获取到 {len(text_settings)} 个设置项")
-                
-                # 检查常见的文本设置项
-                expected_keys = ["text", "font", "color", "align", "valign"]
-                found_keys = []
-                
-                for key in expected_keys:
-                    if key in text_settings:
-                        found_keys.append(key)
-                        value = text_settings[key]
-                        print(f"  {key}: {type(value).__name__} = {value}")
-                
-                print(f"找到预期设置项: {found_keys}")
-                
-                # 显示所有设置项
-                print(f"\n所有设置项:")
-                for key, value in text_settings.items():
-                    if isinstance(value, dict):
-                        print(f"  {key}: {type(value).__name__} (包含 {len(value)} 个子项)")
-                    else:
-                        print(f"  {key}: {type(value).__name__} = {value}")
-            
-            # 测试颜色源的设置
-            print(f"\n测试颜色源 (color_source_v3):")
-            color_settings = obs.inputs.get_input_default_settings("color_source_v3")
-            
-            if isinstance(color_settings, dict):
-                print(f"✅ 获取到 {len(color_settings)} 个设置项")
-                for key, value in color_settings.items():
-                    print(f"  {key}: {type(value).__name__} = {value}")
-            
-            return True
-            
-    except Exception as e:
-        print(f"❌ 测试失败: {e}")
-        return False
+        # 测试文本输入源的详细设置
+        out("测试文本输入源 (text_gdiplus_v3):")
+        text_settings = obs.inputs.get_input_default_settings("text_gdiplus_v3")
+        assert isinstance(text_settings, dict), "文本输入源的默认设置应为字典"
+        out(f"✅ 获取到 {len(text_settings)} 个设置项")
+        
+        # 检查常见的文本设置项
+        expected_keys = ["text", "font", "color", "align", "valign"]
+        found_keys = [key for key in expected_keys if key in text_settings]
+        for key in found_keys:
+            value = text_settings[key]
+            out(f"  {key}: {type(value).__name__} = {value}")
+        out(f"找到预期设置项: {found_keys}")
+        
+        # 显示所有设置项
+        out("\n所有设置项:")
+        for key, value in text_settings.items():
+            if isinstance(value, dict):
+                out(f"  {key}: {type(value).__name__} (包含 {len(value)} 个子项)")
+            else:
+                out(f"  {key}: {type(value).__name__} = {value}")
+        
+        # 测试颜色源的设置
+        out("\n测试颜色源 (color_source_v3):")
+        color_settings = obs.inputs.get_input_default_settings("color_source_v3")
+        assert isinstance(color_settings, dict), "颜色源的默认设置应为字典"
+        out(f"✅ 获取到 {len(color_settings)} 个设置项")
+        for key, value in color_settings.items():
+            out(f"  {key}: {type(value).__name__} = {value}")
+    finally:
+        out.flush()
 
 
-def test_get_default_settings_error_handling():
-    """测试错误处理"""
-    print("\n🚫 测试错误处理")
-    print("-" * 40)
+def test_get_default_settings_error_handling(obs):
+    """
+    测试错误处理
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+    """
+    out("\n🚫 测试错误处理")
+    out(SEP40)
     
     try:
-        with OBSManager() as obs:
-            # 测试1: 空输入类型
-            print("测试空输入类型...")
-            try:
-                obs.inputs.get_input_default_settings("")
-                print("❌ 应该抛出 ValueError")
-                return False
-            except ValueError as e:
-                print(f"✅ 正确抛出 ValueError: {e}")
-            
-            # 测试2: 无效的输入类型
-            print("测试无效的输入类型...")
-            try:
-                settings = obs.inputs.get_input_default_settings("invalid_input_type")
-                print(f"获取无效类型的结果: {settings}")
-                # 某些情况下可能返回空字典而不是抛出异常
-                print("✅ 处理无效类型正常")
-            except Exception as e:
-                print(f"✅ 抛出异常: {type(e).__name__}: {e}")
-            
-            # 测试3: None 输入类型
-            print("测试 None 输入类型...")
-            try:
-                obs.inputs.get_input_default_settings(None)
-                print("❌ 应该抛出异常")
-                return False
-            except (ValueError, TypeError) as e:
-                print(f"✅ 正确抛出异常: {type(e).__name__}: {e}")
-            
-            return True
-            
-    except Exception as e:
-        print(f"❌ 错误处理测试失败: {e}")
-        return False
+        # 测试1: 空输入类型
+        out("测试空输入类型...")
+        with pytest.raises(ValueError):
+            obs.inputs.get_input_default_settings("")
+        
+        # 测试2: 无效的输入类型（可能返回空字典，也可能抛出异常，两者都可接受）
+        out("测试无效的输入类型...")
+        try:
+            settings = obs.inputs.get_input_default_settings("invalid_input_type")
+            out(f"获取无效类型的结果: {settings}")
+        except Exception as e:
+            out(f"抛出异常: {type(e).__name__}: {e}")
+        
+        # 测试3: None 输入类型
+        out("测试 None 输入类型...")
+        with pytest.raises((ValueError, TypeError)):
+            obs.inputs.get_input_default_settings(None)
+        
+        out("✅ 错误处理测试通过")
+    finally:
+        out.flush()
 
 
-def test_get_default_settings_practical():
-    """测试实际应用场景"""
-    print("\n💡 测试实际应用场景")
-    print("-" * 40)
+@pytest.mark.xdist_group("obs_mutation")
+def test_get_default_settings_practical(obs, test_scene):
+    """
+    测试实际应用场景
+    
+    Args:
+        obs: 已连接的 OBSManager（pytest 下由会话级 fixture 提供）
+        test_scene: 创建测试输入源所用的场景
+    """
+    out("\n💡 测试实际应用场景")
+    out(SEP40)
+    
+    test_name = f"默认设置测试_{uuid4().hex[:8]}"
     
     try:
-        with OBSManager() as obs:
-            # 场景1: 获取默认设置并创建输入源
-            print("场景1: 使用默认设置创建输入源")
-            
-            # 获取文本输入源的默认设置
-            default_settings = obs.inputs.get_input_default_settings("text_gdiplus_v3")
-            
-            if isinstance(default_settings, dict):
-                print(f"✅ 获取到默认设置: {len(default_settings)} 项")
-                
-                # 修改部分设置
-                custom_settings = default_settings.copy()
-                custom_settings["text"] = "使用默认设置创建的文本"
-                
-                # 获取场景
-                scenes = obs.scenes.get_names()
-                if scenes:
-                    test_name = f"默认设置测试_{int(time.time())}"
-                    
-                    # 创建输入源
-                    result = obs.inputs.create_input(
-                        input_name=test_name,
-                        input_kind="text_gdiplus_v3",
-                        scene_name=scenes[0],
-                        input_settings=custom_settings
-                    )
-                    
-                    if result.get('success'):
-                        print(f"✅ 使用默认设置成功创建输入源: {test_name}")
-                        
-                        # 清理
-                        obs.inputs.remove_input(input_name=test_name)
-                        print("🧹 清理完成")
-                    else:
-                        print("❌ 创建输入源失败")
-            
-            # 场景2: 比较不同输入类型的默认设置
-            print(f"\n场景2: 比较不同输入类型的默认设置")
-            
-            types_to_compare = ["text_gdiplus_v3", "color_source_v3", "image_source"]
-            settings_comparison = {}
-            
-            for input_type in types_to_compare:
-                try:
-                    settings = obs.inputs.get_input_default_settings(input_type)
-                    settings_comparison[input_type] = len(settings) if isinstance(settings, dict) else 0
-                    chinese_name = InputTypeHelper.get_chinese_name(input_type)
-                    print(f"  {chinese_name}: {settings_comparison[input_type]} 个设置项")
-                except Exception as e:
-                    print(f"  {input_type}: 获取失败 - {e}")
-            
-            return True
-            
-    except Exception as e:
-        print(f"❌ 实际应用测试失败: {e}")
-        return False
+        # 场景1: 获取默认设置并创建输入源
+        out("场景1: 使用默认设置创建输入源")
+        
+        # 获取文本输入源的默认设置
+        default_settings = obs.inputs.get_input_default_settings("text_gdiplus_v3")
+        assert isinstance(default_settings, dict), "获取默认设置失败"
+        out(f"✅ 获取到默认设置: {len(default_settings)} 项")
+        
+        # 在默认设置基础上覆盖部分设置（浅拷贝，不修改 default_settings）
+        custom_settings = {**default_settings, "text": "使用默认设置创建的文本"}
+        
+        # 创建输入源（随机后缀保证不重名，可跳过重复检查）
+        result = obs.inputs.create_input(
+            input_name=test_name,
+            input_kind="text_gdiplus_v3",
+            scene_name=test_scene,
+            input_settings=custom_settings,
+            check_duplicates=False
+        )
+        assert result.get('success'), "使用默认设置创建输入源失败"
+        out(f"✅ 使用默认设置成功创建输入源: {test_name}")
+        
+        # 场景2: 比较不同输入类型的默认设置
+        out("\n场景2: 比较不同输入类型的默认设置")
+        
+        types_to_compare = ["text_gdiplus_v3", "color_source_v3", "image_source"]
+        
+        # 场景1 已获取过文本输入源的默认设置，只请求其余类型
+        all_settings = {"text_gdiplus_v3": default_settings}
+        missing_types = [t for t in types_to_compare if t not in all_settings]
+        all_settings.update(obs.inputs.get_input_default_settings_batch(missing_types))
+        
+        for input_type in types_to_compare:
+            settings = all_settings[input_type]
+            if settings is None:
+                out(f"  {input_type}: 获取失败")
+                continue
+            chinese_name = INPUT_TYPE_MAPPING_VIEW.get(input_type, input_type)
+            out(f"  {chinese_name}: {len(settings) if isinstance(settings, dict) else 0} 个设置项")
+    finally:
+        # 断言失败时也删除创建的输入源
+        obs.inputs.remove_inputs_batch([test_name])
+        out.flush()
 
 
 def main():
     """主测试函数"""
-    print("🚀 开始获取输入默认设置测试...")
-    print("=" * 60)
-    
-    tests = [
-        ("基本获取默认设置功能", test_get_default_settings_basic),
-        ("所有输入类型的默认设置", test_get_default_settings_all_types),
-        ("详细的默认设置内容", test_get_default_settings_detailed),
-        ("错误处理", test_get_default_settings_error_handling),
-        ("实际应用场景", test_get_default_settings_practical),
-    ]
+    out("🚀 开始获取输入默认设置测试...")
+    out(SEP60)
     
-    passed = 0
-    total = len(tests)
-    
-    for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
+    with contextlib.ExitStack() as stack:
+        # 所有测试共享一个连接，只需一次握手
         try:
-            if test_func():
-                print(f"✅ {test_name} 测试通过")
-                passed += 1
-            else:
-                print(f"❌ {test_name} 测试失败")
+            obs = stack.enter_context(OBSManager())
         except Exception as e:
-            print(f"❌ {test_name} 测试异常: {e}")
+            out(f"❌ 连接 OBS 失败: {e}")
+            out.flush()
+            return False
+        
+        scenes = obs.scenes.get_names_cached()
+        if not scenes:
+            out("❌ 没有可用的场景")
+            out.flush()
+            return False
+        test_scene = scenes[0]
+        
+        tests = [
+            ("基本获取默认设置功能", lambda: test_get_default_settings_basic(obs)),
+            ("所有输入类型的默认设置", lambda: test_get_default_settings_all_types(obs)),
+            ("详细的默认设置内容", lambda: test_get_default_settings_detailed(obs)),
+            ("错误处理", lambda: test_get_default_settings_error_handling(obs)),
+            ("实际应用场景", lambda: test_get_default_settings_practical(obs, test_scene)),
+        ]
+        
+        passed = 0
+        total = len(tests)
+        
+        for test_name, test_func in tests:
+            out("\n" + HEADER_FMT.format(test_name))
+            try:
+                test_func()
+                out(f"✅ {test_name} 测试通过")
+                passed += 1
+            except AssertionError as e:
+                out(f"❌ {test_name} 测试失败: {e}")
+            except Exception as e:
+                out(f"❌ {test_name} 测试异常: {e}")
+            out.flush()
     
-    print(f"\n{'='*60}")
-    print(f"测试结果: {passed}/{total} 通过")
-    print(f"{'='*60}")
+    out("\n" + SEP60)
+    out(f"测试结果: {passed}/{total} 通过")
+    out(SEP60)
+    out.flush()
     
     return passed == total
 
@@ -1,35 +1,39 @@
 #!/usr/bin/env python3
 """
 简单的删除输入源测试
+
+在项目根目录下以模块方式运行：
+    python -m tests.test_remove_simple
 """
 
 import sys
-import os
 import time
-
-# 添加项目根目录到 Python 路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import logging
 
 from obs_sdk import OBSManager
+from tests import EventWaiter
+
+# 过程输出使用 DEBUG 级别，直接运行脚本时在入口处开启
+log = logging.getLogger(__name__)
 
 
 def main():
     """简单测试删除功能"""
-    print("🧪 简单删除测试")
-    print("=" * 40)
+    log.debug("🧪 简单删除测试")
+    log.debug("=" * 40)
     
     try:
         with OBSManager() as obs:
             # 获取场景
             scenes = obs.scenes.get_names()
             if not scenes:
-                print("❌ 没有可用的场景")
+                log.error("❌ 没有可用的场景")
                 return False
             
             test_scene = scenes[0]
             test_name = f"删除测试_{int(time.time())}"
             
-            print(f"1. 创建输入源: {test_name}")
+            log.debug("1. 创建输入源: %s", test_name)
             
             # 创建输入源
             result = obs.inputs.create_input(
@@ -40,57 +44,63 @@ def main():
             )
             
             if not result.get('success'):
-                print("❌ 创建失败")
+                log.error("❌ 创建失败")
                 return False
             
-            print(f"✅ 创建成功: {result['input_uuid']}")
+            log.debug("✅ 创建成功: %s", result['input_uuid'])
             
             # 检查输入源列表
-            print(f"\n2. 检查输入源是否存在")
+            log.debug("\n2. 检查输入源是否存在")
             all_inputs_before = obs.inputs.get_names()
-            print(f"删除前输入源数量: {len(all_inputs_before)}")
+            log.debug("删除前输入源数量: %s", len(all_inputs_before))
             
             if test_name in all_inputs_before:
-                print(f"✅ 输入源存在于列表中")
+                log.debug("✅ 输入源存在于列表中")
             else:
-                print(f"❌ 输入源不在列表中")
+                log.error("❌ 输入源不在列表中")
                 return False
             
             # 删除输入源
-            print(f"\n3. 删除输入源: {test_name}")
-            try:
-                success = obs.inputs.remove_input(input_name=test_name)
-                print(f"删除操作返回: {success}")
-            except Exception as e:
-                print(f"❌ 删除时出错: {e}")
-                return False
-            
-            # 等待一下让删除生效
-            time.sleep(0.5)
+            log.debug("\n3. 删除输入源: %s", test_name)
+            with EventWaiter(obs, 'InputRemoved') as removed:
+                try:
+                    success = obs.inputs.remove_input(input_name=test_name)
+                    log.debug("删除操作返回: %s", success)
+                except Exception as e:
+                    log.error("❌ 删除时出错: %s", e)
+                    return False
+                
+                # 以 InputRemoved 事件确认删除
+                removed_event = removed.wait(test_name)
             
-            # 再次检查输入源列表
-            print(f"\n4. 验证删除结果")
-            all_inputs_after = obs.inputs.get_names()
-            print(f"删除后输入源数量: {len(all_inputs_after)}")
+            log.debug("\n4. 验证删除结果")
+            if removed_event is not None:
+                # 事件已确认，删除后的列表由删除前的列表在本地推导
+                all_inputs_after = [name for name in all_inputs_before if name != test_name]
+            else:
+                # 超时未收到事件时才重新查询，用于诊断
+                log.warning("⚠️ 未收到 InputRemoved 事件，重新查询输入源列表")
+                all_inputs_after = obs.inputs.get_names()
+            log.debug("删除后输入源数量: %s", len(all_inputs_after))
             
             if test_name not in all_inputs_after:
-                print(f"✅ 输入源已从列表中移除")
-                print(f"✅ 删除测试成功")
+                log.debug("✅ 输入源已从列表中移除")
+                log.debug("✅ 删除测试成功")
                 return True
             else:
-                print(f"❌ 输入源仍在列表中")
-                print(f"删除前: {all_inputs_before}")
-                print(f"删除后: {all_inputs_after}")
+                log.error("❌ 输入源仍在列表中")
+                log.debug("删除前: %s", all_inputs_before)
+                log.debug("删除后: %s", all_inputs_after)
                 return False
                 
     except Exception as e:
-        print(f"❌ 测试异常: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ 测试异常: %s", e)
         return False
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.DEBUG)
     success = main()
     if success:
         print("\n🎉 测试通过！")
@@ -1,7 +1,7 @@
 """
 测试场景管理器 (SceneManager)
 
-这个测试文件使用真实的 OBS 连接来测试场景管理功能。
+这个测试文件使用真实的 OBS 连接来测试场景管理功能，连接由测试包共享。
 运行测试前请确保：
 1. OBS Studio 正在运行
 2. WebSocket 服务器已启用（工具 -> WebSocket 服务器设置）
@@ -9,60 +9,71 @@
 """
 
 import unittest
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from obs_sdk import OBSManager, OBSConfig
-from obs_sdk.exceptions import OBSResourceNotFoundError
+import pytest
+from obswebsocket import requests
+
+from obs_sdk.core.exceptions import OBSResourceNotFoundError
+from tests import SharedOBS, wait_until, require_obs as setUpModule
 
 
 # 配置日志
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 测试类会切换节目场景和 Studio Mode，并在 setUpClass/tearDownClass 中创建和清理
+# TestScene_* 场景；并行运行时整个类必须固定在同一个 worker 上，
+# 否则每个 worker 各执行一次类级初始化和清理，互相删除对方的场景
+pytestmark = pytest.mark.xdist_group("obs_mutation")
+
 
 class TestSceneManager(unittest.TestCase):
     """场景管理器测试类"""
 
+    # 共享的 OBSManager，setUpClass 中获取
+    obs = None
+
     @classmethod
     def setUpClass(cls):
-        """测试类初始化 - 建立 OBS 连接"""
-        cls.config = OBSConfig()
-        cls.obs = OBSManager(cls.config, auto_connect=False)
-
-        # 尝试连接到 OBS
-        if not cls.obs.connect():
-            raise unittest.SkipTest("无法连接到 OBS Studio，请确保 OBS 正在运行且 WebSocket 服务器已启用")
-
-        logger.info("已连接到 OBS Studio")
+        """测试类初始化 - 获取共享的 OBS 连接（不可用时模块已由 require_obs 跳过）"""
+        cls.obs = SharedOBS.get()
 
         # 保存初始状态
         cls.initial_scenes = cls.obs.scenes.get_names()
+        cls._initial_scenes_set = frozenset(cls.initial_scenes)  # 清理时做成员判断
         cls.initial_current_scene = cls.obs.scenes.get_current_program()
         cls.initial_studio_mode = cls.obs.scenes.is_studio_mode_enabled()
 
-        logger.info(f"初始场景列表: {cls.initial_scenes}")
-        logger.info(f"初始当前场景: {cls.initial_current_scene}")
-        logger.info(f"初始 Studio Mode 状态: {cls.initial_studio_mode}")
+        logger.info("初始场景列表: %s", cls.initial_scenes)
+        logger.info("初始当前场景: %s", cls.initial_current_scene)
+        logger.info("初始 Studio Mode 状态: %s", cls.initial_studio_mode)
+
+        # 转场覆盖、并发等只读取场景的测试共用一个场景，整个测试类只创建和删除一次
+        cls.fixture_scene = "TestScene_Fixture"
+        if cls.fixture_scene not in cls._initial_scenes_set:
+            cls.obs.scenes.create_batch([cls.fixture_scene])
 
     @classmethod
     def tearDownClass(cls):
-        """测试类清理 - 恢复初始状态并断开连接"""
-        if hasattr(cls, 'obs') and cls.obs.is_connected():
+        """测试类清理 - 恢复初始状态（共享连接在进程退出时断开）"""
+        if cls.obs is not None and cls.obs.is_connected():
             try:
                 # 恢复 Studio Mode 状态
                 if cls.initial_studio_mode != cls.obs.scenes.is_studio_mode_enabled():
                     cls.obs.scenes.enable_studio_mode(cls.initial_studio_mode)
 
-                # 清理测试创建的场景
-                current_scenes = cls.obs.scenes.get_names()
-                for scene in current_scenes:
-                    if scene.startswith("TestScene_") and scene not in cls.initial_scenes:
-                        try:
-                            cls.obs.scenes.delete(scene)
-                            logger.info(f"清理测试场景: {scene}")
-                        except Exception as e:
-                            logger.warning(f"清理场景 {scene} 失败: {e}")
+                # 清理测试创建的场景（批量发送删除请求）
+                leftover = [scene for scene in cls.obs.scenes.get_names()
+                            if scene.startswith("TestScene_")
+                            and (scene not in cls._initial_scenes_set or scene == cls.fixture_scene)]
+                if leftover:
+                    for scene, removed in zip(leftover, cls.obs.scenes.delete_batch(leftover)):
+                        if removed:
+                            logger.info("清理测试场景: %s", scene)
+                        else:
+                            logger.warning("清理场景 %s 失败", scene)
 
                 # 恢复初始场景
                 if cls.initial_current_scene and cls.obs.scenes.exists(cls.initial_current_scene):
@@ -70,26 +81,59 @@ class TestSceneManager(unittest.TestCase):
 
                 logger.info("已恢复初始状态")
             except Exception as e:
-                logger.error(f"恢复初始状态失败: {e}")
-            finally:
-                cls.obs.disconnect()
-                logger.info("已断开 OBS 连接")
+                logger.error("恢复初始状态失败: %s", e)
 
     def setUp(self):
         """每个测试方法的初始化"""
-        if not self.obs.is_connected():
-            self.skipTest("OBS 连接已断开")
+        # 连接状态不在这里检查：意外断线由请求前的 ensure_connected() 自动重连，
+        # 重连失败时抛出 OBSConnectionError，测试直接报错而不是被跳过
+
+        # 本测试维护的场景名称集合，首次使用时获取一次
+        self._live_scenes = None
+
+    def _live(self):
+        """
+        获取本测试维护的场景名称集合
+
+        测试场景只由测试自己创建和删除，通过下面的辅助方法删除时同步更新集合，
+        不必在每次操作前后再请求 OBS 检查是否存在。
+        """
+        if self._live_scenes is None:
+            self._live_scenes = set(self.obs.scenes.get_names())
+        return self._live_scenes
+
+    def _ensure_absent(self, *scene_names):
+        """删除上次残留的同名测试场景"""
+        live = self._live()
+        stale = [name for name in scene_names if name in live]
+        if stale:
+            self.obs.scenes.delete_batch(stale)
+            live.difference_update(stale)
+
+    def _scene_snapshot(self):
+        """
+        用一次 GetSceneList 请求取得场景列表、当前节目场景和预览场景
+
+        只用于准备测试数据；SDK 中对应的方法由各自的测试覆盖。
+        """
+        data = self.obs.client.call(requests.GetSceneList()).datain or {}
+        return {
+            "scene_names": [scene.get('sceneName', '') for scene in data.get('scenes', [])],
+            "current_program": data.get('currentProgramSceneName') or '',
+            # 未启用 Studio Mode 时预览场景为 null
+            "current_preview": data.get('currentPreviewSceneName') or '',
+        }
 
     def test_connection_status(self):
         """测试连接状态"""
         self.assertTrue(self.obs.is_connected(), "应该已连接到 OBS")
 
         # 测试版本信息
-        version_info = self.obs.get_version()
+        version_info = self.obs.get_version_cached()
         self.assertIsInstance(version_info, dict, "版本信息应该是字典")
         self.assertIn('obsVersion', version_info, "版本信息应包含 OBS 版本")
 
-        logger.info(f"OBS 版本信息: {version_info}")
+        logger.info("OBS 版本信息: %s", version_info)
 
     def test_get_all_scenes(self):
         """测试获取所有场景"""
@@ -102,18 +146,17 @@ class TestSceneManager(unittest.TestCase):
             self.assertIsInstance(scene, dict, "场景应该是字典")
             self.assertIn('sceneName', scene, "场景应包含名称字段")
 
-        logger.info(f"获取到 {len(scenes)} 个场景")
+        logger.info("获取到 %s 个场景", len(scenes))
 
     def test_get_scene_names(self):
         """测试获取场景名称列表"""
         scene_names = self.obs.scenes.get_names()
         self.assertIsInstance(scene_names, list, "场景名称列表应该是列表")
 
-        for name in scene_names:
-            self.assertIsInstance(name, str, "场景名称应该是字符串")
-            self.assertTrue(len(name) > 0, "场景名称不应为空")
+        invalid = [name for name in scene_names if not isinstance(name, str) or not name]
+        self.assertFalse(invalid, "场景名称应该是非空字符串")
 
-        logger.info(f"场景名称: {scene_names}")
+        logger.info("场景名称: %s", scene_names)
 
     def test_get_current_program_scene(self):
         """测试获取当前节目场景"""
@@ -125,7 +168,7 @@ class TestSceneManager(unittest.TestCase):
             scene_names = self.obs.scenes.get_names()
             self.assertIn(current_scene, scene_names, "当前场景应在场景列表中")
 
-        logger.info(f"当前节目场景: {current_scene}")
+        logger.info("当前节目场景: %s", current_scene)
 
     def test_scene_exists(self):
         """测试场景存在性检查"""
@@ -145,8 +188,7 @@ class TestSceneManager(unittest.TestCase):
         test_scene_name = "TestScene_CreateDelete"
 
         # 确保测试场景不存在
-        if self.obs.scenes.exists(test_scene_name):
-            self.obs.scenes.delete(test_scene_name)
+        self._ensure_absent(test_scene_name)
 
         # 测试创建场景
         result = self.obs.scenes.create(test_scene_name)
@@ -157,7 +199,7 @@ class TestSceneManager(unittest.TestCase):
         scene_names = self.obs.scenes.get_names()
         self.assertIn(test_scene_name, scene_names, "创建的场景应在场景列表中")
 
-        logger.info(f"成功创建场景: {test_scene_name}")
+        logger.info("成功创建场景: %s", test_scene_name)
 
         # 测试重复创建（应该失败）
         result = self.obs.scenes.create(test_scene_name)
@@ -167,12 +209,11 @@ class TestSceneManager(unittest.TestCase):
         result = self.obs.scenes.delete(test_scene_name)
         self.assertTrue(result, "删除场景应该成功")
 
-        # 等待删除操作完成
-        time.sleep(0.5)
+        # 轮询等待删除生效
+        self.assertTrue(wait_until(lambda: not self.obs.scenes.exists(test_scene_name), timeout=2.0),
+                        "删除的场景不应该存在")
 
-        self.assertFalse(self.obs.scenes.exists(test_scene_name), "删除的场景不应该存在")
-
-        logger.info(f"成功删除场景: {test_scene_name}")
+        logger.info("成功删除场景: %s", test_scene_name)
 
     def test_delete_nonexistent_scene(self):
         """测试删除不存在的场景"""
@@ -187,7 +228,10 @@ class TestSceneManager(unittest.TestCase):
 
     def test_switch_scene(self):
         """测试场景切换"""
-        scene_names = self.obs.scenes.get_names()
+        # 场景列表和当前场景一次获取
+        snapshot = self._scene_snapshot()
+        scene_names = snapshot["scene_names"]
+        current_scene = snapshot["current_program"]
 
         if len(scene_names) < 2:
             # 创建测试场景
@@ -195,9 +239,6 @@ class TestSceneManager(unittest.TestCase):
             self.obs.scenes.create(test_scene)
             scene_names = self.obs.scenes.get_names()
 
-        # 获取当前场景
-        current_scene = self.obs.scenes.get_current_program()
-
         # 选择一个不同的场景进行切换
         target_scene = None
         for scene in scene_names:
@@ -210,14 +251,12 @@ class TestSceneManager(unittest.TestCase):
             result = self.obs.scenes.switch_to(target_scene)
             self.assertTrue(result, f"切换到场景 {target_scene} 应该成功")
 
-            # 等待一小段时间让切换生效
-            time.sleep(0.5)
-
-            # 验证切换结果
-            new_current_scene = self.obs.scenes.get_current_program()
-            self.assertEqual(new_current_scene, target_scene, f"当前场景应该是 {target_scene}")
+            # 轮询验证切换结果
+            self.assertTrue(
+                wait_until(lambda: self.obs.scenes.get_current_program() == target_scene, timeout=2.0),
+                f"当前场景应该是 {target_scene}")
 
-            logger.info(f"成功切换场景: {current_scene} -> {target_scene}")
+            logger.info("成功切换场景: %s -> %s", current_scene, target_scene)
 
             # 切换回原场景
             if current_scene:
@@ -242,9 +281,7 @@ class TestSceneManager(unittest.TestCase):
         new_name = "TestScene_Rename_New"
 
         # 清理可能存在的测试场景
-        for name in [original_name, new_name]:
-            if self.obs.scenes.exists(name):
-                self.obs.scenes.delete(name)
+        self._ensure_absent(original_name, new_name)
 
         # 创建测试场景
         self.assertTrue(self.obs.scenes.create(original_name), "创建测试场景应该成功")
@@ -254,10 +291,11 @@ class TestSceneManager(unittest.TestCase):
         self.assertTrue(result, "重命名场景应该成功")
 
         # 验证重命名结果
-        self.assertFalse(self.obs.scenes.exists(original_name), "原场景名不应该存在")
-        self.assertTrue(self.obs.scenes.exists(new_name), "新场景名应该存在")
+        scene_names = set(self.obs.scenes.get_names())
+        self.assertNotIn(original_name, scene_names, "原场景名不应该存在")
+        self.assertIn(new_name, scene_names, "新场景名应该存在")
 
-        logger.info(f"成功重命名场景: {original_name} -> {new_name}")
+        logger.info("成功重命名场景: %s -> %s", original_name, new_name)
 
         # 清理测试场景
         self.obs.scenes.delete(new_name)
@@ -284,24 +322,23 @@ class TestSceneManager(unittest.TestCase):
             result = self.obs.scenes.enable_studio_mode(True)
             self.assertTrue(result, "启用 Studio Mode 应该成功")
 
-            # 等待状态更新
-            time.sleep(0.5)
-
-            # 验证 Studio Mode 已启用
-            self.assertTrue(self.obs.scenes.is_studio_mode_enabled(), "Studio Mode 应该已启用")
+            # 轮询验证 Studio Mode 已启用
+            self.assertTrue(wait_until(self.obs.scenes.is_studio_mode_enabled, timeout=2.0),
+                            "Studio Mode 应该已启用")
 
             logger.info("成功启用 Studio Mode")
 
-            # 测试获取预览场景
-            preview_scene = self.obs.scenes.get_current_preview()
-            self.assertIsInstance(preview_scene, str, "预览场景应该是字符串")
+            # 预览场景、节目场景和场景列表从同一个 GetSceneList 响应中取得
+            snapshot = self._scene_snapshot()
+            preview_scene = snapshot["current_preview"]
+            scene_names = snapshot["scene_names"]
+            current_program = snapshot["current_program"]
 
+            self.assertIsInstance(preview_scene, str, "预览场景应该是字符串")
             if preview_scene:
-                logger.info(f"当前预览场景: {preview_scene}")
+                logger.info("当前预览场景: %s", preview_scene)
 
             # 测试设置预览场景
-            scene_names = self.obs.scenes.get_names()
-            current_program = self.obs.scenes.get_current_program()
 
             # 找一个不同的场景作为预览
             target_preview = None
@@ -314,37 +351,31 @@ class TestSceneManager(unittest.TestCase):
                 result = self.obs.scenes.set_preview(target_preview)
                 self.assertTrue(result, f"设置预览场景 {target_preview} 应该成功")
 
-                # 等待状态更新
-                time.sleep(0.5)
-
-                # 验证预览场景设置
-                new_preview = self.obs.scenes.get_current_preview()
-                self.assertEqual(new_preview, target_preview, f"预览场景应该是 {target_preview}")
+                # 轮询验证预览场景设置
+                self.assertTrue(
+                    wait_until(lambda: self.obs.scenes.get_current_preview() == target_preview, timeout=2.0),
+                    f"预览场景应该是 {target_preview}")
 
-                logger.info(f"成功设置预览场景: {target_preview}")
+                logger.info("成功设置预览场景: %s", target_preview)
 
                 # 测试触发转场
                 result = self.obs.scenes.trigger_transition()
                 self.assertTrue(result, "触发转场应该成功")
 
-                # 等待转场完成
-                time.sleep(1.0)
+                # 轮询验证转场结果（预览场景应该变成节目场景），超时留出转场动画的时间
+                self.assertTrue(
+                    wait_until(lambda: self.obs.scenes.get_current_program() == target_preview, timeout=5.0),
+                    f"转场后节目场景应该是 {target_preview}")
 
-                # 验证转场结果（预览场景应该变成节目场景）
-                new_program = self.obs.scenes.get_current_program()
-                self.assertEqual(new_program, target_preview, f"转场后节目场景应该是 {target_preview}")
-
-                logger.info(f"成功触发转场: {target_preview} 现在是节目场景")
+                logger.info("成功触发转场: %s 现在是节目场景", target_preview)
 
             # 测试禁用 Studio Mode
             result = self.obs.scenes.disable_studio_mode()
             self.assertTrue(result, "禁用 Studio Mode 应该成功")
 
-            # 等待状态更新
-            time.sleep(0.5)
-
-            # 验证 Studio Mode 已禁用
-            self.assertFalse(self.obs.scenes.is_studio_mode_enabled(), "Studio Mode 应该已禁用")
+            # 轮询验证 Studio Mode 已禁用
+            self.assertTrue(wait_until(lambda: not self.obs.scenes.is_studio_mode_enabled(), timeout=2.0),
+                            "Studio Mode 应该已禁用")
 
             logger.info("成功禁用 Studio Mode")
 
@@ -352,14 +383,14 @@ class TestSceneManager(unittest.TestCase):
             # 恢复初始状态
             if initial_studio_mode != self.obs.scenes.is_studio_mode_enabled():
                 self.obs.scenes.enable_studio_mode(initial_studio_mode)
-                time.sleep(0.5)
+                wait_until(lambda: self.obs.scenes.is_studio_mode_enabled() == initial_studio_mode, timeout=2.0)
 
     def test_studio_mode_without_enable(self):
         """测试在未启用 Studio Mode 时的操作"""
         # 确保 Studio Mode 未启用
         if self.obs.scenes.is_studio_mode_enabled():
             self.obs.scenes.disable_studio_mode()
-            time.sleep(0.5)
+            wait_until(lambda: not self.obs.scenes.is_studio_mode_enabled(), timeout=2.0)
 
         # 测试在未启用 Studio Mode 时触发转场
         result = self.obs.scenes.trigger_transition()
@@ -375,7 +406,7 @@ class TestSceneManager(unittest.TestCase):
         initial_studio_mode = self.obs.scenes.is_studio_mode_enabled()
         if not initial_studio_mode:
             self.obs.scenes.enable_studio_mode(True)
-            time.sleep(0.5)
+            wait_until(self.obs.scenes.is_studio_mode_enabled, timeout=2.0)
 
         try:
             non_existent_scene = "NonExistentScene_Preview"
@@ -391,17 +422,16 @@ class TestSceneManager(unittest.TestCase):
             # 恢复初始状态
             if not initial_studio_mode:
                 self.obs.scenes.disable_studio_mode()
-                time.sleep(0.5)
+                wait_until(lambda: not self.obs.scenes.is_studio_mode_enabled(), timeout=2.0)
 
     def test_get_group_list(self):
         """测试获取组列表"""
         groups = self.obs.scenes.get_group_list()
         self.assertIsInstance(groups, list, "组列表应该是列表")
 
-        for group in groups:
-            self.assertIsInstance(group, str, "组名应该是字符串")
+        self.assertTrue(all(isinstance(group, str) for group in groups), "组名应该是字符串")
 
-        logger.info(f"获取到 {len(groups)} 个组: {groups}")
+        logger.info("获取到 %s 个组: %s", len(groups), groups)
 
     def test_get_scene_info(self):
         """测试获取场景信息摘要"""
@@ -409,9 +439,8 @@ class TestSceneManager(unittest.TestCase):
         self.assertIsInstance(info, dict, "场景信息应该是字典")
 
         # 检查必要的字段
-        required_fields = ["current_program", "current_preview", "studio_mode", "total_scenes", "scene_names"]
-        for field in required_fields:
-            self.assertIn(field, info, f"场景信息应包含 {field} 字段")
+        required_fields = {"current_program", "current_preview", "studio_mode", "total_scenes", "scene_names"}
+        self.assertGreaterEqual(info.keys(), required_fields, "场景信息缺少必要字段")
 
         # 验证数据类型
         self.assertIsInstance(info["current_program"], str, "当前节目场景应该是字符串")
@@ -426,22 +455,19 @@ class TestSceneManager(unittest.TestCase):
         if info["current_program"]:
             self.assertIn(info["current_program"], info["scene_names"], "当前节目场景应在场景列表中")
 
-        logger.info(f"场景信息摘要: {info}")
+        logger.info("场景信息摘要: %s", info)
 
     def test_scene_transition_override(self):
         """测试场景转场覆盖设置"""
-        test_scene_name = "TestScene_TransitionOverride"
-
-        # 创建测试场景
-        if not self.obs.scenes.exists(test_scene_name):
-            self.assertTrue(self.obs.scenes.create(test_scene_name), "创建测试场景应该成功")
+        # 使用测试类共用的场景
+        test_scene_name = self.fixture_scene
 
         try:
             # 测试获取转场覆盖设置（初始应该为空）
             override_info = self.obs.scenes.get_scene_transition_override(test_scene_name)
             self.assertIsInstance(override_info, dict, "转场覆盖信息应该是字典")
 
-            logger.info(f"初始转场覆盖设置: {override_info}")
+            logger.info("初始转场覆盖设置: %s", override_info)
 
             # 测试设置转场覆盖
             test_duration = 1000  # 1秒
@@ -458,7 +484,7 @@ class TestSceneManager(unittest.TestCase):
                 self.assertEqual(override_info['transition_duration'], test_duration,
                                f"转场持续时间应该是 {test_duration}")
 
-            logger.info(f"设置转场覆盖后: {override_info}")
+            logger.info("设置转场覆盖后: %s", override_info)
 
             # 测试移除转场覆盖
             result = self.obs.scenes.set_scene_transition_override(
@@ -471,33 +497,27 @@ class TestSceneManager(unittest.TestCase):
             logger.info("成功测试转场覆盖设置")
 
         finally:
-            # 清理测试场景
-            if self.obs.scenes.exists(test_scene_name):
-                self.obs.scenes.delete(test_scene_name)
+            # 共用场景不删除，只确保转场覆盖已移除
+            self.obs.scenes.set_scene_transition_override(
+                test_scene_name,
+                transition_name=None,
+                transition_duration=None
+            )
 
     def test_scene_transition_override_invalid_duration(self):
         """测试无效的转场持续时间"""
-        test_scene_name = "TestScene_InvalidDuration"
-
-        # 创建测试场景
-        if not self.obs.scenes.exists(test_scene_name):
-            self.assertTrue(self.obs.scenes.create(test_scene_name), "创建测试场景应该成功")
+        # 使用测试类共用的场景
+        test_scene_name = self.fixture_scene
 
-        try:
-            # 测试过小的持续时间
-            with self.assertRaises(ValueError):
-                self.obs.scenes.set_scene_transition_override(test_scene_name, transition_duration=10)
-
-            # 测试过大的持续时间
-            with self.assertRaises(ValueError):
-                self.obs.scenes.set_scene_transition_override(test_scene_name, transition_duration=25000)
+        # 测试过小的持续时间
+        with self.assertRaises(ValueError):
+            self.obs.scenes.set_scene_transition_override(test_scene_name, transition_duration=10)
 
-            logger.info("成功测试无效转场持续时间的验证")
+        # 测试过大的持续时间
+        with self.assertRaises(ValueError):
+            self.obs.scenes.set_scene_transition_override(test_scene_name, transition_duration=25000)
 
-        finally:
-            # 清理测试场景
-            if self.obs.scenes.exists(test_scene_name):
-                self.obs.scenes.delete(test_scene_name)
+        logger.info("成功测试无效转场持续时间的验证")
 
     def test_scene_transition_override_nonexistent_scene(self):
         """测试对不存在场景的转场覆盖操作"""
@@ -519,16 +539,15 @@ class TestSceneManager(unittest.TestCase):
         test_scenes = ["TestScene_Multi_1", "TestScene_Multi_2", "TestScene_Multi_3"]
 
         try:
-            # 批量创建场景
-            for scene_name in test_scenes:
-                if self.obs.scenes.exists(scene_name):
-                    self.obs.scenes.delete(scene_name)
+            # 清理上次残留的场景后批量创建
+            self._ensure_absent(*test_scenes)
 
-                result = self.obs.scenes.create(scene_name)
-                self.assertTrue(result, f"创建场景 {scene_name} 应该成功")
-                self.assertTrue(self.obs.scenes.exists(scene_name), f"场景 {scene_name} 应该存在")
+            results = self.obs.scenes.create_batch(test_scenes)
+            scene_names = set(self.obs.scenes.get_names())
+            self.assertTrue(all(results), f"创建场景应该全部成功: {dict(zip(test_scenes, results))}")
+            self.assertLessEqual(set(test_scenes), scene_names, "创建的场景应该全部存在")
 
-            logger.info(f"成功创建 {len(test_scenes)} 个测试场景")
+            logger.info("成功创建 %s 个测试场景", len(test_scenes))
 
             # 测试在多个场景间切换
             original_scene = self.obs.scenes.get_current_program()
@@ -537,10 +556,10 @@ class TestSceneManager(unittest.TestCase):
                 result = self.obs.scenes.switch_to(scene_name)
                 self.assertTrue(result, f"切换到场景 {scene_name} 应该成功")
 
-                time.sleep(0.3)  # 短暂等待
-
-                current_scene = self.obs.scenes.get_current_program()
-                self.assertEqual(current_scene, scene_name, f"当前场景应该是 {scene_name}")
+                # 轮询验证切换结果
+                self.assertTrue(
+                    wait_until(lambda: self.obs.scenes.get_current_program() == scene_name, timeout=2.0),
+                    f"当前场景应该是 {scene_name}")
 
             logger.info("成功测试多场景切换")
 
@@ -549,10 +568,8 @@ class TestSceneManager(unittest.TestCase):
                 self.obs.scenes.switch_to(original_scene)
 
         finally:
-            # 清理测试场景
-            for scene_name in test_scenes:
-                if self.obs.scenes.exists(scene_name):
-                    self.obs.scenes.delete(scene_name)
+            # 清理测试场景（不存在的场景只会返回失败，不必逐个检查）
+            self.obs.scenes.delete_batch(test_scenes)
 
     def test_scene_name_edge_cases(self):
         """测试场景名称的边界情况"""
@@ -566,61 +583,50 @@ class TestSceneManager(unittest.TestCase):
         created_scenes = []
 
         try:
-            for scene_name in edge_case_names:
-                # 清理可能存在的场景
-                if self.obs.scenes.exists(scene_name):
-                    self.obs.scenes.delete(scene_name)
-
-                # 尝试创建场景
-                result = self.obs.scenes.create(scene_name)
-                if result:
-                    created_scenes.append(scene_name)
-                    self.assertTrue(self.obs.scenes.exists(scene_name), f"场景 {scene_name} 应该存在")
-                    logger.info(f"成功创建边界情况场景: {scene_name}")
-                else:
-                    logger.warning(f"创建场景失败: {scene_name}")
+            # 清理可能存在的场景
+            self._ensure_absent(*edge_case_names)
+
+            # 批量尝试创建场景
+            results = self.obs.scenes.create_batch(edge_case_names)
+            created_scenes = [scene_name for scene_name, result in zip(edge_case_names, results) if result]
+
+            scene_names = set(self.obs.scenes.get_names())
+            self.assertLessEqual(set(created_scenes), scene_names, "创建成功的场景应该存在")
+            logger.info("成功创建边界情况场景: %s", created_scenes)
+
+            failed_scenes = [scene_name for scene_name in edge_case_names if scene_name not in created_scenes]
+            if failed_scenes:
+                logger.warning("创建场景失败: %s", failed_scenes)
 
         finally:
             # 清理创建的场景
-            for scene_name in created_scenes:
-                if self.obs.scenes.exists(scene_name):
-                    self.obs.scenes.delete(scene_name)
+            if created_scenes:
+                self.obs.scenes.delete_batch(created_scenes)
 
     def test_concurrent_operations(self):
         """测试并发操作的稳定性"""
-        test_scene_name = "TestScene_Concurrent"
-
-        # 创建测试场景
-        if not self.obs.scenes.exists(test_scene_name):
-            self.assertTrue(self.obs.scenes.create(test_scene_name), "创建测试场景应该成功")
-
-        try:
-            # 快速连续执行多个操作
-            operations_count = 5
+        # 使用测试类共用的场景
+        test_scene_name = self.fixture_scene
 
-            for i in range(operations_count):
-                # 获取场景信息
-                info = self.obs.scenes.get_info()
-                self.assertIsInstance(info, dict, f"第 {i+1} 次获取场景信息应该成功")
+        # 多个线程在同一连接上同时发出请求：OBSClient 在锁内分配请求 ID 并发送，
+        # 各线程按请求 ID 收到自己的响应（ID 分配见 tests/test_client.py 中的单元测试）
+        operations_count = 5
 
-                # 检查场景存在性
-                exists = self.obs.scenes.exists(test_scene_name)
-                self.assertTrue(exists, f"第 {i+1} 次检查场景存在性应该成功")
+        with ThreadPoolExecutor(max_workers=operations_count) as executor:
+            info_futures = [executor.submit(self.obs.scenes.get_info) for _ in range(operations_count)]
+            exists_futures = [executor.submit(self.obs.scenes.exists, test_scene_name)
+                              for _ in range(operations_count)]
 
-                # 获取场景列表
-                scenes = self.obs.scenes.get_names()
-                self.assertIsInstance(scenes, list, f"第 {i+1} 次获取场景列表应该成功")
-                self.assertIn(test_scene_name, scenes, f"测试场景应该在第 {i+1} 次获取的列表中")
+            infos = [future.result() for future in info_futures]
+            exists_results = [future.result() for future in exists_futures]
 
-                # 短暂等待
-                time.sleep(0.1)
+        # 收集全部结果后一次断言，失败时列出出错的序号
+        missing = [i + 1 for i, info in enumerate(infos)
+                   if not isinstance(info, dict) or test_scene_name not in info.get("scene_names", [])]
+        self.assertFalse(missing, f"这些次获取的场景列表中缺少测试场景: {missing}")
+        self.assertTrue(all(exists_results), f"检查场景存在性应该全部成功: {exists_results}")
 
-            logger.info(f"成功完成 {operations_count} 次并发操作测试")
-
-        finally:
-            # 清理测试场景
-            if self.obs.scenes.exists(test_scene_name):
-                self.obs.scenes.delete(test_scene_name)
+        logger.info("成功完成 %s 次并发操作测试", operations_count)
 
 
 if __name__ == '__main__':